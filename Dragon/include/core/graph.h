@@ -32,6 +32,21 @@ class GraphBase {
     /*! \brief Run the graph once synchronously */
     virtual bool Run(const string&, const string&, int = 0) = 0;
 
+    /*! \brief Run the compiled plan once synchronously */
+    virtual bool RunPlan(int handle, int stream_id = 0) = 0;
+
+    /*! \brief Compile a plan of operators matched by the rules */
+    int CompilePlan(const string& include, const string& exclude);
+
+    /*! \brief Compile a plan of the specified operators */
+    int CompilePlan(const vec32_t& indices);
+
+    /*! \brief Return the operator indices of the compiled plan */
+    const vec32_t& plan(int handle) const;
+
+    /*! \brief Return the number of compiled plans */
+    int num_plans() const { return (int)plans_.size(); }
+
     /*! \brief Return the graph name */
     string name() const { return name_; }
 
@@ -65,6 +80,10 @@ class GraphBase {
 
     /*! \brief Store the def */
     GraphDef def_, opt_def_;
+
+    /*! \brief Store the compiled plans and their handles */
+    vector<vec32_t> plans_;
+    Map<string, int> plan_handles_;
 };
 
 class Graph : public GraphBase {
@@ -81,6 +100,9 @@ class Graph : public GraphBase {
     /*! \brief Run the graph once synchronously */
     bool Run(const string&, const string&, int = 0) override;
 
+    /*! \brief Run the compiled plan once synchronously */
+    bool RunPlan(int handle, int stream_id = 0) override;
+
  protected:
     /*! \brief Store the internal operators */
     vector<OperatorBase*> ops_;
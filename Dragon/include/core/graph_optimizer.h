@@ -46,6 +46,11 @@ class GraphOptimizer {
     /*! \brief Allocate the buffer for outputs (-O3) */
     GraphDef SimulateGC(const GraphDef& input_def);
 
+    /*! \brief Plan the buffers by the liveness of intermediates (-O3) */
+    GraphDef PlanMemory(
+        const GraphDef&                 input_def,
+        const Map<string, vec32_t>&     op_indices);
+
  protected:
     /*! \brief Traverse from input gradients to dying the nodes */
     void ForwardPruneTraversal(
@@ -0,0 +1,80 @@
+/*!
+ * Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+ *
+ * Licensed under the BSD 2-Clause License.
+ * You should have received a copy of the BSD 2-Clause License
+ * along with the software. If not, See,
+ *
+ *      <https://opensource.org/licenses/BSD-2-Clause>
+ *
+ * ------------------------------------------------------------
+ */
+
+#ifndef DRAGON_CORE_GRAPH_PARALLEL_H_
+#define DRAGON_CORE_GRAPH_PARALLEL_H_
+
+#include <condition_variable>
+#include <thread>
+
+#include "core/graph.h"
+
+namespace dragon {
+
+/*!
+ * Run the independent operators concurrently on a thread pool.
+ *
+ * The dependencies are built once from the optimized def,
+ * where an operator waits for the previous writers of its inputs,
+ * and the previous readers and writers of its outputs.
+ *
+ * Thus, the in-place or shared buffers are ordered as the sequence.
+ */
+class ParallelGraph final : public Graph {
+ public:
+    /*! \brief Default constructor */
+    ParallelGraph(const GraphDef& def, Workspace* ws);
+
+    /*! \brief Default deconstructor */
+    ~ParallelGraph();
+
+    /*! \brief Run the graph once synchronously */
+    bool Run(const string&, const string&, int = 0) override;
+
+    /*! \brief Run the compiled plan once synchronously */
+    bool RunPlan(int handle, int stream_id = 0) override;
+
+ protected:
+    /*! \brief Build the dependencies of operators */
+    void BuildDependency();
+
+    /*! \brief Run the ready operators until finished */
+    void RunLoop(bool is_worker);
+
+    /*! \brief The number of threads including the caller */
+    int num_threads_;
+
+    /*! \brief Whether to fallback to the sequential running */
+    bool sequential_;
+
+    /*! \brief Store the children and the number of parents */
+    vector<vec32_t> children_;
+    vec32_t num_parents_, pending_;
+
+    /*! \brief Store the selected operators of plans */
+    vector<vector<bool>> masks_;
+
+    /*! \brief Store the running states */
+    std::deque<int> ready_;
+    int num_remaining_, stream_id_;
+    const vector<bool>* mask_;
+    bool stop_;
+
+    /*! \brief Store the thread pool */
+    vector<std::thread> workers_;
+    std::mutex mutex_;
+    std::condition_variable cond_;
+};
+
+}  // namespace dragon
+
+#endif  // DRAGON_CORE_GRAPH_PARALLEL_H_
@@ -379,8 +379,9 @@ DEFINE_TENSOR_TYPES_DISPATCHER(TensorTypes, RunImpl);
 #define DECLARE_MULTIPLIER(name, size) \
     const T* name; \
     { \
-        auto* mp = ws()->CreateTensor("/share/multiplier/" \
-            + TypeMetaToString(TypeMeta::Make<T>())); \
+        auto* mp = ws()->CreateTensor(Workspace::slot_name( \
+            "/share/multiplier/" + TypeMetaToString( \
+                TypeMeta::Make<T>()))); \
         if (size > mp->count()) { \
             mp->Reshape({ size }); \
             math::Set<T, Context>(size, cast::to<T>(1.f), \
@@ -413,7 +414,9 @@ DEFINE_TENSOR_TYPES_DISPATCHER(TensorTypes, RunImpl);
     template <class Context> \
     type classname<Context>::arg() { \
         if (arg##_desc_.empty()) return arg##_; \
-        auto* arg##T = ws()->GetTensor(arg##_desc_); \
+        auto* arg##T = ws()->GetTensor( \
+            str::replace_first(arg##_desc_, \
+                "${HANDLE}", handle())); \
         CHECK(arg##T->template IsType<type>()) \
             << "\nThe type of " << #arg << " should be " << #type << "."; \
         CHECK_EQ(arg##T->count(), 1) \
@@ -0,0 +1,106 @@
+/*!
+ * Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+ *
+ * Licensed under the BSD 2-Clause License.
+ * You should have received a copy of the BSD 2-Clause License
+ * along with the software. If not, See,
+ *
+ *      <https://opensource.org/licenses/BSD-2-Clause>
+ *
+ * ------------------------------------------------------------
+ */
+
+#ifndef DRAGON_CORE_PROFILER_H_
+#define DRAGON_CORE_PROFILER_H_
+
+#include <atomic>
+#include <chrono>
+
+#include "core/operator.h"
+
+namespace dragon {
+
+/*!
+ * Record the running events of operators.
+ *
+ * The events are collected from both the graphs and the eager execution,
+ * the device will be synchronized after each operator for the wall time.
+ */
+class Profiler {
+ public:
+    typedef std::chrono::steady_clock Clock;
+
+    struct Event {
+        /*! \brief The name, type and category of operator */
+        string name, type, category;
+
+        /*! \brief The name scope of outputs */
+        string scope;
+
+        /*! \brief The shapes of inputs and outputs */
+        vector<vec64_t> input_shapes, output_shapes;
+
+        /*! \brief The start and duration in microseconds */
+        int64_t start, duration;
+
+        /*! \brief The bytes allocated by the operator */
+        int64_t bytes;
+
+        /*! \brief The index of running thread */
+        int thread_id;
+    };
+
+    /*! \brief Default constructor */
+    Profiler() : enabled_(false), origin_(Clock::now()) {}
+
+    /*! \brief Return the global profiler */
+    static Profiler* Get() { static Profiler profiler; return &profiler; }
+
+    /*! \brief Whether the profiling is enabled */
+    bool enabled() const { return enabled_; }
+
+    /*! \brief Enable or disable the profiling */
+    void set_enabled(bool enabled) { enabled_ = enabled; }
+
+    /*! \brief Run the operator and record the event */
+    void Run(
+        OperatorBase*               op,
+        int                         stream_id,
+        const string&               category);
+
+    /*! \brief Return a copy of the recorded events */
+    vector<Event> events() const;
+
+    /*! \brief Remove all the recorded events */
+    void Reset();
+
+ private:
+    /*! \brief Whether to record the events */
+    std::atomic<bool> enabled_;
+
+    /*! \brief The origin of timestamps */
+    Clock::time_point origin_;
+
+    /*! \brief Store the recorded events */
+    vector<Event> events_;
+
+    /*! \brief Guard the events recorded concurrently */
+    mutable std::mutex mutex_;
+};
+
+/*! \brief Run the operator with the profiling if enabled */
+inline void RunOperatorWithProfiling(
+    OperatorBase*                   op,
+    int                             stream_id,
+    const string&                   category) {
+    auto* profiler = Profiler::Get();
+    if (profiler->enabled()) {
+        profiler->Run(op, stream_id, category);
+    } else {
+        op->Run(stream_id);
+    }
+}
+
+}  // namespace dragon
+
+#endif  // DRAGON_CORE_PROFILER_H_
@@ -76,13 +76,28 @@ class Workspace {
     /*! \brief Return the specified filler */
     const TensorFillerProto* GetFiller(const string&) const;
 
+    /*! \brief Return the slot of temporal data for current thread */
+    static int& data_slot() {
+        static TLS_OBJECT int slot;
+        return slot;
+    }
+
+    /*! \brief Return the name of shared tensor for current thread */
+    static string slot_name(const string& name) {
+        int slot = data_slot();
+        return slot > 0 ? name + ":" + str::to(slot) : name;
+    }
+
+    /*! \brief Return the name of temporal data for current thread */
+    static string data_name() { return slot_name("/share/data"); }
+
     /*! \brief Create temporal data segments */
     template <class Context>
     vector<void*> data(const vector<size_t>& segments) {
         int64_t nbytes = 0;
         vector<void*> ret(segments.size());
         for (auto& segment : segments) nbytes += (int64_t)segment;
-        auto* T = CreateTensor("/share/data")->Reshape({ nbytes });
+        auto* T = CreateTensor(data_name())->Reshape({ nbytes });
         ret[0] = T->template mutable_data<uint8_t, Context>();
         for (int i = 1; i < segments.size(); i++)
             ret[i] = (uint8_t*)ret[i - 1] + segments[i - 1];
@@ -108,6 +123,9 @@ class Workspace {
     /*! \brief Run the specified persistent operator */
     void RunOperator(const OperatorDef&);
 
+    /*! \brief Delete the specified persistent operator and derived ones */
+    void DeleteOperator(const string& uid);
+
     /*! \brief Try to run the operator in a adaptive mode */
     void RunOperatorOnce(const OperatorDef&);
 
@@ -121,6 +139,15 @@ class Workspace {
         const string&               exclude,
         int                         stream_id = 0);
 
+    /*! \brief Run the specifed graph by name and compiled plan */
+    void RunGraph(
+        const string&               graph_name,
+        int                         plan_handle,
+        int                         stream_id = 0);
+
+    /*! \brief Return the specified graph */
+    GraphBase* GetGraph(const string& graph_name) const;
+
     /* \brief Set an alias for the tensor */
     bool SetTensorAlias(const string& name, const string& alias);
 
@@ -155,6 +182,9 @@ class Workspace {
 
     /*! \brief Store the remote workspaces */
     vector<Workspace*> remote_workspaces_;
+
+    /*! \brief Guard the tensors created concurrently */
+    mutable std::mutex mutex_;
 };
 
 }  // namespace dragon
@@ -21,34 +21,45 @@ template <class Context>
 class ClipOp final : public Operator<Context> {
  public:
     ClipOp(const OperatorDef& def, Workspace* ws)
-        : Operator<Context>(def, ws),
-          low_(OpArg<float>("low", -FLT_MAX)),
-          high_(OpArg<float>("high", FLT_MAX)) {}
+        : Operator<Context>(def, ws) {
+        GET_ARG_WITH_DESC(float, low, -FLT_MAX);
+        GET_ARG_WITH_DESC(float, high, FLT_MAX);
+    }
     USE_OPERATOR_FUNCTIONS;
 
     void RunOnDevice() override;
     template <typename T> void RunImpl();
     
  protected:
-    float low_, high_, lowT_, highT_;
+    float lowT_, highT_;
+    DECLARE_ARG_WITH_DESC(float, low);
+    DECLARE_ARG_WITH_DESC(float, high);
 };
 
 template <class Context>
 class ClipGradientOp final : public Operator<Context> {
  public:
     ClipGradientOp(const OperatorDef& def, Workspace* ws)
-        : Operator<Context>(def, ws),
-          low_(OpArg<float>("low", -FLT_MAX)),
-          high_(OpArg<float>("high", FLT_MAX)) {}
+        : Operator<Context>(def, ws) {
+        GET_ARG_WITH_DESC(float, low, -FLT_MAX);
+        GET_ARG_WITH_DESC(float, high, FLT_MAX);
+    }
     USE_OPERATOR_FUNCTIONS;
 
     void RunOnDevice() override;
     template <typename T> void RunImpl();
 
  protected:
-    float low_, high_, lowT_, highT_;
+    float lowT_, highT_;
+    DECLARE_ARG_WITH_DESC(float, low);
+    DECLARE_ARG_WITH_DESC(float, high);
 };
 
+DEFINE_ARG_WITH_DESC(float, ClipOp, low);
+DEFINE_ARG_WITH_DESC(float, ClipOp, high);
+DEFINE_ARG_WITH_DESC(float, ClipGradientOp, low);
+DEFINE_ARG_WITH_DESC(float, ClipGradientOp, high);
+
 }  // namespace dragon
 
 #endif  // DRAGON_OPERATORS_ARITHMETIC_CLIP_OP_H_
\ No newline at end of file
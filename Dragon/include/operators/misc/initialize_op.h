@@ -42,8 +42,8 @@ class FillOp final : public Operator<Context> {
  public:
     FillOp(const OperatorDef& def, Workspace* ws)
         : Operator<Context>(def, ws),
-          shape_desc_(OpArg<string>("shape", "")),
-          value_(OpArg<float>("value", 0.f)) {
+          shape_desc_(OpArg<string>("shape", "")) {
+        GET_ARG_WITH_DESC(float, value, 0.f);
         GET_ARGS_WITH_DESC(int64_t, dims);
     }
     USE_OPERATOR_FUNCTIONS;
@@ -52,8 +52,8 @@ class FillOp final : public Operator<Context> {
     template <typename T> void RunImpl();
 
  protected:
-    float value_;
     string shape_desc_;
+    DECLARE_ARG_WITH_DESC(float, value);
     DECLARE_ARGS_WITH_DESC(int64_t, dims);
 };
 
@@ -109,13 +109,21 @@ class RandomUniformOp final : public InitializeOp<Context> {
  public:
     RandomUniformOp(const OperatorDef& def, Workspace* ws)
         : InitializeOp<Context>(def, ws) {
-        auto low = OpArg<float>("low", -1.f);
-        auto high = OpArg<float>("high", 1.f);
-        this->proto_.set_low(low);
-        this->proto_.set_high(high);
+        GET_ARG_WITH_DESC(float, low, -1.f);
+        GET_ARG_WITH_DESC(float, high, 1.f);
         this->proto_.set_type("uniform");
     }
     USE_OPERATOR_FUNCTIONS;
+
+    void RunOnDevice() override {
+        this->proto_.set_low(low());
+        this->proto_.set_high(high());
+        InitializeOp<Context>::RunOnDevice();
+    }
+
+ protected:
+    DECLARE_ARG_WITH_DESC(float, low);
+    DECLARE_ARG_WITH_DESC(float, high);
 };
 
 template <class Context>
@@ -123,13 +131,21 @@ class RandomNormalOp final : public InitializeOp<Context> {
  public:
     RandomNormalOp(const OperatorDef& def, Workspace* ws)
         : InitializeOp<Context>(def, ws) {
-        auto mu = OpArg<float>("mean", 0.f);
-        auto sigma = OpArg<float>("std", 1.f);
-        this->proto_.set_mean(mu);
-        this->proto_.set_std(sigma);
+        GET_ARG_WITH_DESC(float, mean, 0.f);
+        GET_ARG_WITH_DESC(float, std, 1.f);
         this->proto_.set_type("normal");
     }
     USE_OPERATOR_FUNCTIONS;
+
+    void RunOnDevice() override {
+        this->proto_.set_mean(mean());
+        this->proto_.set_std(std());
+        InitializeOp<Context>::RunOnDevice();
+    }
+
+ protected:
+    DECLARE_ARG_WITH_DESC(float, mean);
+    DECLARE_ARG_WITH_DESC(float, std);
 };
 
 template <class Context>
@@ -196,6 +212,11 @@ class GlorotNormalOp final : public InitializeOp<Context> {
 
 DEFINE_ARGS_WITH_DESC(int64_t, InitializeOp, dims);
 DEFINE_ARGS_WITH_DESC(int64_t, FillOp, dims);
+DEFINE_ARG_WITH_DESC(float, FillOp, value);
+DEFINE_ARG_WITH_DESC(float, RandomUniformOp, low);
+DEFINE_ARG_WITH_DESC(float, RandomUniformOp, high);
+DEFINE_ARG_WITH_DESC(float, RandomNormalOp, mean);
+DEFINE_ARG_WITH_DESC(float, RandomNormalOp, std);
 DEFINE_ARGS_WITH_DESC(int64_t, GivenTensorFillOp, dims);
 
 }  // namespace dragon
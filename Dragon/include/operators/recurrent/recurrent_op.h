@@ -10,37 +10,117 @@
  * ------------------------------------------------------------
  */
 
-#ifndef DRAGON_OPERATORS_RECURRENT_CUDNN_RECURRENT_OP_H_
-#define DRAGON_OPERATORS_RECURRENT_CUDNN_RECURRENT_OP_H_
+#ifndef DRAGON_OPERATORS_RECURRENT_RECURRENT_OP_H_
+#define DRAGON_OPERATORS_RECURRENT_RECURRENT_OP_H_
 
 #include "core/operator.h"
 
 namespace dragon {
 
+/*!
+ * The packed weights follow the layout of CuDNN:
+ *
+ *   [W(0, 0), R(0, 0), W(0, 1), R(0, 1), ..., Bw(0, 0), Br(0, 0), ...]
+ *
+ * where (i, j) is the (layer, direction),
+ * and each matrix stacks the gates along the rows.
+ */
 template <class Context>
-class RecurrentOp : public Operator<Context> {
+class RecurrentOpBase : public Operator<Context> {
  public:
-    RecurrentOp(const OperatorDef& def, Workspace* ws)
-        : Operator<Context>(def, ws) {
-        LOG(FATAL) << "CuDNN is required.";
+    RecurrentOpBase(const OperatorDef& def, Workspace* ws)
+        : Operator<Context>(def, ws),
+          num_layers_(OpArg<int64_t>("num_layers", 1)),
+          hidden_size_(OpArg<int64_t>("hidden_size", 0)),
+          bidirectional_(OpArg<int64_t>("bidirectional", 0)),
+          dropout_ratio_(OpArg<float>("dropout_ratio", 1.f)) {
+        // Determine the rnn mode
+        rnn_mode_ = OpArg<string>("rnn_mode", "");
+        if (rnn_mode_ == "rnn_tanh" ||
+            rnn_mode_ == "rnn_relu") num_gates_ = 1;
+        else if (rnn_mode_ == "lstm") num_gates_ = 4;
+        else if (rnn_mode_ == "gru") num_gates_ = 3;
+        else LOG(FATAL) << "Unknown RNN Mode: " << rnn_mode_;
+        auto input_mode_str = OpArg<string>("rnn_input_mode", "linear");
+        CHECK_EQ(input_mode_str, "linear")
+            << "\nUnsupported RNN InputMode: " << input_mode_str;
+        num_directions_ = bidirectional_ ? 2 : 1;
+        // Dropout is applied between the layers
+        use_dropout_ = dropout_ratio_ > 0.f &&
+            dropout_ratio_ < 1.f && num_layers_ > 1;
+        // Override the running phase
+        SwitchToPhase(OpArg<string>("phase", ""));
     }
     USE_OPERATOR_FUNCTIONS;
 
-    void RunOnDevice() override {}
+    void Reshape();
+
+    int64_t input_size(int64_t layer) const {
+        return layer == 0 ? input_size_ :
+            hidden_size_ * num_directions_;
+    }
+
+ public:
+    string rnn_mode_;
+    float dropout_ratio_;
+    bool use_dropout_;
+    int64_t num_layers_, hidden_size_, bidirectional_;
+    int64_t num_gates_, num_directions_;
+    int64_t seq_length_, batch_size_, input_size_;
+    int64_t weight_count_, reserve_size_;
+    vec64_t output_dims_, hidden_dims_;
+    vec64_t matrix_ofs_, bias_ofs_;
+    vec64_t gates_ofs_, hidden_ofs_, cell_ofs_, extra_ofs_;
+    vec64_t output_ofs_, dropout_ofs_;
 };
 
+#define USE_RECURRENT_FUNCTIONS \
+    USE_OPERATOR_FUNCTIONS; \
+    using RecurrentOpBase<Context>::input_size; \
+    using RecurrentOpBase<Context>::rnn_mode_; \
+    using RecurrentOpBase<Context>::dropout_ratio_; \
+    using RecurrentOpBase<Context>::use_dropout_; \
+    using RecurrentOpBase<Context>::num_layers_; \
+    using RecurrentOpBase<Context>::hidden_size_; \
+    using RecurrentOpBase<Context>::num_gates_; \
+    using RecurrentOpBase<Context>::num_directions_; \
+    using RecurrentOpBase<Context>::seq_length_; \
+    using RecurrentOpBase<Context>::batch_size_; \
+    using RecurrentOpBase<Context>::weight_count_; \
+    using RecurrentOpBase<Context>::reserve_size_; \
+    using RecurrentOpBase<Context>::output_dims_; \
+    using RecurrentOpBase<Context>::hidden_dims_; \
+    using RecurrentOpBase<Context>::matrix_ofs_; \
+    using RecurrentOpBase<Context>::bias_ofs_; \
+    using RecurrentOpBase<Context>::gates_ofs_; \
+    using RecurrentOpBase<Context>::hidden_ofs_; \
+    using RecurrentOpBase<Context>::cell_ofs_; \
+    using RecurrentOpBase<Context>::extra_ofs_; \
+    using RecurrentOpBase<Context>::output_ofs_; \
+    using RecurrentOpBase<Context>::dropout_ofs_
+
 template <class Context>
-class RecurrentGradientOp : public Operator<Context> {
-public:
+class RecurrentOp final : public RecurrentOpBase<Context> {
+ public:
+    RecurrentOp(const OperatorDef& def, Workspace* ws)
+        : RecurrentOpBase<Context>(def, ws) {}
+    USE_RECURRENT_FUNCTIONS;
+
+    void RunOnDevice() override;
+    template <typename T> void RunImpl();
+};
+
+template <class Context>
+class RecurrentGradientOp final : public RecurrentOpBase<Context> {
+ public:
     RecurrentGradientOp(const OperatorDef& def, Workspace* ws)
-        : Operator<Context>(def, ws) {
-        LOG(FATAL) << "CuDNN is required.";
-    }
-    USE_OPERATOR_FUNCTIONS;
+        : RecurrentOpBase<Context>(def, ws) {}
+    USE_RECURRENT_FUNCTIONS;
 
-    void RunOnDevice() override {}
+    void RunOnDevice() override;
+    template <typename T> void RunImpl();
 };
 
 }  // namespace dragon
 
-#endif  // DRAGON_OPERATORS_RECURRENT_RECURRENT_OP_H_
\ No newline at end of file
+#endif  // DRAGON_OPERATORS_RECURRENT_RECURRENT_OP_H_
@@ -27,7 +27,8 @@ class CollectiveUpdateOp final
         const OperatorDef&      def,
         Workspace*              ws)
         : MPIOpBase<Context>(def, ws),
-          mode_(OpArg<string>("mode", "")) {
+          mode_(OpArg<string>("mode", "")),
+          bucket_size_(OpArg<int64_t>("bucket_size", 0)) {
         if (str::find(mode_, "NCCL")) InitNCCL();
     }
     USE_OPERATOR_FUNCTIONS;
@@ -48,6 +49,9 @@ class CollectiveUpdateOp final
     void RunOnDevice() override;
     template <typename T> void MPIBCast(Tensor*);
     template <typename T> void MPIAllReduce(Tensor*);
+    template <typename T> void AllReduce(Tensor*);
+    template <typename T> void AllReduceBucket(const vec32_t&);
+    template <typename T> void RunAllReduce();
 
 #ifdef WITH_NCCL
     template <typename T>
@@ -59,6 +63,7 @@ class CollectiveUpdateOp final
 
  protected:
     string mode_;
+    int64_t bucket_size_;
 
 #ifdef WITH_NCCL
     ncclComm_t nccl_comm;
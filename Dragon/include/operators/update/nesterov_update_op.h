@@ -25,6 +25,7 @@ class NesterovUpdateOp final : public UpdateOpBase<Context> {
     USE_OPERATOR_FUNCTIONS;
     USE_UPDATER_FUNCTIONS;
 
+    void ComputeParams() override;
     void Compute(Tensor* dX) override;
 
  protected:
@@ -26,6 +26,7 @@ class SGDUpdateOp final : public UpdateOpBase<Context> {
     USE_OPERATOR_FUNCTIONS;
     USE_UPDATER_FUNCTIONS;
 
+    void ComputeParams() override;
     void Compute(Tensor* dX) override;
 
  protected:
@@ -24,12 +24,13 @@ class UpdateOpBase : public Operator<Context> {
         : Operator<Context>(def, ws),
           lr_mult_(OpArg<float>("lr_mult", 1.f)),
           decay_mult_(OpArg<float>("decay_mult", 1.f)),
-          slot_(OpArg<string>("slot", "")) {
+          slot_(OpArg<string>("slot", "")), index_(0) {
         CHECK(!slot_.empty()) << "\nRequired a non-empty slot";
     }
     USE_OPERATOR_FUNCTIONS;
 
-    string slot() { return slot_ + "/" + Y(0)->name(); }
+    /*! \brief Return the slot of the current param */
+    string slot() { return slot_ + "/" + Y(index_)->name(); }
 
     float param(const string& name) const;
     float lr_mult() const { return lr_mult_; }
@@ -37,6 +38,9 @@ class UpdateOpBase : public Operator<Context> {
     template <typename T>
     void Process(Tensor* dX, Tensor* X);
 
+    /*! \brief Fetch the hyper-parameters once per run */
+    virtual void ComputeParams() = 0;
+
     virtual void Compute(Tensor* dX) = 0;
 
     template <typename T>
@@ -47,6 +51,7 @@ class UpdateOpBase : public Operator<Context> {
  protected:
     string slot_;
     float lr_mult_, decay_mult_;
+    int index_;
 };
 
 #define USE_UPDATER_FUNCTIONS \
@@ -1052,6 +1052,78 @@ void LSTMCellGrad(
     T*                      dx,
     Context*                ctx);
 
+/*! recurrent.recurrent */
+
+template <typename T, class Context>
+void RNNUnit(
+    const int               N,
+    const int               C,
+    const bool              relu,
+    const T*                bx,
+    const T*                bh,
+    const T*                x,
+    T*                      h,
+    Context*                ctx);
+
+template <typename T, class Context>
+void RNNUnitGrad(
+    const int               N,
+    const int               C,
+    const bool              relu,
+    const T*                h,
+    const T*                dh,
+    T*                      dx,
+    Context*                ctx);
+
+template <typename T, class Context>
+void LSTMUnit(
+    const int               N,
+    const int               C,
+    const T*                cx,
+    const T*                bx,
+    const T*                bh,
+    T*                      x,
+    T*                      c,
+    T*                      h,
+    Context*                ctx);
+
+template <typename T, class Context>
+void LSTMUnitGrad(
+    const int               N,
+    const int               C,
+    const T*                cx,
+    const T*                x,
+    const T*                c,
+    const T*                dh,
+    T*                      dc,
+    T*                      dx,
+    Context*                ctx);
+
+template <typename T, class Context>
+void GRUUnit(
+    const int               N,
+    const int               C,
+    const T*                hx,
+    const T*                bx,
+    const T*                bh,
+    const T*                rx,
+    T*                      x,
+    T*                      hn,
+    T*                      h,
+    Context*                ctx);
+
+template <typename T, class Context>
+void GRUUnitGrad(
+    const int               N,
+    const int               C,
+    const T*                hx,
+    const T*                x,
+    const T*                hn,
+    T*                      dh,
+    T*                      dx,
+    T*                      drx,
+    Context*                ctx);
+
 /*! update.adam_update */
 
 template <typename T, class Context>
@@ -13,12 +13,129 @@
 #ifndef DRAGON_PYTHON_PY_AUTOGRAD_H_
 #define DRAGON_PYTHON_PY_AUTOGRAD_H_
 
+#include <condition_variable>
+#include <deque>
+#include <thread>
+
 #include "py_dragon.h"
+#include "core/profiler.h"
 
 namespace dragon {
 
 namespace python {
 
+/*!
+ * Run the hooks of backward on a persistent communication thread.
+ *
+ * The thread holds its own cuda streams, the hook waits the event
+ * recorded on the stream of caller, i.e., the device hooks overlap
+ * the remaining backward without blocking the host.
+ */
+class HookRunner {
+ public:
+    /*! \brief Return the global runner */
+    static HookRunner* Get() {
+        // Never destroyed, as the thread runs forever
+        static HookRunner* runner = new HookRunner();
+        return runner;
+    }
+
+    /*! \brief Push a hook to run after the dispatched ops of caller */
+    void Push(OperatorBase* op, const DeviceOption& option) {
+        Item item = { op, -1 };
+#ifdef WITH_CUDA
+        if (option.device_type() == PROTO_CUDA) {
+            item.device_id = option.device_id();
+            CUDADeviceGuard guard(item.device_id);
+            CUDA_CHECK(cudaEventCreateWithFlags(
+                &item.event, cudaEventDisableTiming));
+            CUDA_CHECK(cudaEventRecord(item.event,
+                CUDAContext::obj()->default_stream(item.device_id)));
+        }
+#endif
+        std::lock_guard<std::mutex> lock(mutex_);
+        items_.push_back(item);
+        num_pending_++;
+        cond_.notify_all();
+    }
+
+    /*! \brief Wait for all the hooks and their device streams */
+    void Wait() {
+        std::unique_lock<std::mutex> lock(mutex_);
+        cond_.wait(lock, [this]() { return num_pending_ == 0; });
+    }
+
+ private:
+    struct Item {
+        /*! \brief The hook operator */
+        OperatorBase* op;
+
+        /*! \brief The cuda device, -1 for cpu */
+        int device_id;
+
+#ifdef WITH_CUDA
+        /*! \brief The event recorded on the stream of caller */
+        cudaEvent_t event;
+#endif
+    };
+
+    /*! \brief Default constructor */
+    HookRunner() : num_pending_(0) {
+        std::thread(&HookRunner::Run, this).detach();
+    }
+
+    /*! \brief Run the hooks in the pushing order */
+    void Run() {
+        // Use the exclusive temporal data
+        Workspace::data_slot() = 1;
+        int num_finished = 0;
+        Set<int> device_ids;
+        while (true) {
+            std::unique_lock<std::mutex> lock(mutex_);
+            cond_.wait(lock, [this]() { return !items_.empty(); });
+            Item item = items_.front();
+            items_.pop_front();
+            lock.unlock();
+#ifdef WITH_CUDA
+            if (item.device_id >= 0) {
+                // Wait the grads on device instead of the host
+                CUDADeviceGuard guard(item.device_id);
+                CUDA_CHECK(cudaStreamWaitEvent(CUDAContext::obj()
+                    ->default_stream(item.device_id), item.event, 0));
+                CUDA_CHECK(cudaEventDestroy(item.event));
+                device_ids.insert(item.device_id);
+            }
+#endif
+            RunOperatorWithProfiling(item.op, 0, "Hook");
+            num_finished++;
+            lock.lock();
+            if (!items_.empty()) continue;
+            lock.unlock();
+#ifdef WITH_CUDA
+            // Finish the devices before the update of caller
+            for (auto device_id : device_ids)
+                CUDAContext::SyncStream(CUDAContext::obj()
+                    ->default_stream(device_id));
+#endif
+            device_ids.clear();
+            lock.lock();
+            num_pending_ -= num_finished;
+            num_finished = 0;
+            cond_.notify_all();
+        }
+    }
+
+    /*! \brief The pending hooks */
+    std::deque<Item> items_;
+
+    /*! \brief The number of pushed but unfinished hooks */
+    int num_pending_;
+
+    /*! \brief Guard the pending hooks */
+    std::mutex mutex_;
+    std::condition_variable cond_;
+};
+
 void AddGradientMethods(pybind11::module& m) {
     m.def("CreateGradientDefs", [](
         const string&               forward_def,
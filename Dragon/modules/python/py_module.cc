@@ -5,6 +5,7 @@
 #include "py_mpi.h"
 #include "py_config.h"
 #include "py_proto.h"
+#include "py_profiler.h"
 
 namespace dragon {
 
@@ -62,6 +63,9 @@ PYBIND11_MODULE(libdragon, m) {
         /*! \brief Reset a tensor with the given name */
         .def("ResetTensor", &Workspace::ResetTensor)
 
+        /*! \brief Return the name of stored tensors */
+        .def("Tensors", &Workspace::tensors)
+
         /*! \brief Indicate whether the given tensor is existing */
         .def("HasTensor", [](
             Workspace*                  self,
@@ -279,6 +283,9 @@ PYBIND11_MODULE(libdragon, m) {
             self->RunOperator(*def);
         })
 
+        /*! \brief Delete a persistent operator by the uid */
+        .def("DeleteOperator", &Workspace::DeleteOperator)
+
         /*! \brief Run a operator from the serialized def */
         .def("RunOperator", [](
             Workspace*                  self,
@@ -329,12 +336,47 @@ PYBIND11_MODULE(libdragon, m) {
             self->RunGraph(name, include, exclude);
         })
 
+        /*! \brief Run an existing graph by the compiled plan */
+        .def("RunGraph", [](
+            Workspace*                  self,
+            const string&               name,
+            const int                   plan_handle) {
+            pybind11::gil_scoped_release g;
+            self->RunGraph(name, plan_handle);
+        })
+
+        /*! \brief Compile a plan of the operators matched by rules */
+        .def("CompileGraphPlan", [](
+            Workspace*                  self,
+            const string&               name,
+            const string&               include,
+            const string&               exclude) {
+            return self->GetGraph(name)->CompilePlan(include, exclude);
+        })
+
+        /*! \brief Compile a plan of the specified operators */
+        .def("CompileGraphPlan", [](
+            Workspace*                  self,
+            const string&               name,
+            const vec32_t&              indices) {
+            return self->GetGraph(name)->CompilePlan(indices);
+        })
+
+        /*! \brief Return the serialized optimized def of graph */
+        .def("GetOptimizedGraph", [](
+            Workspace*                  self,
+            const string&               name) {
+            return pybind11::bytes(self->GetGraph(name)
+                ->opt_def().SerializeAsString());
+        })
+
         .def("Backward", [](
             Workspace*                      self,
             const vector<OperatorDef*>&     forward_ops,
             const vector<string>&           targets,
             const vector<string>&           input_grads,
             const vector<string>&           ignore_grads,
+            const vector<OperatorDef*>&     hook_ops,
             const bool                      is_sharing,
             const bool                      verbose) {
             // Make => Optimize => Run
@@ -345,11 +387,60 @@ PYBIND11_MODULE(libdragon, m) {
             maker.Make(forward_ops, targets, backward_ops);
             pybind11::gil_scoped_release g;
             if (is_sharing) backward_ops = maker.Share(backward_ops);
-            for (auto& op : backward_ops.op()) {
+            // Schedule the hooks right after the last writer,
+            // i.e., run as soon as the hooked grads are ready
+            Map<string, int> last_writer;
+            for (int i = 0; i < backward_ops.op_size(); ++i)
+                for (const auto& e : backward_ops.op(i).output())
+                    last_writer[e] = i;
+            // The hooks run on a communication thread to overlap,
+            // which requires the thread-safe MPI
+            bool async_hooks = IsMPIThreadSafe();
+            vector<int> scheduled;
+            vector<vector<OperatorDef>> hooks(backward_ops.op_size());
+            for (int i = 0; i < (int)hook_ops.size(); ++i) {
+                int pos = -1;
+                OperatorDef hook(*hook_ops[i]);
+                hook.clear_input(); hook.clear_output();
+                for (const auto& e : hook_ops[i]->input()) {
+                    // Grads not produced are skipped
+                    if (!last_writer.count(e)) continue;
+                    pos = std::max(pos, last_writer[e]);
+                    hook.add_input(e); hook.add_output(e);
+                }
+                if (pos < 0) continue;
+                // Use the exclusive operator for each hook
+                if (hook.has_uid()) hook.set_uid(
+                    hook.uid() + "/hook:" + str::to(i));
+                hooks[pos].emplace_back(hook);
+                scheduled.push_back(i);
+            }
+            auto run = [&](const OperatorDef& op) {
                 if (verbose) std::cout << op.DebugString() << std::endl;
                 if (op.has_uid()) self->RunOperator(op);
                 else self->RunOperatorOnce(op);
+            };
+            vector<unique_ptr<OperatorBase>> temporal_hooks;
+            for (int i = 0; i < backward_ops.op_size(); ++i) {
+                run(backward_ops.op(i));
+                for (const auto& hook : hooks[i]) {
+                    if (!async_hooks) { run(hook); continue; }
+                    if (verbose) std::cout << hook.DebugString() << std::endl;
+                    // Create the operator on the caller,
+                    // as the operators map is not thread-safe
+                    OperatorBase* op = nullptr;
+                    if (hook.has_uid()) {
+                        op = self->CreateOperator(hook);
+                        op->UpdateFrom(hook);
+                    } else {
+                        temporal_hooks.emplace_back(NewOperator(hook, self));
+                        op = temporal_hooks.back().get();
+                    }
+                    HookRunner::Get()->Push(op, hook.device_option());
+                }
             }
+            if (async_hooks) HookRunner::Get()->Wait();
+            return scheduled;
         })
 
         /*! \brief Serialize tensors into a binary file */
@@ -412,6 +503,7 @@ PYBIND11_MODULE(libdragon, m) {
     AddConfigMethods(m);
     AddGradientMethods(m);
     AddOperatorMethods(m);
+    AddProfilerMethods(m);
     OnImportModule();
 }
 
@@ -23,11 +23,25 @@ namespace dragon {
 
 namespace python {
 
+/*! \brief Whether the MPI can be called from the other threads */
+inline bool IsMPIThreadSafe() {
+#ifdef WITH_MPI
+    int is_init, thread_type;
+    MPI_Initialized(&is_init);
+    if (!is_init) return false;
+    MPI_Query_thread(&thread_type);
+    return thread_type >= MPI_THREAD_SERIALIZED;
+#else
+    return false;
+#endif
+}
+
 void AddMPIMethods(pybind11::module& m) {
     m.def("MPIInit", []() {
 #ifdef WITH_MPI
         // Enabling the multi-threads for Python is meaningless
         // While we will still hold this interface here
+        // The serialized level is required to overlap the hooks
         int thread_type;
         char* mt_is_required = nullptr;
         mt_is_required = getenv("DRAGON_MPI_THREADS_ENABLE");
@@ -36,7 +50,7 @@ void AddMPIMethods(pybind11::module& m) {
             CHECK_EQ(thread_type, MPI_THREAD_MULTIPLE)
                 << "\nRequire to enable <MPI_THREAD_MULTIPLE> support.";
         } else {
-            MPI_Init_thread(NULL, NULL, MPI_THREAD_SINGLE, &thread_type);
+            MPI_Init_thread(NULL, NULL, MPI_THREAD_SERIALIZED, &thread_type);
         }
 #else
         LOG(FATAL) << "MPI was not compiled.";
@@ -0,0 +1,60 @@
+/*!
+ * Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+ *
+ * Licensed under the BSD 2-Clause License.
+ * You should have received a copy of the BSD 2-Clause License
+ * along with the software. If not, See,
+ *
+ *      <https://opensource.org/licenses/BSD-2-Clause>
+ *
+ * ------------------------------------------------------------
+ */
+
+#ifndef DRAGON_PYTHON_PY_PROFILER_H_
+#define DRAGON_PYTHON_PY_PROFILER_H_
+
+#include "py_dragon.h"
+#include "core/profiler.h"
+
+namespace dragon {
+
+namespace python {
+
+void AddProfilerMethods(pybind11::module& m) {
+    m.def("EnableProfiling", [](bool enabled) {
+        Profiler::Get()->set_enabled(enabled);
+    });
+
+    m.def("IsProfilingEnabled", []() {
+        return Profiler::Get()->enabled();
+    });
+
+    m.def("GetProfilingEvents", []() {
+        pybind11::list events;
+        for (const auto& e : Profiler::Get()->events()) {
+            pybind11::dict event;
+            event["name"] = e.name;
+            event["type"] = e.type;
+            event["category"] = e.category;
+            event["scope"] = e.scope;
+            event["input_shapes"] = e.input_shapes;
+            event["output_shapes"] = e.output_shapes;
+            event["start"] = e.start;
+            event["duration"] = e.duration;
+            event["bytes"] = e.bytes;
+            event["thread_id"] = e.thread_id;
+            events.append(event);
+        }
+        return events;
+    });
+
+    m.def("ResetProfiling", []() {
+        Profiler::Get()->Reset();
+    });
+}
+
+}  // namespace python
+
+}  // namespace dragon
+
+#endif  // DRAGON_PYTHON_PY_PROFILER_H_
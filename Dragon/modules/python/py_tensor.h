@@ -31,6 +31,9 @@ void AddTensorMethods(pybind11::module& m) {
         /*! \brief Return the total number of elements */
         .def_property_readonly("size", &Tensor::size)
 
+        /*! \brief Return the capacity of the internal memory */
+        .def_property_readonly("capacity", &Tensor::capacity)
+
         /*! \brief Return the data type */
         .def_property_readonly("dtype", [](Tensor* self) {
             return TypeMetaToString(self->meta());
@@ -28,6 +28,7 @@ from dragon.core.workspace import reset_default_workspace
 import dragon.core.tensor_utils as tensor_utils
 import dragon.core.mpi as mpi
 import dragon.core.cuda as cuda
+import dragon.core.profiler as profiler
 import dragon.memonger as memonger
 
 # Operators
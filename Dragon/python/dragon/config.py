@@ -37,9 +37,16 @@ option['graph_optimization_level'] = 3
 # Whether to share grads
 option['share_grads'] = True
 
+# Whether to plan the memory of training graphs
+option['plan_memory'] = False
+
 # Optional graph type
 option['graph_type'] = ''
 
+# The number of threads for the parallel graph
+# 0 leads to the number of hardware threads
+option['graph_num_threads'] = 0
+
 # Whether to log the meta graphs
 option['log_meta_graph'] = False
 
@@ -50,6 +57,9 @@ option['export_meta_graph'] = ''
 # Whether to log the optimized graphs
 option['log_optimized_graph'] = False
 
+# Whether to profile the operators
+option['enable_profiling'] = False
+
 
 def GetGlobalOptions():
     """Return all the global options.
@@ -174,6 +184,8 @@ def SetGraphType(graph_type=''):
 
     If empty, the default DAG graph will be used.
 
+    Set ``Parallel`` to run the independent operators concurrently on CPU.
+
     Parameters
     ----------
     graph_type : str
@@ -188,6 +200,23 @@ def SetGraphType(graph_type=''):
     option['graph_type'] = graph_type
 
 
+def SetGraphNumThreads(num_threads=0):
+    """Set the number of threads for the parallel graph.
+
+    Parameters
+    ----------
+    num_threads : int, optional, default=0
+        The number of threads, ``0`` to use all the hardware threads.
+
+    Returns
+    -------
+    None
+
+    """
+    global option
+    option['graph_num_threads'] = num_threads
+
+
 def SetGraphOptimizationLevel(level=3):
     """Set the default level of graph optimization.
 
@@ -278,6 +307,28 @@ def ExportMetaGraph(prefix=''):
     option['export_meta_graph'] = prefix
 
 
+def EnableProfiling(enabled=True):
+    """Enable to profile the operators globally.
+
+    The running events are recorded for both the graphs and the eager execution.
+
+    See ``dragon.core.profiler`` to export the results.
+
+    Parameters
+    ----------
+    enabled : boolean
+        Whether to enable profiling.
+
+    Returns
+    -------
+    None
+
+    """
+    global option
+    option['enable_profiling'] = enabled
+    _C.EnableProfiling(enabled)
+
+
 def SetLoggingLevel(level):
     """Set the minimum level of Logging.
 
@@ -15,8 +15,10 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import sys
 import math
 import numpy
+from collections import defaultdict
 
 from dragon.core import workspace as _workspace
 
@@ -62,6 +64,96 @@ class OperatorHelper(object):
             return cls._apply_Simple(arguments, inputs, outputs)
         return outputs
 
+    @classmethod
+    def parse_arguments(cls, op_def):
+        """Parse the arguments as the keywords to make the op."""
+        arguments = defaultdict(lambda: None)
+        decode = (lambda s: s.decode('utf-8')) \
+            if sys.version_info >= (3, 0) else (lambda s: s)
+        for arg in op_def.arg:
+            if arg.HasField('f'): arguments[arg.name] = arg.f
+            elif arg.HasField('i'): arguments[arg.name] = arg.i
+            elif arg.HasField('s'): arguments[arg.name] = decode(arg.s)
+            elif len(arg.floats) > 0: arguments[arg.name] = list(arg.floats)
+            elif len(arg.strings) > 0:
+                arguments[arg.name] = [decode(e) for e in arg.strings]
+            else: arguments[arg.name] = list(arg.ints)
+        return arguments
+
+    @classmethod
+    def infer(cls, graph_def, tensors):
+        """Infer the ``dtype`` and ``shape`` of tensors without running.
+
+        The unknown types or dimensions are represented as ``None``.
+
+        Parameters
+        ----------
+        graph_def : GraphDef
+            The definition of graph.
+        tensors : dict
+            The leaf tensors keyed by the name.
+
+        Returns
+        -------
+        dict
+            The inferred tensors keyed by the name.
+
+        """
+        from dragon.core.tensor import Tensor
+        tensors = dict(tensors)
+        for op in graph_def.op:
+            inputs = [tensors[e] if e in tensors
+                else Tensor(e) for e in op.input]
+            outputs = [Tensor(e) for e in op.output]
+            try:
+                outputs = cls.apply(op.type,
+                    cls.parse_arguments(op), inputs, outputs)
+            except Exception:
+                pass # Unknown, leave it to the running
+            if not isinstance(outputs, (tuple, list)): outputs = [outputs]
+            for output in outputs: tensors[output.name] = output
+        return tensors
+
+    @classmethod
+    def infer_sizes(cls, graph_def, tensors=None):
+        """Infer the number of bytes of tensors without running.
+
+        The leaves are taken from ``tensors`` or the workspace,
+        and the tensors with unknown sizes are excluded.
+
+        Parameters
+        ----------
+        graph_def : GraphDef
+            The definition of graph.
+        tensors : dict, optional
+            The leaf tensors keyed by the name.
+
+        Returns
+        -------
+        tuple
+            The names and sizes.
+
+        """
+        from dragon.core.tensor import Tensor
+        leaves, outputs = dict(tensors) if tensors else {}, set()
+        for op in graph_def.op:
+            for input in op.input:
+                if input in outputs or input in leaves: continue
+                if _workspace.HasTensor(input):
+                    impl = _workspace.get_default_workspace().GetTensor(input)
+                    leaves[input] = Tensor(input, list(impl.dims), impl.dtype)
+            outputs.update(op.output)
+        names, sizes = [], []
+        for name, tensor in cls.infer(graph_def, leaves).items():
+            try:
+                if any(d is None or d < 0 for d in tensor.shape): continue
+                size = int(numpy.prod(tensor.shape)) * \
+                    numpy.dtype(tensor.dtype).itemsize
+            except (TypeError, ValueError):
+                continue # Unknown type or shape
+            names.append(name); sizes.append(size)
+        return names, sizes
+
     @classmethod
     def _apply_Simple(cls, arguments, inputs, outputs):
         outputs[0].dtype = inputs[0].dtype
@@ -0,0 +1,185 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""List some useful Profiler C++ API.
+
+Enable the profiling with ``dragon.config.EnableProfiling()``,
+then run the graphs or operators as usual.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+from collections import OrderedDict
+
+from dragon import import_c_api as _C
+
+
+def IsEnabled():
+    """Whether the profiling is enabled.
+
+    Returns
+    -------
+    boolean
+        *True* if enabled otherwise *False*.
+
+    """
+    return _C.IsProfilingEnabled()
+
+
+def GetEvents():
+    """Return the recorded events.
+
+    Each event is a dict with keys:
+
+    ``name``, ``type``, ``category``, ``scope``, ``input_shapes``,
+
+    ``output_shapes``, ``start``, ``duration``, ``bytes`` and ``thread_id``.
+
+    The time is represented in microseconds.
+
+    Returns
+    -------
+    list of dict
+        The events.
+
+    """
+    return _C.GetProfilingEvents()
+
+
+def Reset():
+    """Remove all the recorded events.
+
+    Returns
+    -------
+    None
+
+    """
+    _C.ResetProfiling()
+
+
+def Aggregate(group_by='type', events=None):
+    """Aggregate the events by the operator type or name scope.
+
+    Parameters
+    ----------
+    group_by : {'type', 'scope', 'name'}, optional
+        The key to group the events.
+    events : list of dict, optional
+        The events. Defaults to the recorded events.
+
+    Returns
+    -------
+    OrderedDict
+        The stats of groups, sorted by the total time descending.
+
+    """
+    if group_by not in ('type', 'scope', 'name'):
+        raise ValueError('Unknown group key: ' + group_by)
+    if events is None: events = GetEvents()
+    groups = {}
+    for e in events:
+        key = e[group_by] if e[group_by] else '<none>'
+        if key not in groups:
+            groups[key] = {
+                'calls': 0,
+                'total': 0,
+                'min': e['duration'],
+                'max': e['duration'],
+                'bytes': 0,
+            }
+        stat = groups[key]
+        stat['calls'] += 1
+        stat['total'] += e['duration']
+        stat['min'] = min(stat['min'], e['duration'])
+        stat['max'] = max(stat['max'], e['duration'])
+        stat['bytes'] += e['bytes']
+    for stat in groups.values():
+        stat['mean'] = float(stat['total']) / stat['calls']
+    return OrderedDict(sorted(groups.items(),
+        key=lambda kv: kv[1]['total'], reverse=True))
+
+
+def Summary(group_by='type', top_k=None, events=None):
+    """Return a table summarizing the events.
+
+    Parameters
+    ----------
+    group_by : {'type', 'scope', 'name'}, optional
+        The key to group the events.
+    top_k : int, optional
+        The number of most time-consuming groups to show.
+    events : list of dict, optional
+        The events. Defaults to the recorded events.
+
+    Returns
+    -------
+    str
+        The summary table.
+
+    """
+    stats = Aggregate(group_by, events)
+    grand_total = max(sum(s['total'] for s in stats.values()), 1)
+    items = list(stats.items())[:top_k]
+    width = max([len(group_by)] + [len(k) for k, _ in items])
+    header = '{:<{w}}  {:>8}  {:>12}  {:>10}  {:>10}  {:>10}  {:>7}  {:>12}'
+    row = '{:<{w}}  {:>8d}  {:>12.3f}  {:>10.3f}  {:>10.3f}  {:>10.3f}  {:>6.2f}%  {:>12d}'
+    lines = [header.format(group_by, 'calls', 'total(ms)', 'mean(ms)',
+        'min(ms)', 'max(ms)', 'ratio', 'bytes', w=width)]
+    lines.append('-' * len(lines[0]))
+    for key, s in items:
+        lines.append(row.format(key, s['calls'], s['total'] / 1e3,
+            s['mean'] / 1e3, s['min'] / 1e3, s['max'] / 1e3,
+                100. * s['total'] / grand_total, s['bytes'], w=width))
+    return '\n'.join(lines)
+
+
+def ExportChromeTrace(path, events=None):
+    """Export the events into a Chrome trace file.
+
+    Open the file with *chrome://tracing* to view the timeline.
+
+    Parameters
+    ----------
+    path : str
+        The path of json file.
+    events : list of dict, optional
+        The events. Defaults to the recorded events.
+
+    Returns
+    -------
+    None
+
+    """
+    if events is None: events = GetEvents()
+    trace_events = []
+    for e in events:
+        trace_events.append({
+            'name': e['name'],
+            'cat': e['category'],
+            'ph': 'X',
+            'ts': e['start'],
+            'dur': e['duration'],
+            'pid': 0,
+            'tid': e['thread_id'],
+            'args': {
+                'type': e['type'],
+                'scope': e['scope'],
+                'input_shapes': e['input_shapes'],
+                'output_shapes': e['output_shapes'],
+                'bytes': e['bytes'],
+            },
+        })
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': trace_events}, f)
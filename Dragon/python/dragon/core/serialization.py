@@ -0,0 +1,308 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""An indexed container of tensors.
+
+The layout is a pickled header followed by the aligned raw buffers:
+
+    MAGIC(8) | len(header)(8) | header | pad | buffer0 | pad | buffer1 ...
+
+Thus, the buffers could be memory-mapped and loaded lazily,
+instead of unpickling all the arrays into memory at once.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import io
+import os
+import mmap
+import atexit
+import struct
+import threading
+import numpy
+import six.moves.cPickle as pickle
+from six.moves import queue as _queue
+
+from dragon.core import logging as _logging
+
+
+MAGIC = b'DRAGONTC'
+ALIGNMENT = 64
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def is_indexed(f):
+    """Whether the file is an indexed container.
+
+    Parameters
+    ----------
+    f : file
+        The opened file, which should be seekable.
+
+    Returns
+    -------
+    boolean
+        ``True`` if the magic is matched.
+
+    """
+    pos = f.tell()
+    magic = f.read(len(MAGIC))
+    f.seek(pos)
+    return magic == MAGIC
+
+
+def save(f, arrays, meta=None, protocol=pickle.HIGHEST_PROTOCOL):
+    """Write the arrays into an indexed container.
+
+    The arrays are written one by one without copying,
+    so the zero-copied views of the backend storage are expected.
+
+    Parameters
+    ----------
+    f : file
+        The opened binary file to write.
+    arrays : sequence of (str, numpy.ndarray)
+        The named arrays.
+    meta : object, optional
+        The extra picklable object.
+    protocol : int, optional
+        The pickle protocol for the header.
+
+    Returns
+    -------
+    None
+
+    """
+    index, offset = [], 0
+    for name, array in arrays:
+        offset = _align(offset)
+        index.append((name, array.dtype.str, array.shape, offset))
+        offset += array.nbytes
+    header = pickle.dumps(
+        {'index': index, 'meta': meta}, protocol)
+    f.write(MAGIC)
+    f.write(struct.pack('<Q', len(header)))
+    f.write(header)
+    start = _align(len(MAGIC) + 8 + len(header))
+    position = len(MAGIC) + 8 + len(header)
+    for (name, array), (_, _, _, offset) in zip(arrays, index):
+        f.write(b'\0' * (start + offset - position))
+        # Stream the raw bytes as a flat view
+        if array.nbytes > 0:
+            f.write(numpy.ascontiguousarray(array)
+                .reshape(-1).view(numpy.uint8))
+        position = start + offset + array.nbytes
+
+
+class IndexedFile(object):
+    """Map the indexed container and load the arrays lazily.
+
+    The arrays share the copy-on-write pages of the file,
+    which are read on accessing, without touching the file.
+
+    """
+    def __init__(self, f):
+        """Create an IndexedFile.
+
+        Parameters
+        ----------
+        f : file
+            The opened binary file to read.
+
+        """
+        if not is_indexed(f):
+            raise ValueError('Excepted an indexed container, '
+                'while the magic is mismatched.')
+        f.seek(len(MAGIC))
+        header_size = struct.unpack('<Q', f.read(8))[0]
+        header = pickle.loads(f.read(header_size))
+        self.meta = header['meta']
+        self._start = _align(len(MAGIC) + 8 + header_size)
+        self._index = dict((e[0], e[1:]) for e in header['index'])
+        self._keys = [e[0] for e in header['index']]
+        try:
+            self._buffer = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (AttributeError, io.UnsupportedOperation):
+            # Not backed by a real file, read into memory
+            f.seek(0)
+            self._buffer = bytearray(f.read())
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __getitem__(self, key):
+        dtype, shape, offset = self._index[key]
+        dtype = numpy.dtype(dtype)
+        count = int(numpy.prod(shape, dtype='int64'))
+        return numpy.frombuffer(
+            self._buffer, dtype, count,
+                self._start + offset).reshape(shape)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self, prefix=''):
+        """Return the keys.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The prefix to filter keys.
+
+        Returns
+        -------
+        list of str
+            The keys.
+
+        """
+        return [k for k in self._keys if k.startswith(prefix)]
+
+    def items(self, prefix=''):
+        """Yield the key and lazily mapped array.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The prefix to filter keys.
+
+        Returns
+        -------
+        generator
+            The key and array.
+
+        """
+        for key in self.keys(prefix):
+            yield key, self[key]
+
+
+class AsyncWriter(object):
+    """Write the files in a background thread.
+
+    The host buffers should be fetched before submitting,
+    then serializing and syncing to the disk are overlapped with computation.
+
+    Each file is written into a temporary path first,
+    and renamed atomically after being synced.
+
+    """
+    def __init__(self, max_inflight=2):
+        """Create an AsyncWriter.
+
+        Parameters
+        ----------
+        max_inflight : int, optional, default=2
+            The max number of files writing or waiting.
+
+        """
+        if max_inflight < 1:
+            raise ValueError('Excepted at least 1 inflight file, '
+                'got {}.'.format(max_inflight))
+        self._slots = threading.BoundedSemaphore(max_inflight)
+        self._queue, self._error = _queue.Queue(), None
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+        # Flush the pending files before exiting
+        atexit.register(self.close)
+
+    def submit(self, path, body):
+        """Submit a file to write.
+
+        It will block if too many files are inflight.
+
+        Parameters
+        ----------
+        path : str
+            The path of file.
+        body : function
+            The function to write the opened binary file.
+
+        Returns
+        -------
+        None
+
+        """
+        self._check()
+        if self._thread is None:
+            raise RuntimeError('The writer has been closed.')
+        self._slots.acquire()
+        self._queue.put((path, body))
+
+    def wait(self):
+        """Wait for all the submitted files.
+
+        Returns
+        -------
+        None
+
+        """
+        self._queue.join()
+        self._check()
+
+    def close(self):
+        """Flush the pending files and stop the thread.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._thread is None: return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._check()
+
+    def _check(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            path, body = item
+            try:
+                self._write(path, body)
+            except Exception as e:
+                # Raise it in the main thread on the next call
+                self._error = e
+            finally:
+                self._slots.release()
+                self._queue.task_done()
+
+    @staticmethod
+    def _write(path, body):
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                body(f)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            if os.path.exists(tmp_path): os.remove(tmp_path)
+            raise
+        # Never expose a partial file
+        getattr(os, 'replace', os.rename)(tmp_path, path)
+        _logging.info('Snapshot Model@: ' + path)
@@ -33,10 +33,24 @@ from dragon.core import tls as _tls
 from dragon.core import mpi as _mpi
 from dragon.core import logging as _logging
 from dragon.core import mapping as _mapping
+from dragon.core import serialization as _serialization
 from dragon.proto import dragon_pb2 as _proto_def
 from dragon.core import proto_utils as _proto_utils
 
 
+def _get_capacity(name):
+    """Return the bytes of memory held by the tensor."""
+    if not HasTensor(name): return 0
+    return get_default_workspace().GetTensor(name).capacity
+
+
+def _release(name):
+    """Release the memory of tensor and return the released bytes."""
+    nbytes = _get_capacity(name)
+    if nbytes > 0: ResetTensor(name)
+    return nbytes
+
+
 class TensorPool(object):
     """A wrapper to manage the reused tensors.
 
@@ -55,18 +69,53 @@ class TensorPool(object):
 
     * *${REFERENCE}*: A pool to reuse reshaped tensors(sharing contents).
 
+    The number of idle tensors holding memory could be capped for each scope,
+    the largest ones are released if overflowed, while the names are kept.
+
     """
     def __init__(self):
         # deque provide much higher performance than Queue
         self._scope2keys = defaultdict(deque)
+        self._scope2names = defaultdict(set)
+        self._scope2bytes = defaultdict(int)
+        self._scope2peak = defaultdict(int)
+        self._scope2cap = {}
+        # The capacity of tensors in bytes, known at the last sizing
+        self._capacities = {}
+        # The idle tensors collected since the last sizing
+        self._scope2dirty = defaultdict(set)
+
+    def set_cap(self, scope, max_idle=None):
+        """Set the max number of idle tensors holding memory.
+
+        Parameters
+        ----------
+        scope : str
+            The scope.
+        max_idle : int, optional
+            The cap, ``None`` for unlimited.
+
+        Returns
+        -------
+        None
+
+        """
+        self._scope2cap[scope] = max_idle
+        self._apply_cap(scope)
 
-    def get(self, scope='${DETACH}'):
+    def get(self, scope='${DETACH}', nbytes=None):
         """Return a unique name under the specified scope.
 
+        If ``nbytes`` is given, the idle tensor with the smallest capacity
+        that fits is selected, otherwise, the smallest one is selected to
+        reallocate, which preserves the larger ones for the larger requests.
+
         Parameters
         ----------
         scope : str, optional, default='${DETACH}'
             The optional
+        nbytes : int, optional
+            The requested bytes.
 
         Returns
         -------
@@ -74,18 +123,35 @@ class TensorPool(object):
             The unique name can be used.
 
         """
+        if self._scope2cap.get(scope, None) is not None:
+            self._apply_cap(scope)
+        keys = self._scope2keys[scope]
+        if nbytes is not None and len(keys) > 1:
+            self._size(scope)
+            best_idx, best_key = 0, None
+            for idx, name in enumerate(keys):
+                capacity = self._capacities.get(name, 0)
+                key = (capacity < nbytes, capacity)
+                if best_key is None or key < best_key:
+                    best_idx, best_key = idx, key
+            name = keys[best_idx]; del keys[best_idx]
+            return name
         try:
-            return self._scope2keys[scope].popleft()
+            name = keys.popleft()
+            self._scope2dirty[scope].discard(name)
+            return name
         except:
-            self._scope2keys[scope].append(
-                GetDummyName(
-                    '${POOL}/%s/Tensor' % scope,
-                        domain='Tensor', zero_based=False))
-            return self._scope2keys[scope].popleft()
+            name = GetDummyName(
+                '${POOL}/%s/Tensor' % scope,
+                    domain='Tensor', zero_based=False)
+            self._scope2names[scope].add(name)
+            return name
 
     def put(self, name):
         """Collect a unique name.
 
+        The capacity is sized lazily on ``get()`` and ``trim()``.
+
         Parameters
         ----------
         name : str
@@ -95,9 +161,86 @@ class TensorPool(object):
         if '${POOL}' in name:
             scope, _ = name[8:].split('/')
             self._scope2keys[scope].append(name)
+            self._scope2dirty[scope].add(name)
             return True
         else: return False
 
+    def trim(self, scope=None):
+        """Release the memory of idle tensors.
+
+        Parameters
+        ----------
+        scope : str, optional
+            The scope to trim, ``None`` for all scopes.
+
+        Returns
+        -------
+        int
+            The released bytes.
+
+        """
+        nbytes = 0
+        scopes = [scope] if scope else list(self._scope2keys.keys())
+        for scope in scopes:
+            for name in self._scope2keys[scope]:
+                nbytes += _release(name)
+                self._update(scope, name, 0)
+            self._scope2dirty[scope].clear()
+        return nbytes
+
+    def stats(self):
+        """Return the memory held by each scope.
+
+        The accounting is not changed by reading the stats.
+
+        Returns
+        -------
+        dict
+            The tensors, idle tensors, bytes,
+            idle bytes and peak bytes of each scope.
+
+        """
+        stats = {}
+        for scope, names in self._scope2names.items():
+            idle = set(self._scope2keys[scope])
+            capacities = dict((e, _get_capacity(e)) for e in names)
+            nbytes = sum(capacities.values())
+            stats[scope] = {
+                'tensors': len(names),
+                'idle': len(idle),
+                'bytes': nbytes,
+                'idle_bytes': sum(capacities[e] for e in idle),
+                'peak_bytes': max(self._scope2peak[scope], nbytes),
+            }
+        return stats
+
+    def _size(self, scope):
+        """Update the capacity of idle tensors collected since the last."""
+        dirty = self._scope2dirty[scope]
+        for name in dirty:
+            self._update(scope, name, _get_capacity(name))
+        dirty.clear()
+
+    def _update(self, scope, name, capacity):
+        self._scope2names[scope].add(name)
+        self._scope2bytes[scope] += \
+            capacity - self._capacities.get(name, 0)
+        self._capacities[name] = capacity
+        self._scope2peak[scope] = max(
+            self._scope2peak[scope], self._scope2bytes[scope])
+
+    def _apply_cap(self, scope):
+        max_idle = self._scope2cap.get(scope, None)
+        if max_idle is None: return
+        self._size(scope)
+        holding = [e for e in self._scope2keys[scope]
+                    if self._capacities.get(e, 0) > 0]
+        if len(holding) <= max_idle: return
+        holding.sort(key=lambda e: self._capacities[e], reverse=True)
+        for name in holding[:len(holding) - max_idle]:
+            _release(name)
+            self._update(scope, name, 0)
+
 
 class OperatorPool(object):
     """A wrapper to manage the resource handle of operators.
@@ -109,10 +252,35 @@ class OperatorPool(object):
 
     Handle will be released after the backward-pass automatically.
 
+    The resources of idle handles, i.e., ``/mnt/<handle>/*``,
+    could be capped for each type or trimmed explicitly.
+
     """
     def __init__(self):
         # deque provide much higher performance than Queue
         self._type2keys = defaultdict(deque)
+        self._type2handles = defaultdict(set)
+        self._type2cap = {}
+        # The resource tensors of handles, found at the first trimming
+        self._resources, self._released = {}, set()
+
+    def set_cap(self, op_type, max_idle=None):
+        """Set the max number of idle handles holding resources.
+
+        Parameters
+        ----------
+        op_type : str
+            The type of the operator.
+        max_idle : int, optional
+            The cap, ``None`` for unlimited.
+
+        Returns
+        -------
+        None
+
+        """
+        self._type2cap[op_type] = max_idle
+        self._apply_cap(op_type)
 
     def get(self, op_type):
         """Return a unique handle according to the op type.
@@ -129,13 +297,15 @@ class OperatorPool(object):
 
         """
         try:
-            return self._type2keys[op_type].popleft()
+            handle = self._type2keys[op_type].popleft()
+            self._released.discard(handle)
+            return handle
         except:
-            self._type2keys[op_type].append(
-                GetDummyName(
-                    '${POOL}/%s' % op_type,
-                        domain='Operator', zero_based=False))
-            return self._type2keys[op_type].popleft()
+            handle = GetDummyName(
+                '${POOL}/%s' % op_type,
+                    domain='Operator', zero_based=False)
+            self._type2handles[op_type].add(handle)
+            return handle
 
     def put(self, handle):
         """Collect a unique handle.
@@ -148,6 +318,67 @@ class OperatorPool(object):
         """
         op_type, _ = handle[8:].split('_')
         self._type2keys[op_type].append(handle)
+        if self._type2cap.get(op_type, None) is not None:
+            self._apply_cap(op_type)
+
+    def trim(self, op_type=None):
+        """Release the resources of idle handles.
+
+        Parameters
+        ----------
+        op_type : str, optional
+            The type to trim, ``None`` for all types.
+
+        Returns
+        -------
+        int
+            The released bytes.
+
+        """
+        op_types = [op_type] if op_type else list(self._type2keys.keys())
+        return sum(self._release(e) for t in op_types
+                        for e in self._type2keys[t])
+
+    def stats(self):
+        """Return the resources held by each type.
+
+        Returns
+        -------
+        dict
+            The handles, idle handles and bytes of each type.
+
+        """
+        stats = {}
+        for op_type, handles in self._type2handles.items():
+            stats[op_type] = {
+                'handles': len(handles),
+                'idle': len(self._type2keys[op_type]),
+                'bytes': sum(_get_capacity(e) for h in handles
+                                for e in self._get_resources(h)),
+            }
+        return stats
+
+    def _get_resources(self, handle):
+        if handle in self._resources: return self._resources[handle]
+        prefix = '/mnt/{}/'.format(handle)
+        resources = [e for e in get_default_workspace()
+                        .Tensors() if e.startswith(prefix)]
+        # Cache if found, as the names are stable for a handle
+        if len(resources) > 0: self._resources[handle] = resources
+        return resources
+
+    def _release(self, handle):
+        if handle in self._released: return 0
+        self._released.add(handle)
+        return sum(_release(e) for e in self._get_resources(handle))
+
+    def _apply_cap(self, op_type):
+        max_idle = self._type2cap.get(op_type, None)
+        if max_idle is None: return
+        keys = self._type2keys[op_type]
+        # The least recently collected handles are released
+        for idx in range(len(keys) - max_idle):
+            self._release(keys[idx])
 
 
 class Workspace(_C.Workspace):
@@ -175,6 +406,7 @@ class Workspace(_C.Workspace):
         super(Workspace, self).__init__(name)
         self._ref_objects = []
         self._collections = {}
+        self._graph_plans = {}
         self.tensor_pool = TensorPool()
         self.operator_pool = OperatorPool()
 
@@ -606,8 +838,8 @@ def RunGraph(
         The tensors(list) and corresponding values(list).
     outputs : list of Tensor
         The outputs of the graph.
-    stage : str
-        The preset custom stages. See ``stages``.
+    stage : str or int, optional
+        The runtime stage, or the handle of compiled plan.
     return_outputs : boolean
         Whether to return the outputs.
 
@@ -630,11 +862,10 @@ def RunGraph(
         for idx in range(len(inputs[0])):
             FeedTensor(inputs[0][idx], inputs[1][idx])
 
-    # Run the graph according to the specified include/exclude rule
-    runtime_stage = stage if stage else 'default'
-    rule = _PREDEFINED_GRAPH_RUNTIME_STAGES[runtime_stage]
-    get_default_workspace().RunGraph(
-        graph_name, rule['include'], rule['exclude'])
+    # Run the graph according to the compiled plan of stage
+    if not isinstance(stage, int):
+        stage = CompileGraphStage(graph_name, stage)
+    get_default_workspace().RunGraph(graph_name, stage)
 
     # Try to return the outputs
     # Force to return may lead to asserts if outputs are not computed
@@ -644,14 +875,99 @@ def RunGraph(
         else: return [outputs[i].get_value() for i in range(len(outputs))]
 
 
+def RegisterGraphStage(name, include='', exclude='', predicate=None):
+    """Register a runtime stage selecting the operators to run.
+
+    The operators are selected if the type contains ``include``,
+    does not contain ``exclude``, and satisfies the ``predicate``.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage.
+    include : str, optional
+        The pattern that the type should contain.
+    exclude : str, optional
+        The pattern that the type should not contain.
+    predicate : callable, optional
+        The function taking an ``OperatorDef`` and returning a bool.
+
+    Returns
+    -------
+    None
+
+    """
+    if name in _GRAPH_RUNTIME_STAGES:
+        raise ValueError('Stage({}) has been registered.'.format(name))
+    if predicate is not None and not callable(predicate):
+        raise TypeError('Excepted a callable predicate.')
+    _GRAPH_RUNTIME_STAGES[name] = {
+        'include': include,
+        'exclude': exclude,
+        'predicate': predicate,
+    }
+
+
+def CompileGraphStage(graph_name, stage=None):
+    """Compile the runtime stage of graph into a plan.
+
+    The plan is compiled once per graph, and cached by the workspace.
+
+    Parameters
+    ----------
+    graph_name : str
+        The name of the graph.
+    stage : str, optional
+        The name of the stage. Defaults to ``default``.
+
+    Returns
+    -------
+    int
+        The handle of plan.
+
+    """
+    stage = stage if stage else 'default'
+    workspace = get_default_workspace()
+    key = (graph_name, stage)
+    if key in workspace._graph_plans:
+        return workspace._graph_plans[key]
+    if stage not in _GRAPH_RUNTIME_STAGES:
+        raise ValueError('Stage({}) is not registered.'.format(stage))
+    rule = _GRAPH_RUNTIME_STAGES[stage]
+    predicate = rule.get('predicate', None)
+    if predicate is None:
+        handle = workspace.CompileGraphPlan(
+            graph_name, rule['include'], rule['exclude'])
+    else:
+        graph_def = _proto_def.GraphDef()
+        graph_def.ParseFromString(
+            workspace.GetOptimizedGraph(graph_name))
+        indices = []
+        for idx, op_def in enumerate(graph_def.op):
+            if rule['include'] and rule['include'] not in op_def.type: continue
+            if rule['exclude'] and rule['exclude'] in op_def.type: continue
+            if predicate(op_def): indices.append(idx)
+        handle = workspace.CompileGraphPlan(graph_name, indices)
+    workspace._graph_plans[key] = handle
+    return handle
+
+
 def Backward(
     forward_ops,
     targets,
     input_grads=None,
     ignored_grads=None,
+    hook_ops=None,
 ):
     """Compute the gradients of given input operators.
 
+    The ``hook_ops`` run as soon as their input grads are ready,
+    e.g., launching the all-reduce before the backward is finished.
+
+    The hooks run on a communication thread if the MPI allows,
+    thus, overlapping with the remaining backward ops. The CUDA hooks
+    run on the streams of this thread, waiting the grads by events.
+
     Parameters
     ----------
     forward_ops : sequence of OperatorDef
@@ -662,10 +978,13 @@ def Backward(
         The external input grads.
     ignored_grads : sequence of str, optional
         The grads that are explicitly ignored.
+    hook_ops : sequence of OperatorDef, optional
+        The ops running on the ready grads.
 
     Returns
     -------
-    None
+    sequence of int
+        The indices of hook ops which are scheduled.
 
     """
     options = _cfg.GetGlobalOptions()
@@ -674,11 +993,12 @@ def Backward(
         if (options['log_optimized_graph'] or
             options['log_meta_graph']) else False
 
-    get_default_workspace().Backward(
+    return get_default_workspace().Backward(
         forward_ops,
         targets,
         input_grads if input_grads else [],
         ignored_grads if ignored_grads else [],
+        hook_ops if hook_ops else [],
         options['share_grads'],
         required_logging,
     )
@@ -690,6 +1010,7 @@ def Snapshot(
     prefix='',
     suffix='.bin',
     format='pickle',
+    writer=None,
 ):
     """Serialize tensors into a binary file.
 
@@ -697,6 +1018,9 @@ def Snapshot(
 
         ``prefix`` + ``filename`` + ``suffix``
 
+    If ``writer`` is given, the tensors are copied into the host buffers,
+    and serialized by the background thread.
+
     Parameters
     ----------
     tensors : list of Tensor or Tensor
@@ -707,8 +1031,10 @@ def Snapshot(
         The prefix of this binary file.
     suffix : str, optional, default='.bin'
         The suffix of this binary file.
-    format : {'pickle', 'caffe'}, optional
+    format : {'pickle', 'indexed', 'caffe'}, optional
         The format of this binary file.
+    writer : AsyncWriter, optional
+        The writer to write asynchronously.
 
     Returns
     -------
@@ -724,6 +1050,24 @@ def Snapshot(
     dir = os.path.split(file_path)[0]
     if len(dir) > 0 and not os.path.exists(dir): os.makedirs(dir)
 
+    if format not in ('pickle', 'indexed', 'caffe'):
+        raise TypeError('Unknown binary format: ' + format)
+
+    if writer is not None:
+        # Copy at this iteration, the tensors will be updated
+        arrays = [(tensor.name, get_default_workspace()
+            .TensorToArray(_stringify_tensor(tensor), True).copy())
+                for tensor in tensors]
+        if format == 'pickle':
+            body = lambda f: pickle.dump(
+                dict(arrays), f, pickle.HIGHEST_PROTOCOL)
+        elif format == 'indexed':
+            body = lambda f: _serialization.save(f, arrays)
+        else:
+            body = lambda f: f.write(_caffe_model(arrays))
+        writer.submit(file_path, body)
+        return
+
     if format == 'pickle':
         state_dict = {}
         for tensor in tensors:
@@ -732,21 +1076,61 @@ def Snapshot(
             pickle.dump(state_dict, f, pickle.HIGHEST_PROTOCOL)
         _logging.info('Snapshot Model@: ' + file_path)
         _logging.info('Model Format: Pickle')
-    elif format == 'caffe':
+    elif format == 'indexed':
+        # Stream the zero-copied arrays one by one
+        arrays = [(tensor.name, get_default_workspace()
+            .TensorToArray(_stringify_tensor(tensor), True))
+                for tensor in tensors]
+        with open(file_path, 'wb') as f:
+            _serialization.save(f, arrays)
+        _logging.info('Snapshot Model@: ' + file_path)
+        _logging.info('Model Format: Indexed')
+    else:
         names = [tensor.name for tensor in tensors]
         get_default_workspace().Snapshot(file_path, names, 1)
-    else:
-        raise TypeError('Unknown binary format: ' + format)
+
+
+def _caffe_model(arrays):
+    """Serialize the arrays as the ``SavaCaffeModel`` of C++ does."""
+    from dragon.vm.caffe.proto import caffe_pb2
+    net, layers = caffe_pb2.NetParameter(), {}
+    for name, array in arrays:
+        if array.size <= 0: continue
+        layer_name = name.split('/param:')[0]
+        if layer_name not in layers:
+            layers[layer_name] = net.layer.add()
+            layers[layer_name].name = layer_name
+        blob = layers[layer_name].blobs.add()
+        blob.shape.dim.extend(array.shape)
+        if array.dtype in (numpy.float32, numpy.float16):
+            # Merge the packed ``data`` from the raw bytes,
+            # which is much faster than extending the floats one by one
+            data = array.astype('<f4').tobytes()
+            blob.MergeFromString(b'\x2a' + _varint(len(data)) + data)
+    return net.SerializeToString()
+
+
+def _varint(value):
+    """Encode the unsigned integer as the protobuf varint."""
+    buf = bytearray()
+    while value > 0x7f:
+        buf.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buf.append(value)
+    return bytes(buf)
 
 
 def Restore(binary_file, format='pickle'):
     """Restore tensors from a binary file.
 
+    The indexed file will be detected for the ``pickle`` format,
+    whose arrays are memory-mapped and fed one by one.
+
     Parameters
     ----------
     binary_file : str
         The path of binary file.
-    format : {'pickle', 'caffe'}, optional
+    format : {'pickle', 'indexed', 'caffe'}, optional
         The format of this binary file.
 
     Returns
@@ -756,7 +1140,23 @@ def Restore(binary_file, format='pickle'):
     """
     assert os.path.exists(binary_file), \
         'Binary file({}) does not exist.'.format(binary_file)
-    if format == 'pickle':
+    if format in ('pickle', 'indexed'):
+        with open(binary_file, 'rb') as f:
+            if _serialization.is_indexed(f):
+                format = 'indexed'
+                state_dict = _serialization.IndexedFile(f)
+            elif format == 'indexed':
+                raise ValueError(
+                    'Excepted an indexed file, '
+                    'got Binary file({}).'.format(binary_file))
+    if format == 'indexed':
+        _logging.info('Restore From Model@: ' + binary_file)
+        _logging.info('Model Format: Indexed')
+        for k in state_dict.keys():
+            if HasTensor(k):
+                FeedTensor(k, state_dict[k])
+                _logging.info('Tensor({}) is restored.'.format(k))
+    elif format == 'pickle':
         try:
             state_dict = pickle.load(open(binary_file, 'rb'))
         except UnicodeDecodeError:
@@ -849,7 +1249,7 @@ class _DefaultWorkspaceStack(_tls.Stack):
 _GLOBAL_DEFAULT_WORKSPACE_STACK = _DefaultWorkspaceStack()
 
 # Define some useful runtime stages
-_PREDEFINED_GRAPH_RUNTIME_STAGES = {
+_GRAPH_RUNTIME_STAGES = {
     'default': {'include': '', 'exclude': ''},
     'forward': {'include': '', 'exclude': 'Gradient'},
     'backward': {'include': 'Gradient', 'exclude': 'Generate'},
@@ -53,6 +53,50 @@ def IsGradsShared():
     return options['share_grads']
 
 
+def PlanMemory(enabled=True):
+    """Enable the liveness-based memory planning globally.
+
+    The intermediates of training graphs (-O3) are packed into
+    the shared buffers by their lifetime across forward and backward.
+
+    The sizes are inferred statically before creating the graph,
+    and the buffers are bucketed by the size class.
+
+    Note that the planned intermediates could not be fetched after running,
+    set them as the outputs of graph if necessary.
+
+    Parameters
+    ----------
+    enabled : boolean
+        Whether to plan the memory.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> import dragon.memonger as opt
+    >>> opt.PlanMemory()
+
+    """
+    options = _cfg.GetGlobalOptions()
+    options['plan_memory'] = enabled
+
+
+def IsMemoryPlanned():
+    """Is the memory planned?
+
+    Returns
+    -------
+    boolean
+        ``True`` if planning memory else ``False``.
+
+    """
+    options = _cfg.GetGlobalOptions()
+    return options['plan_memory']
+
+
 def Drop(op_func, *args, **kwargs):
     """Drop(Share) the inputs for outputs.
 
@@ -53,6 +53,8 @@ def LMDBData(**kwargs):
         The size of a mini-batch.
     partition : bool, optional, default=False
         Whether to partition batch for parallelism.
+    shard : bool, optional
+        Whether to read a disjoint part for each node of the parallel group.
     prefetch : int, optional, default=5
         The prefetch count.
 
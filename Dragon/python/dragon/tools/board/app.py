@@ -14,6 +14,7 @@ import time
 from multiprocessing import Process
 
 import dragon.core.logging as logging
+from dragon.tools.board.scalar import ScalarReader
 
 try:
     from flask import Flask, render_template, make_response, jsonify, request
@@ -66,12 +67,31 @@ class DragonBoard(Process):
             files = os.listdir(scalar_dir)
             ret = {}
             for file in files:
+                # Skip the downsampled buckets of binary logs
+                if file.count('.') > 1: continue
                 ret[file.split('.')[0]] = get_mtime(os.path.join(scalar_dir, file))
             return make_response(jsonify(ret))
 
         @app.route('/events/get_scalar', methods=['GET', 'POST'])
         def get_scalar():
             scalar_dir = os.path.join(self.config['log_dir'], 'scalar')
+            binary_file = os.path.join(scalar_dir,
+                                 request.values.get('scalar') + '.bin')
+            if os.path.exists(binary_file):
+                # Read the downsampled buckets from the binary log
+                since = request.values.get('since')
+                offset, buckets = ScalarReader(binary_file).read(
+                    int(since or 0), self.config['max_display'])
+                if since is None:
+                    return make_response(jsonify(dict(
+                        (str(b['step']), float(b['mean'])) for b in buckets)))
+                return make_response(jsonify({
+                    'offset': offset,
+                    'step': buckets['step'].tolist(),
+                    'min': buckets['min'].tolist(),
+                    'max': buckets['max'].tolist(),
+                    'mean': buckets['mean'].tolist(),
+                }))
             require_file = os.path.join(scalar_dir,
                                  request.values.get('scalar') + '.txt')
             if not os.path.exists(require_file): return
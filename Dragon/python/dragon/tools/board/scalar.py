@@ -0,0 +1,225 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""The append-only binary log of scalars.
+
+Each scalar is logged into ``<name>.bin`` as the fixed-size records,
+thus the i-th point is indexed at ``i * RECORD.itemsize``.
+
+The buckets of ``RESOLUTIONS`` points are reduced when completed,
+and appended into ``<name>.bin.<resolution>`` for downsampling.
+
+The DragonBoard prefers the binary log to the legacy ``<name>.txt``,
+log the scalars into the same ``log_dir`` to enable it:
+
+>>> writer = ScalarWriter(log_dir='logs')
+>>> writer.add_scalar('loss', loss, step=iter)
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import numpy
+
+
+RECORD = numpy.dtype([('step', '<i8'), ('value', '<f8')])
+BUCKET = numpy.dtype([('step', '<i8'), ('min', '<f8'),
+                      ('max', '<f8'), ('mean', '<f8')])
+RESOLUTIONS = (64, 4096, 262144)
+
+
+def _count(path, dtype):
+    """Return the number of complete records."""
+    if not os.path.exists(path): return 0
+    return os.path.getsize(path) // dtype.itemsize
+
+
+def _read(path, dtype, start, stop):
+    """Read the records in [start, stop)."""
+    if stop <= start: return numpy.zeros((0,), dtype)
+    with open(path, 'rb') as f:
+        f.seek(start * dtype.itemsize)
+        return numpy.fromfile(f, dtype, stop - start)
+
+
+def _reduce(records, size):
+    """Reduce the raw records into buckets of ``size`` points."""
+    if len(records) == 0 or size == 1:
+        buckets = numpy.zeros((len(records),), BUCKET)
+        buckets['step'] = records['step']
+        for key in ('min', 'max', 'mean'): buckets[key] = records['value']
+        return buckets
+    starts = numpy.arange(0, len(records), size)
+    values = records['value']
+    buckets = numpy.zeros((len(starts),), BUCKET)
+    buckets['step'] = records['step'][numpy.minimum(
+        starts + size, len(records)) - 1]
+    buckets['min'] = numpy.minimum.reduceat(values, starts)
+    buckets['max'] = numpy.maximum.reduceat(values, starts)
+    counts = numpy.diff(numpy.append(starts, len(records)))
+    buckets['mean'] = numpy.add.reduceat(values, starts) / counts
+    return buckets
+
+
+def _empty_stats():
+    """Return the running (min, max, sum, count) of a bucket."""
+    return [float('inf'), float('-inf'), 0., 0]
+
+
+class ScalarWriter(object):
+    """Append the scalars into the binary logs."""
+
+    def __init__(self, log_dir=''):
+        """Create a ScalarWriter.
+
+        Parameters
+        ----------
+        log_dir : str, optional
+            The log dir, defaults to ``logs`` under the current dir.
+
+        """
+        if log_dir == '':
+            log_dir = os.path.join(os.path.abspath(os.curdir), 'logs')
+        self._scalar_dir = os.path.join(log_dir, 'scalar')
+        if not os.path.exists(self._scalar_dir):
+            os.makedirs(self._scalar_dir)
+        self._logs = {}
+
+    def add_scalar(self, name, value, step):
+        """Append a point.
+
+        Parameters
+        ----------
+        name : str
+            The name of scalar.
+        value : number
+            The value.
+        step : int
+            The global step.
+
+        Returns
+        -------
+        None
+
+        """
+        if name not in self._logs: self._open(name)
+        files, pending = self._logs[name]
+        value = float(value)
+        files[0].write(numpy.array([(step, value)], RECORD).tobytes())
+        files[0].flush()
+        for i, size in enumerate(RESOLUTIONS):
+            stats = pending[i]
+            stats[0], stats[1] = min(stats[0], value), max(stats[1], value)
+            stats[2], stats[3] = stats[2] + value, stats[3] + 1
+            if stats[3] == size:
+                bucket = numpy.array([(step, stats[0],
+                    stats[1], stats[2] / size)], BUCKET)
+                files[i + 1].write(bucket.tobytes())
+                files[i + 1].flush()
+                pending[i] = _empty_stats()
+
+    def close(self):
+        """Close all the opened logs.
+
+        Returns
+        -------
+        None
+
+        """
+        for files, _ in self._logs.values():
+            for f in files: f.close()
+        self._logs = {}
+
+    def _open(self, name):
+        """Open a log, and recover the incomplete buckets."""
+        path = os.path.join(self._scalar_dir, name + '.bin')
+        count = _count(path, RECORD)
+        if os.path.exists(path):
+            # Drop the truncated record if crashed
+            with open(path, 'ab') as f: f.truncate(count * RECORD.itemsize)
+        files, pending = [open(path, 'ab')], []
+        for size in RESOLUTIONS:
+            bucket_path = '{}.{}'.format(path, size)
+            num_buckets = count // size
+            buckets = _reduce(_read(path, RECORD,
+                0, num_buckets * size), size)
+            with open(bucket_path, 'wb') as f: f.write(buckets.tobytes())
+            files.append(open(bucket_path, 'ab'))
+            tail = _read(path, RECORD, num_buckets * size, count)
+            pending.append(_empty_stats() if len(tail) == 0 else
+                [tail['value'].min(), tail['value'].max(),
+                 tail['value'].sum(), len(tail)])
+        self._logs[name] = (files, pending)
+
+
+class ScalarReader(object):
+    """Read the downsampled points from a binary log."""
+
+    def __init__(self, path):
+        """Create a ScalarReader.
+
+        Parameters
+        ----------
+        path : str
+            The path of ``<name>.bin``.
+
+        """
+        self._path = path
+
+    def __len__(self):
+        return _count(self._path, RECORD)
+
+    def read(self, since=0, max_display=1000):
+        """Read the points after the given offset.
+
+        The completed buckets of the smallest sufficient resolution are used,
+        and the remaining points are reduced on the fly.
+
+        Parameters
+        ----------
+        since : int, optional, default=0
+            The offset of the first point.
+        max_display : int, optional, default=1000
+            The max number of points roughly.
+
+        Returns
+        -------
+        tuple
+            The next offset, and the buckets of ``(step, min, max, mean)``.
+
+        """
+        count = len(self)
+        since = max(0, min(since, count))
+        size = 1
+        for resolution in RESOLUTIONS:
+            if (count - since) // size <= max_display: break
+            size = resolution
+        if size == 1:
+            return count, _reduce(_read(
+                self._path, RECORD, since, count), 1)
+        # The buckets are aligned to the beginning of log,
+        # use the first one starting after ``since``
+        bucket_path = '{}.{}'.format(self._path, size)
+        num_buckets = min(_count(bucket_path, BUCKET), count // size)
+        first = min((since + size - 1) // size, num_buckets)
+        buckets = _read(bucket_path, BUCKET, first, num_buckets)
+        # The points before the first bucket and after the last one
+        # are reduced on the fly, both clipped to ``since``
+        head = _read(self._path, RECORD, since, max(since, first * size))
+        tail = _read(self._path, RECORD,
+            max(since, num_buckets * size), count)
+        tail_size = RESOLUTIONS[RESOLUTIONS.index(size) - 1] \
+            if size != RESOLUTIONS[0] else 1
+        return count, numpy.concatenate([_reduce(head, tail_size),
+            buckets, _reduce(tail, tail_size)])
@@ -20,6 +20,10 @@ def wrapper_str(raw_str):
     return raw_str
 
 
+# The keys of meta records, which should be skipped
+_META_KEYS = frozenset([wrapper_str('size'), wrapper_str('zfill')])
+
+
 class LMDB(object):
     """A wrapper of ``LMDB`` package.
 
@@ -63,7 +67,7 @@ class LMDB(object):
         self._total_size = 0
         self._buffer = []
 
-    def open(self, database_path, mode='r'):
+    def open(self, database_path, mode='r', readahead=True):
         """Open the database.
 
         Parameters
@@ -72,15 +76,22 @@ class LMDB(object):
             The path of the LMDB database.
         mode : str
             The mode. ``r`` or ``w``.
+        readahead : bool
+            Whether to hint the OS to readahead pages.
 
         Returns
         -------
         None
 
+        Notes
+        -----
+        Disable the ``readahead`` for random reads if *Database Size* >> *RAM Size*.
+
         """
         if mode == 'r':
             assert os.path.exists(database_path), 'database path is not exist'
-            self.env = lmdb.open(database_path, readonly=True, lock=False)
+            self.env = lmdb.open(database_path, readonly=True,
+                                 lock=False, readahead=readahead)
             self._total_size = self.env.info()['map_size']
         if mode == 'w':
             self.env = lmdb.open(database_path, writemap=True)
@@ -190,9 +201,37 @@ class LMDB(object):
         """
         if not self.cursor.next():
             self.cursor.first()
-        if self.key() == 'size' or self.key() == 'zfill':
+        if self.key() in _META_KEYS:
             self.next()
 
+    def read(self, count):
+        """Read the values from the cursor, and step over them.
+
+        Parameters
+        ----------
+        count : int
+            The number of values to read.
+
+        Returns
+        -------
+        list of str
+            The values.
+
+        """
+        values = []
+        while len(values) < count:
+            for key, value in self.cursor.iternext():
+                if key in _META_KEYS: continue
+                values.append(value)
+                if len(values) == count: break
+            else:
+                # Rewind if reaching the end
+                self.cursor.first()
+                continue
+            if not self.cursor.next():
+                self.cursor.first()
+        return values
+
     def key(self):
         """Get the key under the current cursor.
 
@@ -0,0 +1,341 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""Serve a graph with the dynamic batching.
+
+Each worker holds a workspace with its own graph,
+the concurrent requests are coalesced into a batch,
+and scattered after running the graph.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import six
+import time
+import threading
+import numpy
+from collections import deque
+from six.moves import queue as _queue
+
+from dragon.core import scope as _scope
+from dragon.core import workspace as _workspace
+from dragon.vm.theano.compile.function import Function as _Function
+
+
+class _Request(object):
+    """The pending request, waited as a future."""
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.size = inputs[0].shape[0]
+        self.outputs = self.error = None
+        self.start_time = time.time()
+        self._done = threading.Event()
+
+    def set_result(self, outputs=None, error=None):
+        self.outputs, self.error = outputs, error
+        self._done.set()
+
+    def result(self, timeout=None):
+        """Wait and return the outputs.
+
+        Parameters
+        ----------
+        timeout : number, optional
+            The seconds to wait.
+
+        Returns
+        -------
+        sequence of numpy.ndarray
+            The outputs.
+
+        """
+        if not self._done.wait(timeout):
+            raise RuntimeError('Timeout to wait the request.')
+        if self.error is not None: raise self.error
+        return self.outputs
+
+
+class InferenceServer(object):
+    """Serve a ``GraphDef`` or ONNX model with the dynamic batching.
+
+    Examples
+    --------
+    >>> server = InferenceServer('model.onnx', num_workers=2).start()
+    >>> outputs = server.run([images])
+    >>> print(server.stats())
+
+    """
+    def __init__(
+        self,
+        model,
+        num_workers=1,
+        max_batch_size=32,
+        timeout=0.005,
+        device_ids=None,
+        init_func=None,
+    ):
+        """Create an InferenceServer.
+
+        The parameters of ``GraphDef`` are copied from the current workspace,
+        unless ``init_func`` is given to feed them for each worker.
+
+        Parameters
+        ----------
+        model : GraphDef or str
+            The graph def, or the path of ONNX model.
+        num_workers : int, optional, default=1
+            The number of workers.
+        max_batch_size : int, optional, default=32
+            The max number of samples in a batch.
+        timeout : number, optional, default=0.005
+            The max seconds to wait for coalescing.
+        device_ids : sequence of int, optional
+            The cuda devices to assign the workers.
+        init_func : function, optional
+            The function to feed the parameters.
+
+        """
+        self._model = model
+        self._num_workers = num_workers
+        self._max_batch_size = max_batch_size
+        self._timeout = timeout
+        self._device_ids = device_ids
+        self._init_func = init_func
+        self._params = {}
+        if init_func is None and not isinstance(model, six.string_types):
+            self._params = self._fetch_params(model)
+        self._queue, self._workers = _queue.Queue(), []
+        self._input_names = None
+        self._ready = threading.Condition()
+        self._num_ready, self._load_errors = 0, []
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=10000)
+        self._batch_sizes = deque(maxlen=10000)
+        self._num_requests = self._num_samples = 0
+        self._start_time = None
+
+    @staticmethod
+    def _fetch_params(graph_def):
+        """Fetch the leaf tensors except the inputs."""
+        params, outputs = {}, set()
+        for op in graph_def.op:
+            for name in op.input:
+                if name not in outputs and name not in params and \
+                        name not in graph_def.input and \
+                            _workspace.HasTensor(name):
+                    params[name] = _workspace.FetchTensor(name)
+            outputs.update(op.output)
+        return params
+
+    def start(self):
+        """Start the workers.
+
+        Returns
+        -------
+        InferenceServer
+            The self.
+
+        """
+        if len(self._workers) > 0: return self
+        self._start_time = time.time()
+        self._num_ready, self._load_errors = 0, []
+        for i in range(self._num_workers):
+            worker = threading.Thread(target=self._run, args=(i,))
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+        # Wait for all the workers, either loaded or failed
+        with self._ready:
+            while self._num_ready < len(self._workers):
+                self._ready.wait()
+        if len(self._load_errors) > 0:
+            self.stop()
+            raise self._load_errors[0]
+        return self
+
+    def stop(self):
+        """Stop the workers after the pending requests.
+
+        Returns
+        -------
+        None
+
+        """
+        for _ in self._workers: self._queue.put(None)
+        for worker in self._workers: worker.join()
+        # Drop the stop signals left by the failed workers
+        self._workers, self._queue = [], _queue.Queue()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def submit(self, inputs):
+        """Submit a request without waiting.
+
+        Parameters
+        ----------
+        inputs : sequence or dict of numpy.ndarray
+            The inputs, batched along the first axis.
+
+        Returns
+        -------
+        object
+            The future, call ``result()`` to wait the outputs.
+
+        """
+        if len(self._workers) == 0:
+            raise RuntimeError('The server is not started.')
+        if isinstance(inputs, dict):
+            inputs = [inputs[name] for name in self._input_names]
+        if len(inputs) != len(self._input_names):
+            raise ValueError('Excepted {} inputs, got {}.'.format(
+                len(self._input_names), len(inputs)))
+        request = _Request([numpy.asarray(e) for e in inputs])
+        self._queue.put(request)
+        return request
+
+    def run(self, inputs, timeout=None):
+        """Submit a request and wait the outputs.
+
+        Parameters
+        ----------
+        inputs : sequence or dict of numpy.ndarray
+            The inputs, batched along the first axis.
+        timeout : number, optional
+            The seconds to wait.
+
+        Returns
+        -------
+        sequence of numpy.ndarray
+            The outputs.
+
+        """
+        return self.submit(inputs).result(timeout)
+
+    def stats(self):
+        """Return the statistics of latency and throughput.
+
+        Returns
+        -------
+        dict
+            The statistics.
+
+        """
+        with self._lock:
+            latencies = numpy.array(self._latencies, 'float64') * 1000.
+            batch_sizes = numpy.array(self._batch_sizes, 'float64')
+            num_requests, num_samples = self._num_requests, self._num_samples
+        elapsed = time.time() - self._start_time if self._start_time else 0.
+        stats = {
+            'requests': num_requests,
+            'samples': num_samples,
+            'throughput': num_samples / elapsed if elapsed > 0 else 0.,
+            'batch_size': float(batch_sizes.mean()) if len(batch_sizes) else 0.,
+        }
+        for p in (50, 90, 99):
+            stats['latency_p{}'.format(p)] = float(
+                numpy.percentile(latencies, p)) if len(latencies) else 0.
+        return stats
+
+    def _load(self):
+        """Load the graph into the current workspace."""
+        if isinstance(self._model, six.string_types):
+            from dragon.vm.onnx import import_to_graph_def
+            graph_def = import_to_graph_def(self._model)
+        else:
+            graph_def = type(self._model)()
+            graph_def.CopyFrom(self._model)
+        for name, value in self._params.items():
+            _workspace.FeedTensor(name, value)
+        if self._init_func is not None: self._init_func()
+        function = _Function(name='serving').import_from(
+            graph_def, explicit_inputs=True)
+        if self._input_names is None:
+            self._input_names = [e.name for e in function.inputs]
+        return function
+
+    def _next_batch(self, carry):
+        """Coalesce the requests into a batch."""
+        batch = [carry] if carry is not None else []
+        if len(batch) == 0:
+            request = self._queue.get()
+            if request is None: return None, None
+            batch.append(request)
+        size = batch[0].size
+        deadline = batch[0].start_time + self._timeout
+        while size < self._max_batch_size:
+            try:
+                request = self._queue.get(
+                    timeout=max(deadline - time.time(), 0.))
+            except _queue.Empty:
+                break
+            if request is None:
+                # Stop after the current batch
+                self._queue.put(None)
+                break
+            if size + request.size > self._max_batch_size:
+                return batch, request
+            batch.append(request)
+            size += request.size
+        return batch, None
+
+    def _run(self, worker_id):
+        with _workspace.Workspace().as_default():
+            if self._device_ids:
+                device_id = self._device_ids[worker_id % len(self._device_ids)]
+                with _scope.device_scope('cuda', device_id): self._serve()
+            else:
+                self._serve()
+
+    def _serve(self):
+        try:
+            function = self._load()
+        except Exception as e:
+            with self._ready: self._load_errors.append(e)
+            return
+        finally:
+            with self._ready:
+                self._num_ready += 1
+                self._ready.notify_all()
+        carry = None
+        while True:
+            batch, carry = self._next_batch(carry)
+            if batch is None: break
+            self._run_batch(function, batch)
+
+    def _run_batch(self, function, batch):
+        try:
+            inputs = [numpy.concatenate([r.inputs[i] for r in batch])
+                if len(batch) > 1 else batch[0].inputs[i]
+                    for i in range(len(self._input_names))]
+            outputs = function(*inputs)
+            if not isinstance(outputs, list): outputs = [outputs]
+            splits = numpy.cumsum([r.size for r in batch])[:-1]
+            outputs = [numpy.split(e, splits) for e in outputs]
+        except Exception as e:
+            for request in batch: request.set_result(error=e)
+            return
+        end_time = time.time()
+        with self._lock:
+            for i, request in enumerate(batch):
+                self._latencies.append(end_time - request.start_time)
+            self._batch_sizes.append(sum(r.size for r in batch))
+            self._num_requests += len(batch)
+            self._num_samples += sum(r.size for r in batch)
+        for i, request in enumerate(batch):
+            request.set_result([e[i] for e in outputs])
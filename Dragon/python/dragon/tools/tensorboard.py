@@ -18,23 +18,154 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import os
 import time
-import logging
+import socket
+import struct
+import threading
 import numpy as np
 import PIL.Image
+from io import BytesIO
+from six.moves import queue as _queue
+
+from dragon.proto import summary_pb2 as _proto_def
+
 try:
-    from StringIO import StringIO  # Python 2.7
+    from crc32c import crc32c as _crc32c
 except ImportError:
-    from io import BytesIO  # Python 3.x
-try:
-    import tensorflow as tf
-except ImportError as e:
-    logging.warning(
-        'Cannot import tensorflow. Error: {0}'.format(str(e)))
+    _crc32c = None
+
+
+def _make_crc32c_table():
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _make_crc32c_table()
+
+
+def _masked_crc32c(data):
+    """Return the masked crc32c used by the record framing."""
+    if _crc32c is not None:
+        crc = _crc32c(data)
+    else:
+        crc, table = 0xFFFFFFFF, _CRC32C_TABLE
+        for byte in bytearray(data):
+            crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        crc ^= 0xFFFFFFFF
+    return (((crc >> 15) | (crc << 17)) + 0xA282EAD8) & 0xFFFFFFFF
+
+
+def _make_record(data):
+    """Frame the data as a record of event file."""
+    header = struct.pack('<Q', len(data))
+    return b''.join([
+        header, struct.pack('<I', _masked_crc32c(header)),
+        data, struct.pack('<I', _masked_crc32c(data)),
+    ])
+
+
+class EventFileWriter(object):
+    """Write the events in a background thread.
+
+    The serialized events are buffered in a bounded queue,
+    framed by the background thread, and flushed into the file
+    every ``flush_secs`` seconds.
+
+    """
+    def __init__(self, log_dir, max_queue=1024, flush_secs=2):
+        """Create an EventFileWriter.
+
+        Parameters
+        ----------
+        log_dir : str
+            The dir to write the event file.
+        max_queue : int, optional, default=1024
+            The max number of pending events.
+        flush_secs : number, optional, default=2
+            The interval to flush the file.
+
+        """
+        if not os.path.exists(log_dir): os.makedirs(log_dir)
+        self._path = os.path.join(log_dir, 'events.out.tfevents.{}.{}'
+            .format(int(time.time()), socket.gethostname()))
+        self._file = open(self._path, 'wb')
+        self._queue = _queue.Queue(max_queue)
+        self._flush_secs = flush_secs
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+        self.add_event(_proto_def.Event(
+            wall_time=time.time(), file_version='brain.Event:2'))
+
+    def add_event(self, event):
+        """Add an event to write.
+
+        Parameters
+        ----------
+        event : Event
+            The event.
+
+        Returns
+        -------
+        None
+
+        """
+        # Frame the record in the background, as the crc32c
+        # fallback of pure Python costs much for the large events
+        self._queue.put(event.SerializeToString())
+
+    def flush(self):
+        """Wait for the pending events and flush the file.
+
+        Returns
+        -------
+        None
+
+        """
+        self._queue.join()
+        self._file.flush()
+
+    def close(self):
+        """Flush the pending events and close the file.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._thread is None: return
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        self._thread = None
+
+    def _run(self):
+        last_flush = time.time()
+        while True:
+            try:
+                data = self._queue.get(timeout=self._flush_secs)
+            except _queue.Empty:
+                pass
+            else:
+                if data is None:
+                    self._file.flush()
+                    self._queue.task_done()
+                    break
+                self._file.write(_make_record(data))
+                self._queue.task_done()
+            if time.time() - last_flush >= self._flush_secs:
+                self._file.flush()
+                last_flush = time.time()
 
 
 class TensorBoard(object):
-    """The board app based on TensorFlow.
+    """The board app writing the native event files.
 
     Examples
     --------
@@ -63,7 +194,7 @@ class TensorBoard(object):
         if log_dir is None:
             log_dir = './logs/' + time.strftime('%Y%m%d_%H%M%S',
                     time.localtime(time.time()))
-        self.writer = tf.summary.FileWriter(log_dir)
+        self.writer = EventFileWriter(log_dir)
 
     def close(self):
         """Close the board and apply all cached summaries.
@@ -75,6 +206,34 @@ class TensorBoard(object):
         """
         self.writer.close()
 
+    def flush(self):
+        """Flush all cached summaries.
+
+        Returns
+        -------
+        None
+
+        """
+        self.writer.flush()
+
+    def add_summary(self, summary, step):
+        """Write a summary.
+
+        Parameters
+        ----------
+        summary : Summary
+            The summary.
+        step : number
+            The global step.
+
+        Returns
+        -------
+        None
+
+        """
+        self.writer.add_event(_proto_def.Event(
+            wall_time=time.time(), step=int(step), summary=summary))
+
     def scalar_summary(self, tag, value, step):
         """Write a scalar variable.
 
@@ -92,8 +251,9 @@ class TensorBoard(object):
         None
 
         """
-        summary = tf.Summary(value=[tf.Summary.Value(tag=tag, simple_value=value)])
-        self.writer.add_summary(summary, step)
+        summary = _proto_def.Summary(value=[
+            _proto_def.Summary.Value(tag=tag, simple_value=float(value))])
+        self.add_summary(summary, step)
 
     def image_summary(self, tag, images, step, order='BGR'):
         """Write a list of images.
@@ -118,29 +278,26 @@ class TensorBoard(object):
         None
 
         """
+        if order == 'BGR':
+            # Flip the channels for all images at once
+            if isinstance(images, np.ndarray):
+                if images.ndim == 4: images = images[..., ::-1]
+            else:
+                images = [img[..., ::-1] if img.ndim == 3
+                          else img for img in images]
+
         img_summaries = []
         for i, img in enumerate(images):
-            # Write the image to a string
-            try:
-                s = StringIO()
-            except:
-                s = BytesIO()
-            if order == 'BGR':
-                if len(img.shape) == 3: img = img[:, :, ::-1]
-                elif len(img.shape) == 4: img = img[:, :, ::-1, :]
-
-            PIL.Image.fromarray(img).save(s, format='png')
-
-            # Create an Image object
-            img_sum = tf.Summary.Image(encoded_image_string=s.getvalue(),
-                                       height=img.shape[0],
-                                       width=img.shape[1])
-            # Create a Summary value
-            img_summaries.append(tf.Summary.Value(tag='%s/%d' % (tag, i), image=img_sum))
-
-        # Create and write Summary
-        summary = tf.Summary(value=img_summaries)
-        self.writer.add_summary(summary, step)
+            s = BytesIO()
+            PIL.Image.fromarray(np.ascontiguousarray(img)).save(s, format='png')
+            img_sum = _proto_def.Summary.Image(
+                encoded_image_string=s.getvalue(),
+                    height=img.shape[0], width=img.shape[1],
+                        colorspace=img.shape[2] if img.ndim == 3 else 1)
+            img_summaries.append(_proto_def.Summary.Value(
+                tag='%s/%d' % (tag, i), image=img_sum))
+
+        self.add_summary(_proto_def.Summary(value=img_summaries), step)
 
     def histogram_summary(self, tag, values, step, bins=1000):
         """Write a histogram of values.
@@ -162,26 +319,21 @@ class TensorBoard(object):
 
         """
         # Create a histogram using numpy
+        values = np.asarray(values, dtype='float64')
         counts, bin_edges = np.histogram(values, bins=bins)
 
         # Fill the fields of the histogram proto
-        hist = tf.HistogramProto()
-        hist.min = float(np.min(values))
-        hist.max = float(np.max(values))
-        hist.num = int(np.prod(values.shape))
-        hist.sum = float(np.sum(values))
-        hist.sum_squares = float(np.sum(values ** 2))
+        hist = _proto_def.HistogramProto()
+        hist.min = float(values.min())
+        hist.max = float(values.max())
+        hist.num = int(values.size)
+        hist.sum = float(values.sum())
+        hist.sum_squares = float(np.dot(values.ravel(), values.ravel()))
 
         # Drop the start of the first bin
-        bin_edges = bin_edges[1:]
-
-        # Add bin edges and counts
-        for edge in bin_edges:
-            hist.bucket_limit.append(edge)
-        for c in counts:
-            hist.bucket.append(c)
-
-        # Create and write Summary
-        summary = tf.Summary(value=[tf.Summary.Value(tag=tag, histo=hist)])
-        self.writer.add_summary(summary, step)
-        self.writer.flush()
\ No newline at end of file
+        hist.bucket_limit.extend(bin_edges[1:].tolist())
+        hist.bucket.extend(counts.tolist())
+
+        summary = _proto_def.Summary(value=[
+            _proto_def.Summary.Value(tag=tag, histo=hist)])
+        self.add_summary(summary, step)
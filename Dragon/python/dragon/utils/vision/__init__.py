@@ -15,5 +15,6 @@ from __future__ import print_function
 
 from .data_reader import DataReader
 from .data_transformer import DataTransformer
+from .data_transformer import BatchTransformer
 from .blob_fetcher import BlobFetcher
 from .data_batch import DataBatch
\ No newline at end of file
@@ -15,6 +15,11 @@ from __future__ import print_function
 
 import numpy
 import multiprocessing
+from multiprocessing.sharedctypes import RawValue
+
+from dragon import config as _cfg
+
+from .data_transformer import BatchTransformer
 
 
 class BlobFetcher(multiprocessing.Process):
@@ -34,15 +39,56 @@ class BlobFetcher(multiprocessing.Process):
             Whether to partition batch for parallelism.
         prefetch : int, optional, default=5
             The prefetch count.
+        batch_augmentation : bool, optional, default=False
+            Whether to augment the blobs by `BatchTransformer`_.
 
         """
         super(BlobFetcher, self).__init__()
         self._batch_size = kwargs.get('batch_size', 128)
         self._partition  = kwargs.get('partition', False)
         if self._partition: self._batch_size //= kwargs['group_size']
+        self._transformer = None
+        if kwargs.get('batch_augmentation', False):
+            self._transformer = BatchTransformer(**kwargs)
+        self._rng_seed = _cfg.GetRandomSeed()
+        self._counter = RawValue('L', 0)
         self.Q_in = self.Q_out = None
+        # The ring of shared memory slots,
+        # which is optional and set by ``DataBatch``
+        self.Q_free = self._slots = None
         self.daemon = True
 
+    def _alloc(self, shape):
+        """Return a blob to fill and the slot index.
+
+        The blob is a view of a free shared memory slot if the ring is
+        deployed, otherwise a new array.
+
+        Parameters
+        ----------
+        shape : sequence of int
+            The shape of the image blob.
+
+        Returns
+        -------
+        tuple
+            The image blob and the slot index.
+
+        """
+        if self._slots is None:
+            return numpy.empty(shape, dtype='uint8'), None
+        count = int(numpy.prod(shape))
+        slot_idx = self.Q_free.get()
+        if count > len(self._slots[slot_idx]):
+            raise RuntimeError(
+                'The image blob requires {} bytes, '
+                'while the shared memory slot has {} bytes.\n'
+                'Try to set a larger ``shm_slot_bytes``.'
+                    .format(count, len(self._slots[slot_idx])))
+        blob = numpy.frombuffer(
+            self._slots[slot_idx], dtype='uint8', count=count)
+        return blob.reshape(shape), slot_idx
+
     def get(self):
         """Return a batch with image and label blob.
 
@@ -53,11 +99,16 @@ class BlobFetcher(multiprocessing.Process):
 
         """
         im, labels = self.Q_in.get()
-        im_blob = numpy.zeros(shape=([self._batch_size] + list(im.shape)), dtype='uint8')
+        im_blob, slot_idx = self._alloc([self._batch_size] + list(im.shape))
         label_blob = numpy.zeros((self._batch_size, len(labels)), dtype='int64')
         for i in range(self._batch_size):
             im_blob[i, :, :, :], label_blob[i, :] = im, labels
             if i != self._batch_size - 1: im, labels = self.Q_in.get()
+        if self._transformer is not None:
+            self._transformer.get(im_blob)
+        if slot_idx is not None:
+            # Only the slot index and shape will be pickled
+            return slot_idx, im_blob.shape, label_blob
         return im_blob, label_blob
 
     def run(self):
@@ -68,4 +119,10 @@ class BlobFetcher(multiprocessing.Process):
         None
 
         """
-        while True: self.Q_out.put(self.get())
\ No newline at end of file
+        # Fix the random seed
+        numpy.random.seed(self._rng_seed)
+
+        # Run!
+        while True:
+            self.Q_out.put(self.get())
+            self._counter.value += 1
\ No newline at end of file
@@ -14,8 +14,11 @@ from __future__ import division
 from __future__ import print_function
 
 import time
+import threading
 
+import numpy
 from multiprocessing import Queue
+from multiprocessing.sharedctypes import RawArray
 from dragon.core import mpi as _mpi
 from dragon.core import logging as _logging
 
@@ -67,15 +70,37 @@ class DataBatch(object):
             The size of a mini-batch.
         partition : bool, optional, default=False
             Whether to partition batch for parallelism.
+        shard : bool, optional
+            Whether to read a disjoint part for each node of the parallel group.
+            Defaults to *True* for the *TRAIN* phase.
         prefetch : int, optional, default=5
             The prefetch count.
+        read_size : int, optional, default=1
+            The number of records for a reader to queue at once.
+        batch_augmentation : bool, optional, default=False
+            Whether to vectorize the cutout, mirror and color augmentation over batch.
+        num_transformers : int, optional, default=-1
+            The number of transformers, ``-1`` to use the Io-Aware policy.
+        max_transformers : int, optional, default=3
+            The max number of transformers.
+        autoscale : bool, optional, default=False
+            Whether to scale the transformers by the queue pressure.
+        min_transformers : int, optional, default=1
+            The min number of transformers for autoscaling.
+        autoscale_interval : float, optional, default=2.
+            The seconds between two samplings of the stages.
+        use_shm : bool, optional, default=False
+            Whether to transport image blobs by shared memory.
+        shm_slot_bytes : int, optional
+            The bytes of a shared memory slot.
 
         """
         super(DataBatch, self).__init__()
         # Init mpi
         global_rank, local_rank, group_size = 0, 0, 1
-        if _mpi.Is_Init() and kwargs.get(
-                'phase', 'TRAIN') == 'TRAIN':
+        shard = kwargs.get('shard', None)
+        if shard is None: shard = kwargs.get('phase', 'TRAIN') == 'TRAIN'
+        if _mpi.Is_Init() and shard:
             rank, group = _mpi.AllowParallel()
             if rank != -1: # DataParallel
                 global_rank, group_size = _mpi.Rank(), len(group)
@@ -89,12 +114,17 @@ class DataBatch(object):
         self._num_transformers = kwargs.get('num_transformers', -1)
         self._max_transformers = kwargs.get('max_transformers', 3)
         self._num_fetchers = kwargs.get('num_fetchers', 1)
+        self._use_shm = kwargs.get('use_shm', False)
+        self._autoscale = kwargs.get('autoscale', False)
+        self._min_transformers = kwargs.get('min_transformers', 1)
+        self._autoscale_interval = kwargs.get('autoscale_interval', 2.)
 
         # Io-Aware Policy
         if self._num_transformers == -1:
             self._num_transformers = 1
             # Add 1 transformer for color augmentation
-            if kwargs.get('color_augmentation', False):
+            if kwargs.get('color_augmentation', False) and \
+                not kwargs.get('batch_augmentation', False):
                 self._num_transformers += 1
             # Add 1 transformer for random scale
             if kwargs.get('max_random_scale', 1.0) - \
@@ -112,9 +142,16 @@ class DataBatch(object):
         if self._partition: self._batch_size //= kwargs['group_size']
 
         # Init queues
-        self.Q1 = Queue(self._prefetch * self._num_readers * self._batch_size)
-        self.Q2 = Queue(self._prefetch * self._num_readers * self._batch_size)
-        self.Q3 = Queue(self._prefetch * self._num_readers)
+        # Q1 holds lists of records if the bulk reading is enabled
+        read_size = kwargs.get('read_size', 1)
+        self._capacities = [
+            max(self._prefetch * self._num_readers * self._batch_size // read_size, 1),
+            self._prefetch * self._num_readers * self._batch_size,
+            self._prefetch * self._num_readers,
+        ]
+        self.Q1 = Queue(self._capacities[0])
+        self.Q2 = Queue(self._capacities[1])
+        self.Q3 = Queue(self._capacities[2])
 
         # Init readers
         self._readers = []
@@ -133,38 +170,155 @@ class DataBatch(object):
             time.sleep(0.1)
 
         # Init transformers
-        self._transformers = []
+        self._kwargs, self._local_rank = kwargs, local_rank
+        self._transformers, self._num_spawned = [], 0
+        self._retired, self._retired_count = [], 0
+        self._lock = threading.Lock()
         for i in range(self._num_transformers):
-            transformer = DataTransformer(**kwargs)
-            transformer._rng_seed += (i + local_rank * self._num_transformers)
-            transformer.Q_in, transformer.Q_out = self.Q1, self.Q2
-            transformer.start()
-            self._transformers.append(transformer)
+            self._spawn_transformer()
             time.sleep(0.1)
 
+        # Init shared memory slots
+        # Slots are recycled after the consumer gets the next batch,
+        # which requires extra slots besides the prefetched ones
+        self._slots, self._slot_idx = None, None
+        if self._use_shm:
+            slot_bytes = kwargs.get('shm_slot_bytes', None)
+            if slot_bytes is None:
+                crop_size = kwargs.get('crop_size', 0)
+                if crop_size <= 0:
+                    raise ValueError(
+                        'Excepted the ``shm_slot_bytes`` '
+                        'if ``crop_size`` is not set.')
+                slot_bytes = self._batch_size * crop_size * crop_size * 3
+            num_slots = self._prefetch * self._num_readers + self._num_fetchers + 1
+            self._slots = [RawArray('B', slot_bytes) for _ in range(num_slots)]
+            self.Q_free = Queue(num_slots)
+            for i in range(num_slots): self.Q_free.put(i)
+
         # Init blob fetchers
         self._fetchers = []
         for i in range(self._num_fetchers):
             fetcher = BlobFetcher(**kwargs)
+            fetcher._rng_seed += (i + local_rank * self._num_fetchers)
             fetcher.Q_in, fetcher.Q_out = self.Q2, self.Q3
+            if self._use_shm:
+                fetcher.Q_free, fetcher._slots = self.Q_free, self._slots
             fetcher.start()
             self._fetchers.append(fetcher)
             time.sleep(0.1)
 
+        # Init the supervisor
+        self._rates = {}
+        self._counts = self._sample_counts()
+        self._stopped = threading.Event()
+        supervisor = threading.Thread(target=self._supervise)
+        supervisor.daemon = True
+        supervisor.start()
+
         def cleanup():
             def terminate(processes):
                 for process in processes:
                     process.terminate()
                     process.join()
+            self._stopped.set()
             terminate(self._fetchers)
             if local_rank == 0: _logging.info('Terminate BlobFetcher.')
-            terminate(self._transformers)
+            with self._lock: terminate(self._transformers + self._retired)
             if local_rank == 0: _logging.info('Terminate DataTransformer.')
             terminate(self._readers)
             if local_rank == 0: _logging.info('Terminate DataReader.')
         import atexit
         atexit.register(cleanup)
 
+    def _spawn_transformer(self):
+        """Start a new transformer."""
+        transformer = DataTransformer(**self._kwargs)
+        stride = self._max_transformers \
+            if self._autoscale else self._num_transformers
+        transformer._rng_seed += (self._num_spawned + self._local_rank * stride)
+        transformer.Q_in, transformer.Q_out = self.Q1, self.Q2
+        transformer.start()
+        self._transformers.append(transformer)
+        self._num_spawned += 1
+
+    def _retire_transformer(self):
+        """Retire the latest transformer."""
+        transformer = self._transformers.pop()
+        transformer.retire()
+        self._retired.append(transformer)
+
+    def _sample_counts(self):
+        """Return the processed count of each stage."""
+        def total(processes):
+            return sum(p._counter.value for p in processes)
+        with self._lock:
+            transformers = self._transformers + self._retired
+            return {
+                'reader': total(self._readers),
+                'transformer': total(transformers) + self._retired_count,
+                'fetcher': total(self._fetchers),
+            }
+
+    def _supervise(self):
+        """Observe the rates and scale the transformers periodically."""
+        while not self._stopped.wait(self._autoscale_interval):
+            # Observe the rates
+            counts = self._sample_counts()
+            self._rates = dict((k, (counts[k] - self._counts[k])
+                / self._autoscale_interval) for k in counts)
+            self._counts = counts
+            if not self._autoscale: continue
+            # Observe the fill levels
+            try:
+                pressures = [float(q.qsize()) / c for q, c in
+                    zip((self.Q1, self.Q2, self.Q3), self._capacities)]
+            except NotImplementedError:
+                # The ``qsize`` is missing on some platforms, e.g. macOS
+                _logging.warning('Queue sizes are unavailable, stop autoscaling.')
+                return
+            # Readers are ahead while fetchers starve, add a transformer
+            # Transformers are ahead of fetchers, retire a transformer
+            with self._lock:
+                for p in self._retired:
+                    if not p.is_alive():
+                        self._retired_count += p._counter.value
+                self._retired = [p for p in self._retired if p.is_alive()]
+                num_transformers = len(self._transformers)
+                if pressures[0] > 0.8 and pressures[1] < 0.2 and \
+                        pressures[2] < 0.5 and num_transformers < self._max_transformers:
+                    self._spawn_transformer()
+                elif pressures[1] > 0.8 and num_transformers > self._min_transformers:
+                    self._retire_transformer()
+                self._num_transformers = len(self._transformers)
+
+    @property
+    def num_transformers(self):
+        """Return the number of running transformers.
+
+        Returns
+        -------
+        int
+            The number of transformers.
+
+        """
+        return self._num_transformers
+
+    def rates(self):
+        """Return the observed rates of each stage.
+
+        The rates are records per second for readers and transformers,
+
+        and batches per second for fetchers.
+
+        Returns
+        -------
+        dict
+            The rates, keyed by ``reader``, ``transformer`` and ``fetcher``.
+
+        """
+        return self._rates
+
     def get(self):
         """Get a batch.
 
@@ -173,5 +327,19 @@ class DataBatch(object):
         tuple
             The batch, representing data and labels respectively.
 
+        Notes
+        -----
+        If ``use_shm`` is set, the data will be a view of shared memory,
+
+        which is only valid until the next call.
+
         """
-        return self.Q3.get()
\ No newline at end of file
+        if not self._use_shm: return self.Q3.get()
+        slot_idx, shape, labels = self.Q3.get()
+        # Recycle the slot returned last time
+        if self._slot_idx is not None: self.Q_free.put(self._slot_idx)
+        self._slot_idx = slot_idx
+        count = int(numpy.prod(shape))
+        im_blob = numpy.frombuffer(
+            self._slots[slot_idx], dtype='uint8', count=count)
+        return im_blob.reshape(shape), labels
\ No newline at end of file
@@ -16,6 +16,7 @@ from __future__ import print_function
 import math
 import numpy
 import multiprocessing
+from multiprocessing.sharedctypes import RawValue
 
 from dragon import config as _cfg
 from dragon.tools import db as _db
@@ -38,15 +39,20 @@ class DataReader(multiprocessing.Process):
             Whether to shuffle the data.
         num_chunks : int, optional, default=2048
             The number of chunks to split.
+        read_size : int, optional, default=1
+            The number of records to read and queue as a list.
 
         """
         super(DataReader, self).__init__()
         self._source = kwargs.get('source', '')
         self._use_shuffle = kwargs.get('shuffle', False)
         self._num_chunks = kwargs.get('num_chunks', 2048)
+        self._read_size = kwargs.get('read_size', 1)
+        self._readahead = True
         self._part_idx, self._num_parts = 0, 1
         self._cursor, self._chunk_cursor = 0, 0
         self._rng_seed = _cfg.GetRandomSeed()
+        self._counter = RawValue('L', 0)
         self.Q_out = None
         self.daemon = True
 
@@ -61,6 +67,20 @@ class DataReader(multiprocessing.Process):
         """
         return self._db.value()
 
+    def elements(self):
+        """Get the values of records until the tail.
+
+        Returns
+        -------
+        list of str
+            The encoded strs.
+
+        """
+        count = min(self._read_size, self._tail - self._cursor)
+        values = self._db.read(count)
+        self._cursor += count
+        return values
+
     def redirect(self, target):
         """Redirect to the target position.
 
@@ -83,7 +103,7 @@ class DataReader(multiprocessing.Process):
 
         """
         self._db.close()
-        self._db.open(self._source)
+        self._db.open(self._source, readahead=self._readahead)
         self._cursor = target
         self._db.set(str(target).zfill(self._zfill))
 
@@ -184,13 +204,22 @@ class DataReader(multiprocessing.Process):
 
         self._perm = numpy.arange(self._perm_size)
 
+        # Readahead is wasted on walking the Record-Wise chunks
+        self._readahead = self._chunk_size > 1
+
         # Init env
         self.reset()
 
         # Run!
         while True:
-            self.Q_out.put(self.element())
-            self.next_record()
+            if self._read_size > 1:
+                values = self.elements()
+                self.Q_out.put(values)
+                self._counter.value += len(values)
+            else:
+                self.Q_out.put(self.element())
+                self._counter.value += 1
+                self.next_record()
             if self._cursor >= self._tail:
                 if self._num_parts > 1 or self._use_shuffle:
                     self.next_chunk()
@@ -15,6 +15,7 @@ from __future__ import print_function
 
 import numpy
 import multiprocessing
+from multiprocessing.sharedctypes import RawValue
 
 from dragon import config as _cfg
 from dragon.vm.caffe.proto import caffe_pb2 as _proto_def
@@ -61,6 +62,8 @@ class DataTransformer(multiprocessing.Process):
             Set not to duplicate channel for gray.
         phase : {'TRAIN', 'TEST'}, optional
             The optional running phase.
+        batch_augmentation : bool, optional, default=False
+            Whether to leave cutout, mirror and color augmentation to `BatchTransformer`_.
 
         """
         super(DataTransformer, self).__init__()
@@ -74,7 +77,10 @@ class DataTransformer(multiprocessing.Process):
         self._max_rand_scale = kwargs.get('max_random_scale', 1.0)
         self._force_color = kwargs.get('force_color', False)
         self._phase = kwargs.get('phase', 'TRAIN')
+        self._batch_aug = kwargs.get('batch_augmentation', False)
         self._rng_seed = _cfg.GetRandomSeed()
+        self._counter = RawValue('L', 0)
+        self._retire = multiprocessing.Event()
         self.Q_in = self.Q_out = None
         self.daemon = True
 
@@ -135,6 +141,20 @@ class DataTransformer(multiprocessing.Process):
             im = im[h_off : h_off + self._crop_size,
                     w_off : w_off + self._crop_size, :]
 
+        # Extract Labels
+        labels = []
+        if len(datum.labels) > 0: labels.extend(datum.labels)
+        else: labels.append(datum.label)
+
+        # Gray Transformation
+        if self._force_color:
+            if im.shape[2] == 1:
+                # Duplicate to 3 channels
+                im = numpy.concatenate([im, im, im], axis=2)
+
+        # Leave the remaining to the BatchTransformer
+        if self._batch_aug: return im, labels
+
         # CutOut
         if self._cutout_size > 0:
             h, w = im.shape[:2]
@@ -151,12 +171,6 @@ class DataTransformer(multiprocessing.Process):
             if numpy.random.randint(0, 2) > 0:
                 im = im[:, ::-1, :]
 
-        # Gray Transformation
-        if self._force_color:
-            if im.shape[2] == 1:
-                # Duplicate to 3 channels
-                im = numpy.concatenate([im, im, im], axis=2)
-
         # Color Augmentation
         if self._color_aug:
             im = PIL.Image.fromarray(im)
@@ -171,11 +185,6 @@ class DataTransformer(multiprocessing.Process):
             im = im.enhance(delta_saturation)
             im = numpy.array(im)
 
-        # Extract Labels
-        labels = []
-        if len(datum.labels) > 0: labels.extend(datum.labels)
-        else: labels.append(datum.label)
-
         return im, labels
 
     def run(self):
@@ -190,6 +199,110 @@ class DataTransformer(multiprocessing.Process):
         numpy.random.seed(self._rng_seed)
 
         # Run!
-        while True:
+        while not self._retire.is_set():
             serialized = self.Q_in.get()
-            self.Q_out.put(self.get(serialized))
\ No newline at end of file
+            if isinstance(serialized, list):
+                # A list of records from the bulk reading
+                for element in serialized:
+                    self.Q_out.put(self.get(element))
+                self._counter.value += len(serialized)
+            else:
+                self.Q_out.put(self.get(serialized))
+                self._counter.value += 1
+
+    def retire(self):
+        """Stop the process after the current record.
+
+        Returns
+        -------
+        None
+
+        """
+        self._retire.set()
+
+
+class BatchTransformer(object):
+    """BatchTransformer is deployed to augment the image blobs from `BlobFetcher`_.
+
+    The cutout, mirror and color augmentation are vectorized over the *NHWC* blob.
+
+    """
+    def __init__(self, **kwargs):
+        """Construct a ``BatchTransformer``.
+
+        Parameters
+        ----------
+        fill_value : int or sequence, optional, default=127
+            The value(s) to fill for cutout.
+        cutout_size : int, optional, default=0
+            The square size to cutout.
+        mirror : bool, optional, default=False
+            Whether to mirror(flip horizontally) images.
+        color_augmentation : bool, optional, default=False
+            Whether to use color distortion.
+
+        """
+        self._fill_value = kwargs.get('fill_value', 127)
+        self._cutout_size = kwargs.get('cutout_size', 0)
+        self._mirror = kwargs.get('mirror', False)
+        self._color_aug = kwargs.get('color_augmentation', False)
+
+    @staticmethod
+    def _blend(im1, im2, factor):
+        """Blend two float images, clipped as the ``PIL.ImageEnhance``."""
+        return numpy.clip(im2 + factor * (im1 - im2), 0., 255.)
+
+    @staticmethod
+    def _luminance(im):
+        """Convert to the gray image, weighted as the ``PIL.Image.convert``."""
+        return numpy.dot(im, [0.299, 0.587, 0.114])[..., None]
+
+    def get(self, im_blob):
+        """Augment the image blob in-place.
+
+        Parameters
+        ----------
+        im_blob : numpy.ndarray
+            The *NHWC* uint8 image blob.
+
+        Returns
+        -------
+        numpy.ndarray
+            The augmented image blob.
+
+        """
+        N, H, W, C = im_blob.shape
+
+        # CutOut
+        if self._cutout_size > 0:
+            half = self._cutout_size // 2
+            y = numpy.random.randint(H, size=N)[:, None]
+            x = numpy.random.randint(W, size=N)[:, None]
+            rows, cols = numpy.arange(H)[None, :], numpy.arange(W)[None, :]
+            y_mask = (rows >= y - half) & (rows < y + half)
+            x_mask = (cols >= x - half) & (cols < x + half)
+            im_blob[y_mask[:, :, None] & x_mask[:, None, :]] = self._fill_value
+
+        # Random mirror
+        if self._mirror:
+            flip = numpy.random.randint(0, 2, size=N) > 0
+            im_blob[flip] = im_blob[flip, :, ::-1, :]
+
+        # Color Augmentation
+        if self._color_aug:
+            deltas = numpy.random.uniform(-0.4, 0.4, size=(3, N, 1, 1, 1)) + 1.0
+            im = im_blob.astype('float32')
+            # Brightness: blend with the black image
+            im = self._blend(im, 0., deltas[0])
+            if C == 3:
+                # Contrast: blend with the mean of gray image
+                mean = self._luminance(im).mean(axis=(1, 2, 3), keepdims=True)
+                im = self._blend(im, numpy.floor(mean + 0.5), deltas[1])
+                # Saturation: blend with the gray image
+                im = self._blend(im, self._luminance(im), deltas[2])
+            else:
+                mean = im.mean(axis=(1, 2, 3), keepdims=True)
+                im = self._blend(im, numpy.floor(mean + 0.5), deltas[1])
+            im_blob[:] = im
+
+        return im_blob
\ No newline at end of file
@@ -20,6 +20,10 @@ from dragon.tools import db as _db
 from dragon.vm.caffe.proto import caffe_pb2 as _proto_def
 
 
+# The options of encoding, set for each worker
+_options = {}
+
+
 def resize_image(im, resize):
     """Resize the image by the shortest edge.
 
@@ -43,6 +47,46 @@ def resize_image(im, resize):
     return cv2.resize(im, new_size, interpolation=cv2.INTER_LINEAR)
 
 
+def encode_image(record):
+    """Read, resize and encode the image of a record.
+
+    Parameters
+    ----------
+    record : str
+        The line of image list file.
+
+    Returns
+    -------
+    str
+        The serialized datum.
+
+    """
+    path, label = record.split()[:2]
+    img = cv2.imread(os.path.join(_options['root'], path))
+    if _options['resize'] > 0:
+        img = resize_image(img, _options['resize'])
+    result, imgencode = cv2.imencode('.jpg', img, _options['encode_param'])
+    datum = _proto_def.Datum()
+    datum.height, datum.width, datum.channels = img.shape
+    datum.label = int(label)
+    datum.encoded = True
+    datum.data = imgencode.tostring()
+    return datum.SerializeToString()
+
+
+def _init_options(options):
+    """Set the options for workers."""
+    global _options
+    _options = options
+
+
+def _save_checkpoint(path, count, seed):
+    """Write the checkpoint atomically."""
+    with open(path + '.tmp', 'w') as f:
+        f.write('{0} {1}'.format(count, seed))
+    os.rename(path + '.tmp', path)
+
+
 def make_db(args):
     """Make the sequential database for images.
 
@@ -62,11 +106,28 @@ def make_db(args):
         JPEG quality for encoding, 1-100. Default is ``95``.
     shuffle : boolean
         Whether to randomize the order in list file.
+    seed : int
+        The seed to shuffle the list file. Default is ``1337``.
+    num_workers : int
+        The number of processes to encode images. Default is ``1``.
+    resume : boolean
+        Whether to resume from the checkpoint of database. Default is ``False``.
 
     """
     if os.path.isfile(args.list) is False:
         raise ValueError('the path of image list is invalid.')
-    if os.path.isdir(args.database) is True:
+
+    # The options introduced later are optional for the old callers
+    num_workers = getattr(args, 'num_workers', 1)
+    resume = getattr(args, 'resume', False)
+
+    # The checkpoint records the committed count and the shuffling seed
+    checkpoint = args.database + '.checkpoint'
+    count, seed = 0, getattr(args, 'seed', 1337)
+    if resume and os.path.isfile(checkpoint):
+        with open(checkpoint, 'r') as f:
+            count, seed = [int(e) for e in f.read().split()]
+    elif os.path.isdir(args.database) is True:
         raise ValueError('the database is already exist or invalid.')
 
     print('start time: ', time.strftime("%a, %d %b %Y %H:%M:%S", time.gmtime()))
@@ -75,10 +136,22 @@ def make_db(args):
     db.open(args.database, mode='w')
 
     total_line = sum(1 for line in open(args.list))
-    count = 0
     zfill_flag = '{0:0%d}' % (args.zfill)
 
-    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), args.quality]
+    options = {
+        'root': args.root,
+        'resize': args.resize,
+        'encode_param': [int(cv2.IMWRITE_JPEG_QUALITY), args.quality],
+    }
+
+    # Encode images by the pool if necessary
+    # The results are ordered, and bounded by the commit interval
+    _init_options(options)
+    pool = None
+    if num_workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(
+            num_workers, _init_options, (options,))
 
     start_time = time.time()
 
@@ -86,41 +159,40 @@ def make_db(args):
         records = input_file.readlines()
         if args.shuffle:
             import random
-            random.shuffle(records)
-
-        for record in records:
-            count += 1
-            if count % 10000 == 0:
-                now_time = time.time()
-                print('{0} / {1} in {2:.2f} sec'.format(
-                    count, total_line, now_time - start_time))
-                db.commit()
-
-            record = record.split()
-            path = record[0]
-            label = record[1]
-
-            img = cv2.imread(os.path.join(args.root, path))
-            if args.resize > 0:
-                img = resize_image(img, args.resize)
-            result, imgencode = cv2.imencode('.jpg', img, encode_param)
-
-            datum = _proto_def.Datum()
-            datum.height, datum.width, datum.channels = img.shape
-            datum.label = int(label)
-            datum.encoded = True
-            datum.data = imgencode.tostring()
-            db.put(zfill_flag.format(count - 1), datum.SerializeToString())
-
-    now_time = time.time()
-    print('{0} / {1} in {2:.2f} sec'.format(count, total_line, now_time - start_time))
-    db.commit()
+            random.Random(seed).shuffle(records)
+
+        if count > 0:
+            print('resume from {0} / {1}'.format(count, total_line))
+
+        commit_interval = 10000
+        while count < len(records):
+            chunk = records[count:count + commit_interval]
+            if pool is not None:
+                chunksize = max(len(chunk) // (num_workers * 4), 1)
+                results = pool.imap(encode_image, chunk, chunksize)
+            else:
+                results = (encode_image(record) for record in chunk)
+            for serialized in results:
+                db.put(zfill_flag.format(count), serialized)
+                count += 1
+            db.commit()
+            _save_checkpoint(checkpoint, count, seed)
+            now_time = time.time()
+            print('{0} / {1} in {2:.2f} sec'.format(
+                count, total_line, now_time - start_time))
+
+    if pool is not None:
+        pool.close()
+        pool.join()
+
     db.close()
 
     # Compress the empty space
     db.open(args.database, mode='w')
     db.commit()
 
+    # The checkpoint is not written for an empty list
+    if os.path.exists(checkpoint): os.remove(checkpoint)
     shutil.copy(args.list, args.database + '/image_list.txt')
     end_time = time.time()
     print('{0} images have been stored in the database.'.format(total_line))
@@ -138,6 +210,9 @@ def parse_args():
     parser.add_argument('--resize', type=int, default=0, help='The size of the shortest edge.')
     parser.add_argument('--quality', type=int, default=95, help='JPEG quality for encoding, 1-100.')
     parser.add_argument('--shuffle', type=bool, default=True, help='Whether to randomize the order in list file.')
+    parser.add_argument('--seed', type=int, default=1337, help='The seed to shuffle the list file.')
+    parser.add_argument('--num_workers', type=int, default=1, help='The number of processes to encode images.')
+    parser.add_argument('--resume', action='store_true', help='Whether to resume from the checkpoint of database.')
 
     if len(sys.argv) < 4:
         parser.print_help()
@@ -74,6 +74,8 @@ class DataLayer(_Layer):
             'num_chunks': param.num_chunks,
             'batch_size': param.batch_size,
             'phase': {0: 'TRAIN', 1: 'TEST'}[int(LayerParameter.phase)],
+            # The test iterations are sharded across the parallel group
+            'shard': True,
             'mirror': transform_param.mirror,
             'crop_size': transform_param.crop_size,
             'force_color': transform_param.force_color,
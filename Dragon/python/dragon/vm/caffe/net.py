@@ -15,9 +15,11 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy
 from collections import OrderedDict
 from google.protobuf.text_format import Parse as _parse_text_proto
 
+from dragon import ops as _ops
 from dragon.core.tensor import Tensor as _Tensor
 from dragon.core import workspace as _workspace
 
@@ -278,15 +280,75 @@ class Net(object):
             for var in self.trainable_variables:
                 _Grad(loss, var)
 
-        self._function = _Function(
-            outputs=[self.blobs[key].data
-                for key in self.outputs])
+        outputs = [self.blobs[key].data for key in self.outputs]
+
+        if self._phase == 'TRAIN':
+            # Accumulate the total loss and scalar outputs inside the graph,
+            # which could be fetched lazily without syncing each iteration
+            if len(self.losses) > 0:
+                outputs.append(self._accumulate_losses())
+            outputs.extend(self._accumulate_outputs())
+
+        self._function = _Function(outputs=outputs)
 
         if hasattr(self, '_model'):
             _workspace.Restore(self._model, format='caffe')
 
         return self._function
 
+    def _accumulate_losses(self):
+        """Add the total loss into an accumulator."""
+        total_loss = None
+        for loss in self.losses:
+            loss = _ops.Sum(loss)
+            total_loss = loss if total_loss is None else total_loss + loss
+        self._loss_sum = _Tensor(_workspace.GetDummyName(
+            'loss_sum', domain='Tensor')).Variable()
+        self._loss_sum.set_value(numpy.zeros((1,), 'float32'))
+        return _ops.Accumulate(total_loss, existing_outputs=self._loss_sum)
+
+    def _accumulate_outputs(self):
+        """Add the scalar outputs into the accumulators respectively."""
+        self._output_sums, outputs = OrderedDict(), []
+        for key in self.outputs:
+            blob = self.blobs[key].data
+            if blob.name in self._output_sums: continue
+            shape = blob.shape
+            if shape is not None and all(
+                    isinstance(d, int) and d >= 0 for d in shape):
+                if int(numpy.prod(shape)) != 1: continue
+                output = blob
+            else:
+                # The size is checked on fetching, reduce the output
+                # to keep the accumulator as a scalar anyway
+                shape, output = (), _ops.Sum(blob)
+            output_sum = _Tensor(_workspace.GetDummyName(
+                'output_sum', domain='Tensor')).Variable()
+            output_sum.set_value(numpy.zeros(shape, 'float32'))
+            self._output_sums[blob.name] = output_sum
+            outputs.append(output)
+        if len(outputs) == 0: return []
+        output_sums = _ops.Accumulate(outputs,
+            existing_outputs=list(self._output_sums.values()))
+        return output_sums if isinstance(output_sums, list) else [output_sums]
+
+    def _fetch_loss(self):
+        """Fetch and reset the accumulated loss."""
+        if not hasattr(self, '_loss_sum'): return 0.
+        value = self._loss_sum.get_value()
+        self._loss_sum.set_value(numpy.zeros_like(value))
+        return float(value.sum())
+
+    def _fetch_outputs(self):
+        """Fetch and reset the accumulated scalar outputs."""
+        values, ws = {}, _workspace.get_default_workspace()
+        for name, output_sum in getattr(self, '_output_sums', {}).items():
+            value = output_sum.get_value()
+            output_sum.set_value(numpy.zeros_like(value))
+            if _workspace.HasTensor(name) and ws.GetTensor(name).size == 1:
+                values[name] = float(value.flatten()[0])
+        return values
+
     def copy_from(self, model):
         """Copy the parameters from the binary proto file. [**PyCaffe Style**]
 
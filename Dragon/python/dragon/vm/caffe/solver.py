@@ -16,10 +16,14 @@ from __future__ import division
 from __future__ import print_function
 
 import time
+import numpy
 
+from dragon import ops as _ops
 from dragon import updaters as _updaters
 from dragon.core import mpi as _mpi
+from dragon.core.tensor import Tensor as _Tensor
 from dragon.core import workspace as _workspace
+from dragon.core import serialization as _serialization
 from google.protobuf.text_format import Parse as _parse_text_proto
 
 from dragon.vm.caffe.net import Net as _Net
@@ -61,6 +65,7 @@ class Solver(object):
         self._layer_blobs = []
         self._iter = self._current_step = 0
         self.optimizer = None
+        self._writer = None
         self.InitTrainNet()
         self.InitTestNets()
         self.BuildNets()
@@ -98,11 +103,8 @@ class Solver(object):
         The implementation of `InitTestNets(solver.cpp, L104)`_.
 
         """
-        if _mpi.Is_Init():
-            rank, group = _mpi.AllowParallel()
-            # Only the root in a parallel group can test
-            if rank != -1 and _mpi.Rank() != group[0]: return
-
+        # All the nodes in a parallel group will test,
+        # each takes a disjoint slice of the test iterations
         num_test_net = len(self._param.test_iter)
         if num_test_net > 0:
             if self._param.test_interval <= 0:
@@ -131,6 +133,7 @@ class Solver(object):
         """
         self.train = self._net.function()
         self.tests = [test_net.function() for test_net in self._test_nets]
+        self._test_gathers = [None] * len(self.tests)
 
     def ParseOptimizerArguments(self):
         """Parse the arguments for optimizer.
@@ -242,33 +245,56 @@ class Solver(object):
         The implementation of `Test(solver.cpp, L328)`_.
 
         """
-        test_score, output_id = [], []
         net = self._test_nets[test_idx]
         test_iter = self._param.test_iter[test_idx]
-
-        for iter in range(test_iter):
+        part_idx, num_parts = 0, 1
+        if _mpi.Is_Init():
+            rank, group = _mpi.AllowParallel()
+            if rank != -1:
+                part_idx, num_parts = group.index(_mpi.Rank()), len(group)
+        # Check on every rank, otherwise the others hang in gathering
+        if test_iter < num_parts:
+            raise ValueError('Excepted at least {} test iterations, '
+                'got {}.'.format(num_parts, test_iter))
+
+        # Accumulate the outputs of this slice
+        test_score, output_id = None, []
+        for iter in range(part_idx, test_iter, num_parts):
             self.tests[test_idx](return_outputs=False)
-            if not _root_solver(): continue
-            if iter == 0:
-                for key in net.outputs:
-                    values = net.blobs[key].data.get_value().flatten()
-                    for idx, value in enumerate(values):
-                        test_score.append(value)
-                        output_id.append(key)
-            else:
-                i = 0
-                for key in net.outputs:
-                    values = net.blobs[key].data.get_value().flatten()
-                    for idx, value in enumerate(values):
-                        test_score[i] += value
-                        i += 1
+            values = [net.blobs[key].data.get_value().flatten()
+                for key in net.outputs]
+            if test_score is None:
+                for key, value in zip(net.outputs, values):
+                    output_id.extend([key] * value.size)
+                test_score = numpy.zeros((len(output_id),), 'float64')
+            test_score += numpy.concatenate(values)
 
-        if not _root_solver(): return
+        if num_parts > 1:
+            test_score = self._gather_scores(test_idx, test_score, group)
+
+        if not _root_solver() or test_score is None: return
 
         print('Iteration {}, Test net #{}'.format(self.iter, test_idx))
         for idx, score in enumerate(test_score):
             print('		 Test net output #%d(%s): %.4f' % (idx, output_id[idx], score / test_iter))
 
+    def _gather_scores(self, test_idx, test_score, group):
+        """Sum the partial scores of the group into the root."""
+        if self._test_gathers[test_idx] is None:
+            partial_score = _Tensor(_workspace.GetDummyName(
+                'partial_score', domain='Tensor'), dtype='float64').Variable()
+            gathered = _ops.MPIGather(
+                partial_score, root=group[0], mpi_ranks=group)
+            if not isinstance(gathered, list): gathered = [gathered]
+            self._test_gathers[test_idx] = \
+                (partial_score, gathered, _Function(outputs=gathered))
+        partial_score, gathered, gather = self._test_gathers[test_idx]
+        # Gather the float64 sums without downcasting
+        partial_score.set_value(test_score)
+        gather(return_outputs=False)
+        if _mpi.Rank() != group[0]: return None
+        return numpy.sum([e.get_value() for e in gathered], axis=0)
+
     def step(self, iters):
         """Step the train net. [**PyCaffe Style**]
 
@@ -287,7 +313,11 @@ class Solver(object):
 
         """
         start_iter, stop_iter = self.iter, self.iter + iters
-        loss_vec, smoothed_loss = [], 0.
+        loss_segments, smoothed_loss = [], 0.
+        display, average_loss = self._param.display, self._param.average_loss
+
+        # Discard the losses of previous steps
+        self._net._fetch_loss()
 
         tic = time.time()
 
@@ -299,24 +329,23 @@ class Solver(object):
                         self._param.test_initialization) or self.iter != 0:
                     for test_id in range(len(self.tests)): self.Test(test_id)
 
-            # Forward && Backward && Compute Loss
-            loss = 0.0
+            # Forward && Backward && Accumulate Loss
             for i in range(self._param.iter_size):
                 self.train(return_outputs=False)
-                if _root_solver():
-                    for e in self.net.losses:
-                        values = e.get_value().flatten()
-                        for v in values: loss += v
-
-            if _root_solver():
-                loss /= self._param.iter_size
-                if len(loss_vec) < self._param.average_loss:
-                    loss_vec.append(loss)
-                    smoothed_loss = (smoothed_loss * (len(loss_vec) - 1) + loss) / len(loss_vec)
-                else:
-                    idx = (self.iter - start_iter) % self._param.average_loss
-                    smoothed_loss += ((loss - loss_vec[idx]) / self._param.average_loss)
-                    loss_vec[idx] = loss
+
+            # Fetch the accumulated loss only at the boundaries of
+            # the smoothing window ending at the display iterations
+            if _root_solver() and display:
+                if self.iter % display == 0 or \
+                        (self.iter + average_loss) % display == 0:
+                    loss_segments.append((self.iter, self._net._fetch_loss()))
+                if self.iter % display == 0:
+                    window_start = self.iter - average_loss
+                    loss_segments = [(it, loss) for it, loss
+                        in loss_segments if it > window_start]
+                    smoothed_loss = sum(loss for _, loss in loss_segments) / \
+                        self._param.iter_size / min(average_loss,
+                            self.iter - start_iter + 1)
 
             # Apply Update
             self.GetLearningRate()
@@ -341,6 +370,9 @@ class Solver(object):
             if self._param.snapshot:
                 if self.iter % self._param.snapshot == 0: self.snapshot()
 
+        # Discard the outputs, which are only reported by one step
+        self._net._fetch_outputs()
+
     def one_step(self):
         """One step run the train net.
 
@@ -356,25 +388,23 @@ class Solver(object):
                     self._param.test_initialization) or self.iter != 0:
                 for test_id in range(len(self.tests)): self.Test(test_id)
 
-        # Forward && Backward && Compute_loss
+        # Forward && Backward && Accumulate Loss
         run_time, stats = 0., {'loss': {'total': 0.}, 'iter': self.iter}
         for i in range(self._param.iter_size):
             tic = time.time()
             self.train(return_outputs=False)
             run_time += (time.time() - tic)
 
-            # Total loss
-            for e in self.net.losses:
-                values = e.get_value().flatten()
-                if values.size == 1:
-                    stats['loss']['total'] += values[0]
+        # Sum the total loss and scalar outputs over all the iterations,
+        # which are accumulated inside the graph and fetched once
+        stats['loss']['total'] = self._net._fetch_loss()
+        output_sums = self._net._fetch_outputs()
 
-            # Partial loss
-            for key in self.net.outputs:
-                values = self.net.blobs[key].data.get_value().flatten()
-                if values.size != 1: continue
-                if key not in stats['loss']: stats['loss'][key] = 0.
-                stats['loss'][key] += values[0]
+        # Partial loss
+        for key in self.net.outputs:
+            name = self.net.blobs[key].data.name
+            if name in output_sums:
+                stats['loss'][key] = output_sums[name]
 
         # Apply Update
         self.GetLearningRate()
@@ -399,6 +429,9 @@ class Solver(object):
     def snapshot(self):
         """Snapshot the parameters of train net. [**PyCaffe Style**]
 
+        If ``snapshot_async`` is set, the parameters are fetched at this iteration,
+        and written in background with at most ``snapshot_async`` files inflight.
+
         Returns
         -------
         None
@@ -414,9 +447,13 @@ class Solver(object):
         """
         tensors = [blob.data for blob in self._layer_blobs]
         filename = "_iter_" + str(self.iter)
+        if self._param.snapshot_async > 0 and self._writer is None:
+            self._writer = _serialization.AsyncWriter(
+                self._param.snapshot_async)
         _workspace.Snapshot(tensors, filename,
             prefix=self._param.snapshot_prefix,
-                suffix='.caffemodel', format='caffe')
+                suffix='.caffemodel', format='caffe',
+                    writer=self._writer)
 
     @property
     def net(self):
@@ -25,7 +25,10 @@ from onnx import checker, mapping, numpy_helper, GraphProto, OperatorSetIdProto
 from onnx.helper import make_tensor_value_info, make_model, printable_graph
 
 from dragon.core import workspace as _workspace
+from dragon.core.tensor import Tensor as _Tensor
 from dragon.vm.onnx.helper import native_run_graph
+from dragon.vm.onnx.helper import infer_value_info
+from dragon.vm.onnx.helper import is_complete_value_info
 from dragon.vm.onnx.helper import fetch_initializer
 from dragon.vm.onnx.helper import extract_initializer
 from dragon.vm.onnx.helper import extract_leaf_tensors
@@ -99,7 +102,28 @@ class DragonFrontend(object):
                     run_native_graph = True
                     break
 
-        ws = None
+        ws, inferred = None, {}
+
+        # Try to infer the value info of all blobs statically,
+        # fallback to running if any type or dimension is unknown
+        if run_native_graph and not enforce_no_running:
+            inferred = infer_value_info(graph_def, value_info)
+            if all(is_complete_value_info(info) for info in inferred.values()) \
+                    and all(name in inferred for name in graph_def.output):
+                for name in graph_def.output:
+                    value_info[name] = inferred[name]
+                if init_func is not None:
+                    # Feed the initializer into an anonymous workspace
+                    ws = _workspace.Workspace()
+                    with ws.as_default():
+                        for name in initializer:
+                            _Tensor(name=name).Variable()
+                        init_func()
+                        initializer = fetch_initializer(initializer)
+                else:
+                    ws = _workspace.get_default_workspace()
+                    initializer = fetch_initializer(initializer)
+                run_native_graph = False
 
         # Get the value info of outputs and initializer
         if run_native_graph and not enforce_no_running:
@@ -110,6 +134,7 @@ class DragonFrontend(object):
 
             ws, outputs, initializer = native_run_graph(
                 graph_def, inputs, initializer, init_func)
+            inferred = {}
 
             for name in graph_def.output:
                 output = outputs[name]
@@ -163,7 +188,10 @@ class DragonFrontend(object):
         for op in graph_def.op:
             # Get the shape of inputs and outputs
             for name in itertools.chain(op.input, op.output):
-                if ws and ws.HasTensor(name):
+                if name in inferred and \
+                        is_complete_value_info(inferred[name]):
+                    shapes[name] = inferred[name][1]
+                elif ws and ws.HasTensor(name):
                     blob = ws.FetchTensor(name)
                     if hasattr(blob, 'shape'):
                         shapes[name] = blob.shape
@@ -18,10 +18,12 @@ from __future__ import division
 from __future__ import print_function
 
 import sys
+import numpy
 from onnx.backend.base import namedtupledict
-from onnx import numpy_helper
+from onnx import mapping, numpy_helper
 
 from dragon.core import workspace as _workspace
+from dragon.core.helper import OperatorHelper as _OperatorHelper
 from dragon.core.tensor import Tensor as _Tensor
 
 
@@ -80,6 +82,49 @@ def fetch_argument(op_def, desc, ws):
     return argument_value
 
 
+def infer_value_info(graph_def, value_info):
+    """Infer the type and shape of tensors without running.
+
+    The rules of ``OperatorHelper`` are applied op by op,
+    the unknown types or dimensions are represented as ``None``.
+
+    Parameters
+    ----------
+    graph_def : GraphDef
+        The definition of graph.
+    value_info : dict
+        The (type, shape) of the leaf tensors.
+
+    Returns
+    -------
+    dict
+        The inferred (type, shape) of all tensors.
+
+    """
+    tensors = {}
+    for name, (elem_type, shape) in value_info.items():
+        tensors[name] = _Tensor(name, list(shape),
+            mapping.TENSOR_TYPE_TO_NP_TYPE[elem_type].name)
+    tensors = _OperatorHelper.infer(graph_def, tensors)
+    inferred = {}
+    for name, tensor in tensors.items():
+        try:
+            elem_type = mapping.NP_TYPE_TO_TENSOR_TYPE[
+                numpy.dtype(tensor.dtype)] if tensor.dtype else None
+        except (KeyError, TypeError):
+            elem_type = None
+        shape = list(tensor.shape) if tensor.shape is not None else None
+        inferred[name] = (elem_type, shape)
+    return inferred
+
+
+def is_complete_value_info(info):
+    """Whether the type and all dimensions are known."""
+    elem_type, shape = info
+    return elem_type is not None and shape is not None \
+        and all(isinstance(d, (int, numpy.integer)) and d >= 0 for d in shape)
+
+
 def native_run_graph(graph_def, inputs, initializer, init_func=None):
     # De-Optimization
     for i in range(len(graph_def.arg)):
@@ -150,7 +150,7 @@ def _inject_update_ops(graph_def, updater):
     graph_def.op.extend(update_ops)
 
 
-def _inject_optimization(graph_def, opt_level=None):
+def _inject_optimization(graph_def, opt_level=None, tensors=None):
     """Inject the optimization info into GraphDef.
 
     Parameters
@@ -159,6 +159,8 @@ def _inject_optimization(graph_def, opt_level=None):
         The definition of graph.
     opt_level : int, optional
         The optimization level.
+    tensors : dict, optional
+        The leaf tensors to infer the static sizes.
 
     Returns
     -------
@@ -180,6 +182,18 @@ def _inject_optimization(graph_def, opt_level=None):
         _proto_utils.MakeArgument(
             'optimization_level', opt_level))
     graph_def.graph_type = options['graph_type']
+    if options['graph_num_threads'] > 0:
+        graph_def.arg.add().CopyFrom(
+            _proto_utils.MakeArgument(
+                'num_threads', options['graph_num_threads']))
+    if options['plan_memory']:
+        names, sizes = _helper.OperatorHelper \
+            .infer_sizes(graph_def, tensors)
+        graph_def.arg.extend([
+            _proto_utils.MakeArgument('plan_memory', 1),
+            _proto_utils.MakeArgument('static_names', names),
+            _proto_utils.MakeArgument('static_sizes', sizes),
+        ])
 
 
 def _inject_device(graph_def):
@@ -307,7 +321,8 @@ class Function(object):
         # Inject arguments based on global options
         if len(outputs) > 0:
             _inject_device(meta_graph)
-            _inject_optimization(meta_graph)
+            _inject_optimization(meta_graph,
+                tensors=dict((e.name, e) for e in inputs))
             _inject_gradients(meta_graph, outputs)
             _inject_phase(meta_graph, outputs)
 
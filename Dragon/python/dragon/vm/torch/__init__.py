@@ -27,4 +27,5 @@ from dragon.vm.torch.ops.builtin import *
 from dragon.vm.torch.autograd import *
 import dragon.vm.torch.nn
 import dragon.vm.torch.optim
-import dragon.vm.torch.onnx
\ No newline at end of file
+import dragon.vm.torch.onnx
+import dragon.vm.torch.jit
\ No newline at end of file
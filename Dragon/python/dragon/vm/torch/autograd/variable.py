@@ -13,6 +13,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import weakref
 import warnings
 
 from dragon.core import tensor_utils as _tensor_utils
@@ -20,6 +21,7 @@ from dragon.core.workspace import Backward as _backward_impl
 
 from dragon.vm.torch.c_api import _get_tensor_pool
 from dragon.vm.torch.c_api import _get_operator_pool
+from dragon.vm.torch.jit import Tape as _Tape
 from dragon.vm.torch.tensor import Tensor as _Tensor
 
 
@@ -40,15 +42,35 @@ def volatile(self):
     return False
 
 
+def register_hook(hook):
+    """Register a hook to run ops once the grads are ready.
+
+    The hook should implement ``make_hook_ops()``,
+    which returns the ops running on the specified grads,
+    and ``on_hook_ops_scheduled(indices)``, which receives
+    the indices of ops scheduled by the backward.
+
+    Parameters
+    ----------
+    hook : object
+        The hook, which is referred weakly.
+
+    Returns
+    -------
+    None
+
+    """
+    _GLOBAL_GRADIENT_HOOKS.add(hook)
+
+
 def backward(self, gradient=None):
     if not self._requires_grad:
         raise RuntimeError('This variable does not require grads.'
                            '\nCan not backward from this variable.')
 
     # 1) expressions -> forward_ops
-    # We should sort out the topology before using
-    all_expressions = sorted(self.__jit_recorder__.ops.items(), key=lambda d: d[0])
-    forward_ops = [v for k, v in all_expressions]
+    # The shared arena is walked in reverse from this record
+    forward_ops = _Tape([self.__jit_recorder__]).ops
 
     # 2) forward_ops + targets + input_grads + ignored_grads -> backward_ops
     targets, input_grads = [self.name], []
@@ -61,7 +83,18 @@ def backward(self, gradient=None):
         input_grads.append(self.name + '_grad')
 
     # 3) Dispatch the backward ops
-    _backward_impl(forward_ops, targets, input_grads, ignored_grads)
+    # The hook ops will be scheduled along with the backward
+    hooks, hook_ops, hook_offsets = list(_GLOBAL_GRADIENT_HOOKS), [], []
+    for hook in hooks:
+        hook_offsets.append(len(hook_ops))
+        hook_ops.extend(hook.make_hook_ops())
+    hook_offsets.append(len(hook_ops))
+    scheduled = _backward_impl(forward_ops, targets,
+        input_grads, ignored_grads, hook_ops)
+    for i, hook in enumerate(hooks):
+        begin, end = hook_offsets[i], hook_offsets[i + 1]
+        hook.on_hook_ops_scheduled(
+            [j - begin for j in scheduled if begin <= j < end])
 
     # 4) Release resources
     # We should release both the operator handles and tensors
@@ -73,4 +106,8 @@ def backward(self, gradient=None):
 
 
 _Tensor.backward = backward
-_Tensor.volatile = volatile
\ No newline at end of file
+_Tensor.volatile = volatile
+
+
+# The registered hooks to run on the ready grads
+_GLOBAL_GRADIENT_HOOKS = weakref.WeakSet()
\ No newline at end of file
@@ -19,7 +19,16 @@ with arbitrary inputs and outputs many times.
 
 Note that it is still a challenge to persist the operators which
 take the argument with uncertain numerical bounds. In this case,
-our engine will still create lots of duplicates.
+the arguments should be fed as tensors by the descriptors,
+otherwise, our engine will still create lots of duplicates.
+
+The persistent operators are keyed by the structural signature,
+i.e., the type, arguments and device, instead of the module.
+Thus, modules that are structurally equal will share the
+prebuilt definition and the backend instance.
+
+The unreferenced definitions are cached by LRU, and the evicted
+ones will release the backend instance.
 
 """
 
@@ -37,6 +46,76 @@ from dragon.vm.torch.c_api import device as _Device
 from dragon.vm.torch.jit import JITRecorder, is_jit_enforced
 from dragon.vm.torch.autograd.grad_mode import is_grad_enabled
 from dragon.vm.torch.tensor import _RuntimeTensor
+from dragon.vm.torch.ops.factory import Registry
+from dragon.vm.torch.ops.primitive import RetainScalars
+
+
+def GetPersistentDef(meta_def):
+    """Return the persistent def for the structural signature.
+
+    The kernels dispatch the data type on running,
+    so the type, arguments and device determine the operator.
+
+    Parameters
+    ----------
+    meta_def : OperatorDef
+        The meta definition without I/O and uid.
+
+    Returns
+    -------
+    dragon.import_c_api.OperatorDef
+        The shared definition.
+
+    """
+    global _GLOBAL_PERSISTENT_UID
+    signature = meta_def.SerializeToString()
+    persistent_def = _GLOBAL_PERSISTENT_DEFS.get(signature)
+    if persistent_def is None:
+        # The uid is never reused, even if the def is released
+        meta_def.uid = 'persistent/{}/{}'.format(
+            meta_def.type, _GLOBAL_PERSISTENT_UID)
+        _GLOBAL_PERSISTENT_UID += 1
+        persistent_def = _C.OperatorDef()
+        persistent_def.ParseFrom(meta_def.SerializeToString())
+        _GLOBAL_PERSISTENT_SIGNATURES[persistent_def.uid] = signature
+    # The referenced defs are never evicted
+    _GLOBAL_PERSISTENT_REFS[signature] = \
+        _GLOBAL_PERSISTENT_REFS.get(signature, 0) + 1
+    _GLOBAL_PERSISTENT_DEFS.pin(signature)
+    _GLOBAL_PERSISTENT_DEFS.put(signature, persistent_def)
+    return persistent_def
+
+
+def ReleasePersistentDef(persistent_def):
+    """Release a reference of the persistent def.
+
+    The def without references could be evicted,
+    which removes the backend operator.
+
+    Parameters
+    ----------
+    persistent_def : dragon.import_c_api.OperatorDef
+        The def returned by ``GetPersistentDef(...)``.
+
+    Returns
+    -------
+    None
+
+    """
+    uid = persistent_def.uid
+    signature = _GLOBAL_PERSISTENT_SIGNATURES.get(uid, None)
+    if signature is None: return
+    _GLOBAL_PERSISTENT_REFS[signature] -= 1
+    if _GLOBAL_PERSISTENT_REFS[signature] > 0: return
+    del _GLOBAL_PERSISTENT_REFS[signature]
+    _GLOBAL_PERSISTENT_DEFS.unpin(signature)
+
+
+def _on_evict_persistent_def(signature, persistent_def):
+    del _GLOBAL_PERSISTENT_SIGNATURES[persistent_def.uid]
+    _workspace.get_default_workspace() \
+        .DeleteOperator(persistent_def.uid)
+
 
 def RunOperator(
     inputs,
@@ -75,9 +154,13 @@ def RunOperator(
             outputs_name.append(outputs[ix].name)
 
     # Key + Inputs + Outputs => Op
+    # The recorded op should be copied from the meta,
+    # otherwise, reuse the meta to avoid the copying
     op_name = 'runtime'
     persistent_key, meta_op = meta
-    op = _C.OperatorDef(); op.CopyFrom(meta_op)
+    if len(inputs) > 0 and auto_grad and requires_grad:
+        op = _C.OperatorDef(); op.CopyFrom(meta_op)
+    else: op = meta_op
     op.input, op.output = inputs_name, outputs_name
 
     # Auto-Grad
@@ -91,10 +174,11 @@ def RunOperator(
                 if input._ignored_grads:
                     ignored_grads = ignored_grads.union(
                         input._ignored_grads)
-            recorder = JITRecorder()
-            recorder.merge(input_recorders)
+            recorder = JITRecorder(input_recorders)
             op_name = recorder.append(op)
             op.name = op_name
+            # The pending backward will read the scalars
+            RetainScalars(inputs_name, recorder)
             for ix in range(len(outputs)):
                 outputs[ix].requires_grad = True
                 outputs[ix].__jit_recorder__ = recorder
@@ -116,4 +200,19 @@ def RunOperator(
     # Returns
     if len(outputs) > 1: return outputs
     elif len(outputs) == 1: return outputs[0]
-    else: return None
\ No newline at end of file
+    else: return None
+
+
+# The structural signature => The persistent def
+# Keep the unreferenced ones for reusing, evict the stale ones
+_GLOBAL_PERSISTENT_DEFS = Registry(
+    capacity=1024, on_evict=_on_evict_persistent_def)
+
+# The structural signature => The number of references
+_GLOBAL_PERSISTENT_REFS = {}
+
+# The uid => The structural signature
+_GLOBAL_PERSISTENT_SIGNATURES = {}
+
+# The counter to generate the unique uid
+_GLOBAL_PERSISTENT_UID = 0
\ No newline at end of file
@@ -9,46 +9,127 @@
 #
 # ------------------------------------------------------------
 
-"""A simple JIT expressions recorder."""
+"""A simple JIT expressions recorder.
+
+The recorded tape could also be traced into a static graph,
+which replays the forward and backward in a single call.
+
+"""
 
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import weakref
+
+from dragon import config as _cfg
 from dragon.core import tls as _tls
-from dragon.vm.torch.c_api import _get_operator_pool
+from dragon.core import helper as _helper
+from dragon.core import workspace as _workspace
+from dragon.core import proto_utils as _proto_utils
+from dragon.core import tensor_utils as _tensor_utils
+from dragon.core import gradient_maker as _gradient_maker
+from dragon.proto import dragon_pb2 as _proto_def
 
+from dragon.vm.torch.c_api import from_dragon as _from_dragon
+from dragon.vm.torch.c_api import _get_tensor_pool
+from dragon.vm.torch.c_api import _get_operator_pool
+from dragon.vm.torch.tensor import Tensor as _Tensor
+from dragon.vm.torch.ops.primitive import RetainScalars as _RetainScalars
+from dragon.vm.torch.autograd.grad_mode import is_grad_enabled
 
-def _Incrementer():
-    i = 0  # Python returns BigInteger
-    while True: i += 1; yield i
 
+class _Arena(object):
+    """The append-only records shared by all tensors.
 
-class JITRecorder(object):
-    UID_GENERATOR = _Incrementer()
+    The records are referred weakly in the recording order,
+    and the dead ones are compacted once the arena doubles.
 
+    """
     def __init__(self):
-        self.ops = dict()
+        self._records, self._threshold = [], 1024
 
-    def merge(self, recorders):
+    def append(self, record):
+        if len(self._records) >= self._threshold: self._compact()
+        record.uid = len(self._records)
+        self._records.append(weakref.ref(record))
+
+    def walk(self, recorders):
+        """Return the records reachable from the recorders.
+
+        The parents are always recorded before the children,
+        thus, walking in reverse visits each record once.
+
+        """
+        records, pending = [], set()
         for e in recorders:
-            if e: self.ops.update(e.ops)
+            if e and e.uid is not None: pending.add(id(e))
+        if len(pending) == 0: return records
+        uid = max(e.uid for e in recorders if e and e.uid is not None)
+        while uid >= 0 and len(pending) > 0:
+            record = self._records[uid]()
+            uid -= 1
+            if record is None or id(record) not in pending: continue
+            pending.discard(id(record))
+            records.append(record)
+            for e in record.parents:
+                if e.uid is not None: pending.add(id(e))
+        records.reverse()
+        return records
+
+    def _compact(self):
+        records = [e for e in (ref() for ref in self._records) if e]
+        for uid, record in enumerate(records): record.uid = uid
+        self._records = [weakref.ref(e) for e in records]
+        self._threshold = max(2 * len(records), 1024)
+
+
+class JITRecorder(object):
+    """Record the op producing a tensor, linked to the parents.
+
+    The records are appended into an arena shared by all tensors,
+    i.e., recording an op costs O(1) instead of merging the upstream.
+
+    """
+    __slots__ = ('uid', 'op', 'parents', '__weakref__')
+
+    def __init__(self, parents=()):
+        self.uid, self.op = None, None
+        self.parents = tuple(e for e in parents if e)
 
     def append(self, op):
-        uid = next(self.UID_GENERATOR)
         op_name = _get_operator_pool().get(op.type)
-        self.ops[uid] = op
-        self.ops[uid].name = op_name
+        self.op = op
+        self.op.name = op_name
+        _GLOBAL_TAPE_ARENA.append(self)
         return op_name
 
+    @property
+    def ops(self):
+        """Return the recorded ops in the recording order."""
+        return Tape([self]).ops
+
+    def debug_str(self, name=''):
+        return Tape([self]).debug_str(name)
+
+
+class Tape(object):
+    """Walk the records reachable from the given recorders.
+
+    The ops are collected in the recording order, which keeps
+    an in-place write after the earlier reads of the same tensor.
+
+    """
+    def __init__(self, recorders):
+        self.ops = [e.op for e in _GLOBAL_TAPE_ARENA.walk(recorders)]
+
     def debug_str(self, name=''):
         external_inputs = set()
-        ordered_ops = sorted(self.ops.items(), key=lambda d: d[0])
         outputs = set()
         buffer0 = '-------------------Expressions-------------------\n'
         buffer1 = ''
         buffer2 = 'Inputs: ['
-        for k, v in ordered_ops:
+        for k, v in enumerate(self.ops):
             buffer1 = buffer1 + '>>>  ' + str(k) + '. ('
             for input in v.input:
                  if input not in outputs:
@@ -88,4 +169,186 @@ class enforce_jit(object):
         _GLOBAL_ENFORCE_JIT_TRACER.enabled = self.prev
 
 
-_GLOBAL_ENFORCE_JIT_TRACER = _tls.Constant(enabled=False)
\ No newline at end of file
+class TracedModule(object):
+    """Replay the traced function as a static graph.
+
+    The function is traced eagerly for each new signature of inputs,
+    i.e., the shape, data type and device, and the recorded tape is
+    compiled into a graph, running the forward and backward at once.
+
+    If the gradients are required, the first output is solved as
+    the loss, and the gradients are written into ``<param>_grad``
+    as the eager ``backward()`` does. Thus, calling ``step()``
+    of the optimizer directly is enough.
+
+    Note that the returned outputs share the memory of the graph,
+    which will be overwritten by the next replay.
+
+    """
+    def __init__(self, func):
+        self.func, self._graphs = func, {}
+
+    def _signature(self, inputs):
+        signature = [is_grad_enabled(), getattr(self.func, 'training', None)]
+        for input in inputs:
+            signature.append((tuple(input.shape),
+                input.dtype, str(input.device)))
+        return tuple(signature)
+
+    def _feed(self, inputs, input_names):
+        for input, name in zip(inputs, input_names):
+            ctx = _proto_utils.GetDeviceOption(
+                input.device.type, input.device.index)
+            _tensor_utils.FromTensor(input, ctx, name, ctx)
+
+    def _trace(self, inputs):
+        graph_name = _workspace.GetDummyName(
+            'TracedModule', domain='Graph', zero_based=False)
+
+        # 1) Run the function eagerly and collect the tape
+        with enforce_jit():
+            outputs = self.func(*inputs)
+        is_sequence = isinstance(outputs, (tuple, list))
+        if not is_sequence: outputs = [outputs]
+        for output in outputs:
+            if not isinstance(output, _Tensor):
+                raise TypeError('Excepted the outputs are Tensors, '
+                    'while got {}.'.format(type(output).__name__))
+        forward_ops = []
+        for op in Tape([e.__jit_recorder__ for e in outputs]).ops:
+            forward_op = _proto_def.OperatorDef()
+            forward_op.ParseFromString(op.SerializeAs())
+            forward_ops.append(forward_op)
+
+        # 2) Map the pooled names into the graph scope
+        # The pools will recycle these names after tracing,
+        # the graph should not race with the eager operators
+        name_dict, input_names, produced, externals = {}, [], set(), set()
+        for i, input in enumerate(inputs):
+            name_dict[input.name] = '{}/input:{}'.format(graph_name, i)
+            input_names.append(name_dict[input.name])
+        for op in forward_ops:
+            for input in op.input:
+                if input not in produced: externals.add(input)
+            for output in op.output:
+                if output in produced or output in externals: continue
+                produced.add(output)
+                name_dict[output] = '{}/{}'.format(graph_name, len(name_dict))
+        for op in forward_ops:
+            op_name = _helper.OperatorHelper.get_name()
+            for arg in op.arg:
+                # The descriptors are resolved by the handle on running
+                if not arg.name.endswith('_desc'): continue
+                descs = list(arg.strings)
+                if arg.HasField('s'): descs.append(arg.s.decode('utf-8'))
+                for desc in descs:
+                    if '${HANDLE}' not in desc: continue
+                    _tensor_utils.FromTensor(
+                        desc.replace('${HANDLE}', op.name), None,
+                            desc.replace('${HANDLE}', op_name), None)
+            op.name = op_name; op.ClearField('uid')
+            inputs_name = [name_dict.get(e, e) for e in op.input]
+            outputs_name = [name_dict.get(e, e) for e in op.output]
+            del op.input[:]; op.input.extend(inputs_name)
+            del op.output[:]; op.output.extend(outputs_name)
+        output_names = [name_dict.get(e.name, e.name) for e in outputs]
+
+        # 3) Generate the gradients w.r.t the required leaves
+        ignored_grads = outputs[0]._ignored_grads or set()
+        wrt = [e for e in sorted(externals) if e not in name_dict
+                and e + '_grad' not in ignored_grads]
+        graph_def = _proto_def.GraphDef(name=graph_name)
+        if is_grad_enabled() and len(wrt) > 0:
+            forward_ops, grad_ops, _ = \
+                _gradient_maker.GraphGradientMaker \
+                    .Make(forward_ops, output_names[:1])
+            for name in wrt:
+                gradient = _proto_def.GradientProto()
+                gradient.cost, gradient.wrt = output_names[0], name
+                graph_def.gradient.extend([gradient])
+        else:
+            grad_ops = []
+        graph_def.op.extend(forward_ops + grad_ops)
+        graph_def.input.extend(input_names)
+        graph_def.output.extend(output_names)
+
+        # 4) Inject the arguments based on global options
+        options = _cfg.GetGlobalOptions()
+        opt_level = options['graph_optimization_level']
+        if not options['share_grads'] and \
+            opt_level >= 3: opt_level = 2
+        phase = getattr(self.func, 'training', len(grad_ops) > 0)
+        graph_def.arg.extend([
+            _proto_utils.MakeArgument('optimization_level', opt_level),
+            _proto_utils.MakeArgument('phase', 'TRAIN' if phase else 'TEST'),
+        ])
+        graph_def.graph_type = options['graph_type']
+        if options['graph_num_threads'] > 0:
+            graph_def.arg.extend([_proto_utils.MakeArgument(
+                'num_threads', options['graph_num_threads'])])
+        if options['plan_memory']:
+            names, sizes = _helper.OperatorHelper.infer_sizes(graph_def)
+            graph_def.arg.extend([
+                _proto_utils.MakeArgument('plan_memory', 1),
+                _proto_utils.MakeArgument('static_names', names),
+                _proto_utils.MakeArgument('static_sizes', sizes),
+            ])
+
+        # 5) Release the eager resources like the ``backward()``
+        for op in Tape([e.__jit_recorder__ for e in outputs]).ops:
+            _get_operator_pool().put(op.name)
+            for output in op.output:
+                if output not in op.input:
+                    _get_tensor_pool().put(output)
+
+        # The graph will read the scalars on replaying
+        _RetainScalars(externals, self)
+
+        # The external inputs should be existing before creating
+        self._feed(inputs, input_names)
+        _workspace.CreateGraph(graph_def)
+        return graph_name, input_names, output_names, is_sequence
+
+    def __call__(self, *inputs):
+        for input in inputs:
+            if not isinstance(input, _Tensor):
+                raise TypeError('Excepted the inputs are Tensors, '
+                    'while got {}.'.format(type(input).__name__))
+        signature = self._signature(inputs)
+        if signature not in self._graphs:
+            self._graphs[signature] = self._trace(inputs)
+        graph_name, input_names, output_names, is_sequence = \
+            self._graphs[signature]
+        self._feed(inputs, input_names)
+        _workspace.RunGraph(graph_name, return_outputs=False)
+        outputs = [_from_dragon(name) for name in output_names]
+        return outputs if is_sequence else outputs[0]
+
+
+def trace(func):
+    """Trace the function into a replayable static graph.
+
+    Parameters
+    ----------
+    func : callable
+        The function or module takes the tensors as inputs.
+
+    Returns
+    -------
+    TracedModule
+        The traced module.
+
+    Examples
+    --------
+    >>> step = torch.jit.trace(lambda x, y: criterion(model(x), y))
+    >>> loss = step(images, labels)  # The gradients are computed
+    >>> optimizer.step()
+
+    """
+    return TracedModule(func)
+
+
+_GLOBAL_ENFORCE_JIT_TRACER = _tls.Constant(enabled=False)
+
+# The arena of records shared by all tensors
+_GLOBAL_TAPE_ARENA = _Arena()
\ No newline at end of file
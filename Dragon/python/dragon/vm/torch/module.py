@@ -32,7 +32,8 @@ from dragon.core import tensor_utils as _tensor_utils
 
 from dragon.vm.torch.c_api import device as _Device
 from dragon.vm.torch.tensor import Tensor, Parameter
-from dragon.vm.torch.execution import RunOperator
+from dragon.vm.torch.execution import RunOperator, GetPersistentDef
+from dragon.vm.torch.execution import ReleasePersistentDef
 from dragon.vm.torch.environ import add_submodule, get_module_name
 
 
@@ -44,6 +45,7 @@ class Module(object):
         self._device = _Device()
         self._module_key = None
         self._module_def = None
+        self._persistent_defs = []
         self.training = True
 
     def __getattr__(self, item):
@@ -312,10 +314,9 @@ class Module(object):
 
     def _gen_module_def(self):
         rng_seed = _cfg.GetGlobalOptions()['random_seed']
-        self._module_def = \
-            _proto_utils.MakeCXXOperatorDef(
+        self._module_def = GetPersistentDef(
+            _proto_utils.MakeOperatorDef(
                 name='runtime',
-                uid=self.module_key,
                 op_type=self.op_meta['op_type'],
                 device_option=_proto_utils.
                     GetDeviceOption(
@@ -325,6 +326,16 @@ class Module(object):
                 ),
                 **self.op_meta['arguments']
             )
+        )
+        self._persistent_defs.append(self._module_def)
+
+    def _release_module_defs(self):
+        # Release the defs generated by this module,
+        # and the backend operators if not shared
+        for persistent_def in self._persistent_defs:
+            ReleasePersistentDef(persistent_def)
+        self._persistent_defs = []
+        self._module_key = self._module_def = None
 
     def register_op(self):
         pass
@@ -18,7 +18,7 @@ from collections import OrderedDict
 
 from dragon.proto.dragon_pb2 import OperatorDef, GraphDef
 from dragon.vm.torch.tensor import Tensor
-from dragon.vm.torch.jit import enforce_jit
+from dragon.vm.torch.jit import enforce_jit, Tape
 
 from dragon.vm.onnx.frontend import DragonFrontend
 from dragon.vm.onnx import make_value_info
@@ -102,14 +102,8 @@ def export(
         DragonFrontend.target_opset_version = opset_version
 
     # 5) Collect operators
-    all_expr = {}
-    for output in outputs:
-        if isinstance(output, Tensor):
-            jit_recorder = output.__jit_recorder__
-            if jit_recorder is not None:
-                all_expr.update(jit_recorder.ops)
-    all_expr = sorted(all_expr.items(), key=lambda d: d[0])
-    forward_ops = [v for k, v in all_expr]
+    forward_ops = Tape([output.__jit_recorder__
+        for output in outputs if isinstance(output, Tensor)]).ops
 
     # 6) OperatorDef => GraphDef
     graph_def = GraphDef()
@@ -258,9 +258,10 @@ def clamp(input, min=None, max=None, out=None):
 
     """
     dev = MakeDevice(inputs=[input])
-    key = 'Clamp/{}/min:{}/max:{}'.format(dev, min, max)
-    module = get_module(Clamp, key, dev, min=min, max=max)
-    return module.forward(input, out)
+    has_min, has_max = min is not None, max is not None
+    key = 'Clamp/{}/min:{}/max:{}'.format(dev, has_min, has_max)
+    module = get_module(Clamp, key, dev, has_min=has_min, has_max=has_max)
+    return module.forward(input, out, min, max)
 
 
 def log(input, out=None):
@@ -438,43 +439,23 @@ def _repeat(input, times):
 
 def _fill(input, shape, value):
     dev = MakeDevice(inputs=[input]); ndim = len(shape)
-    key = 'Fill/{}/dtype:{}/ndim:{}/value:{}' \
-        .format(dev, input.dtype, ndim, value)
-    module = get_module(
-        Fill, key, dev,
-        ndim=ndim,
-        value=value,
-        dtype=input.dtype,
-    )
-    return module.forward(input, shape)
+    key = 'Fill/{}/dtype:{}/ndim:{}'.format(dev, input.dtype, ndim)
+    module = get_module(Fill, key, dev, ndim=ndim, dtype=input.dtype)
+    return module.forward(input, shape, value=value)
 
 
 def _uniform(input, shape, low, high):
     dev = MakeDevice(inputs=[input]); ndim = len(shape)
-    key = 'Uniform/{}/dtype:{}/ndim:{}/low:{}/high:{}'.format(
-        dev, input.dtype, ndim, float(low), float(high))
-    module = get_module(
-        RandomUniform, key, dev,
-        ndim=ndim,
-        low=low,
-        high=high,
-        dtype=input.dtype,
-    )
-    return module.forward(input, shape)
+    key = 'Uniform/{}/dtype:{}/ndim:{}'.format(dev, input.dtype, ndim)
+    module = get_module(RandomUniform, key, dev, ndim=ndim, dtype=input.dtype)
+    return module.forward(input, shape, low=low, high=high)
 
 
 def _normal(input, shape, mean, std):
     dev = MakeDevice(inputs=[input]); ndim = len(shape)
-    key = 'Normal/{}/dtype:{}/ndim:{}/mean:{}/std:{}'.format(
-        dev, input.dtype, ndim, float(mean), float(std))
-    module = get_module(
-        RandomNormal, key, dev,
-        ndim=ndim,
-        mean=mean,
-        std=std,
-        dtype=input.dtype,
-    )
-    return module.forward(input, shape)
+    key = 'Normal/{}/dtype:{}/ndim:{}'.format(dev, input.dtype, ndim)
+    module = get_module(RandomNormal, key, dev, ndim=ndim, dtype=input.dtype)
+    return module.forward(input, shape, mean=mean, std=std)
 
 
 def _reduce(input, operation, dim=None, keepdim=False, out=None):
@@ -1328,25 +1309,41 @@ def _accumulate(grads):
     return module.forward(grads)
 
 
-def _allreduce(grads):
+def _get_collective(dev, bucket_size):
+    mode = mpi.GetParallelMode() + '_ALLREDUCE'
+    key = 'Collective/{}/{}/bucket_size:{}'.format(
+        dev, mode.lower(), bucket_size)
+    return get_module(Collective, key, dev,
+        mode=mode, bucket_size=bucket_size)
+
+
+def _allreduce(grads, bucket_size=0):
     if not isinstance(grads, (list, tuple)): grads = [grads]
     dev = MakeDevice(inputs=grads)
-    mode = mpi.GetParallelMode() + '_ALLREDUCE'
-    key = 'Collective/{}/{}'.format(dev, mode.lower())
-    module = get_module(Collective, key, dev, mode=mode)
+    module = _get_collective(dev, bucket_size)
     return module.forward(grads)
 
 
+def _allreduce_hook(params, bucket_size=0):
+    """Return the all-reduce def of grads which are not ready."""
+    dev = MakeDevice(inputs=params)
+    module = _get_collective(dev, bucket_size)
+    return module.make_def([p.name + '_grad' for p in params])
+
+
 def _update(
-    param,
-    grad,
+    params,
+    grads,
     op_type,
     slot,
     lr_mult=1.0,
     decay_mult=1.0,
 ):
-    dev = MakeDevice(inputs=[param])
-    key = '{}/{}/{}/{}'.format(op_type, dev, slot, param.name)
+    if not isinstance(params, (list, tuple)): params = [params]
+    if not isinstance(grads, (list, tuple)): grads = [grads]
+    dev = MakeDevice(inputs=params)
+    key = '{}/{}/{}/lr_mult:{}/decay_mult:{}'.format(
+        op_type, dev, slot, lr_mult, decay_mult)
     module = get_module(
         Update, key, dev,
         op_type=op_type,
@@ -1354,7 +1351,7 @@ def _update(
         decay_mult=decay_mult,
         slot=slot,
     )
-    return module.forward(param, grad)
+    return module.forward(params, grads)
 
 
 ##############################################
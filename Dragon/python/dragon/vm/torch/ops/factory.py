@@ -14,7 +14,162 @@ from __future__ import division
 from __future__ import print_function
 
 
-_GLOBAL_TORCH_BUILTIN_MODULES = {}
+import collections
+
+
+class Registry(object):
+    """A bounded registry evicting the least recently used entries.
+
+    The pinned entries are never evicted, and not counted
+    into the capacity.
+
+    Parameters
+    ----------
+    capacity : int
+        The max number of unpinned entries.
+    on_evict : callable, optional
+        The callback taking the evicted ``key`` and ``value``.
+
+    """
+    def __init__(self, capacity, on_evict=None):
+        self.capacity, self.on_evict = capacity, on_evict
+        self.hits = self.misses = self.evictions = 0
+        # The unpinned entries are ordered by the recency,
+        # the pinned ones are moved out to evict in O(1)
+        self._entries = collections.OrderedDict()
+        self._pinned_entries, self._pinned = {}, set()
+
+    def __contains__(self, key):
+        return key in self._entries or key in self._pinned_entries
+
+    def __len__(self):
+        return len(self._entries) + len(self._pinned_entries)
+
+    def get(self, key, default=None):
+        """Return the value and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            The key.
+        default : object, optional
+            The value to return if missing.
+
+        Returns
+        -------
+        object
+            The value.
+
+        """
+        if key in self._pinned_entries:
+            self.hits += 1
+            return self._pinned_entries[key]
+        try:
+            value = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries[key] = value
+        return value
+
+    def put(self, key, value):
+        """Insert the value, evicting if overflowed.
+
+        Parameters
+        ----------
+        key : str
+            The key.
+        value : object
+            The value.
+
+        Returns
+        -------
+        None
+
+        """
+        if key in self._pinned:
+            self._pinned_entries[key] = value
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = value
+        self._evict()
+
+    def pin(self, key):
+        """Pin the key to avoid evicting.
+
+        Parameters
+        ----------
+        key : str
+            The key.
+
+        Returns
+        -------
+        None
+
+        """
+        self._pinned.add(key)
+        if key in self._entries:
+            self._pinned_entries[key] = self._entries.pop(key)
+
+    def unpin(self, key):
+        """Unpin the key, which could be evicted later.
+
+        Parameters
+        ----------
+        key : str
+            The key.
+
+        Returns
+        -------
+        None
+
+        """
+        self._pinned.discard(key)
+        if key in self._pinned_entries:
+            self._entries[key] = self._pinned_entries.pop(key)
+            self._evict()
+
+    def resize(self, capacity):
+        """Set the capacity, evicting if overflowed.
+
+        Parameters
+        ----------
+        capacity : int
+            The max number of unpinned entries.
+
+        Returns
+        -------
+        None
+
+        """
+        self.capacity = capacity
+        self._evict()
+
+    def stats(self):
+        """Return the statistics of this registry.
+
+        Returns
+        -------
+        dict
+            The counters and sizes.
+
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self),
+            'pinned': len(self._pinned),
+            'capacity': self.capacity,
+        }
+
+    def _evict(self):
+        # The head of entries is the least recently used
+        while len(self._entries) > self.capacity:
+            key, value = self._entries.popitem(last=False)
+            self.evictions += 1
+            if self.on_evict: self.on_evict(key, value)
 
 
 def has_module(key):
@@ -22,12 +177,34 @@ def has_module(key):
 
 
 def register_module(cls, key, dev, **kwargs):
-    global _GLOBAL_TORCH_BUILTIN_MODULES
     module = cls(key, dev, **kwargs)
-    _GLOBAL_TORCH_BUILTIN_MODULES[key] = module
+    _GLOBAL_TORCH_BUILTIN_MODULES.put(key, module)
     return module
 
 
 def get_module(cls, key, dev, **kwargs):
-    if has_module(key): return _GLOBAL_TORCH_BUILTIN_MODULES[key]
-    return register_module(cls, key, dev, **kwargs)
\ No newline at end of file
+    module = _GLOBAL_TORCH_BUILTIN_MODULES.get(key)
+    if module is None:
+        module = register_module(cls, key, dev, **kwargs)
+    return module
+
+
+def pin_module(key):
+    """Pin the builtin module to avoid evicting."""
+    _GLOBAL_TORCH_BUILTIN_MODULES.pin(key)
+
+
+def unpin_module(key):
+    """Unpin the builtin module."""
+    _GLOBAL_TORCH_BUILTIN_MODULES.unpin(key)
+
+
+def module_stats():
+    """Return the statistics of builtin modules."""
+    return _GLOBAL_TORCH_BUILTIN_MODULES.stats()
+
+
+# The builtin modules keyed by the arguments,
+# evict the stale ones, e.g. ``Clamp`` with the varying bounds
+_GLOBAL_TORCH_BUILTIN_MODULES = Registry(capacity=4096,
+    on_evict=lambda key, module: module._release_module_defs())
\ No newline at end of file
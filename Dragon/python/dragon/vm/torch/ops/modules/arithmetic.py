@@ -62,25 +62,27 @@ class Minimum(BaseModule):
 class Clamp(BaseModule):
     def __init__(self, key, dev, **kwargs):
         super(Clamp, self).__init__(key, dev, **kwargs)
-        self.min = kwargs.get('min', None)
-        self.max = kwargs.get('max', None)
-        if self.min is not None: self.min = float(self.min)
-        if self.max is not None: self.max = float(self.max)
+        self.has_min = kwargs.get('has_min', False)
+        self.has_max = kwargs.get('has_max', False)
         self.register_op()
 
     def register_op(self):
-        self.op_meta = {
-            'op_type': 'Clip',
-            'arguments': {
-                'low': self.min,
-                'high': self.max,
-            },
-        }
-
-    def forward(self, x, y):
+        # The bounds are fed by the handle,
+        # instead of creating an op for each value
+        arguments = {}
+        if self.has_min: arguments['low_desc'] = '${HANDLE}/low'
+        if self.has_max: arguments['high_desc'] = '${HANDLE}/high'
+        self.op_meta = {'op_type': 'Clip', 'arguments': arguments}
+
+    def update_args(self, A, min, max):
+        if self.has_min: self.set_arg_f32('{}/low'.format(A), min)
+        if self.has_max: self.set_arg_f32('{}/high'.format(A), max)
+
+    def forward(self, x, y, min=None, max=None):
         inputs = [x]; self.unify_devices(inputs)
         outputs = [y] if y else [self.register_output()]
-        return self.run(inputs, outputs)
+        callback = lambda A: self.update_args(A, min, max)
+        return self.run(inputs, outputs, callback=callback)
 
 
 class Log(BaseModule):
@@ -35,4 +35,12 @@ class BaseModule(Module):
                 name,
                 numpy.array(value, 'int64'),
                 self._arg_dev,
+            )
+
+    def set_arg_f32(self, name, value):
+        _workspace.get_default_workspace() \
+            .FeedTensor(
+                name,
+                numpy.array(value, 'float32'),
+                self._arg_dev,
             )
\ No newline at end of file
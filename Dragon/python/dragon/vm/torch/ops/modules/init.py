@@ -22,20 +22,23 @@ class _InitModule(BaseModule):
         self.ndim = kwargs.get('ndim', 0)
         self.dtype = kwargs.get('dtype', 'float32')
 
-    def update_args(self, A, shape):
+    def update_args(self, A, shape, values):
         for i, e in enumerate(shape):
             self.set_arg_i64('{}/dims[{}]'.format(A, i), e)
+        # The values are fed by the handle,
+        # instead of creating an op for each value
+        for k, v in values.items():
+            self.set_arg_f32('{}/{}'.format(A, k), v)
 
-    def forward(self, x, shape):
+    def forward(self, x, shape, **values):
         outputs = [x]; self.unify_devices(outputs)
-        callback = lambda A: self.update_args(A, shape)
+        callback = lambda A: self.update_args(A, shape, values)
         return self.run([], outputs, callback=callback)
 
 
 class Fill(_InitModule):
     def __init__(self, key, dev, **kwargs):
         super(Fill, self).__init__(key, dev, **kwargs)
-        self.value = kwargs.get('value', 0.0)
         self.register_op()
 
     def register_op(self):
@@ -43,7 +46,7 @@ class Fill(_InitModule):
             'op_type': 'Fill',
             'arguments': {
                 'dtype': self.dtype,
-                'value': float(self.value),
+                'value_desc': '${HANDLE}/value',
                 'dims_desc': [
                     '${{HANDLE}}/dims[{}]'.format(n)
                         for n in range(self.ndim)
@@ -55,8 +58,6 @@ class Fill(_InitModule):
 class RandomNormal(_InitModule):
     def __init__(self, key, dev, **kwargs):
         super(RandomNormal, self).__init__(key, dev, **kwargs)
-        self.mean = kwargs.get('mean', 0.0)
-        self.std = kwargs.get('std', 1.0)
         self.register_op()
 
     def register_op(self):
@@ -64,8 +65,8 @@ class RandomNormal(_InitModule):
             'op_type': 'RandomNormal',
             'arguments': {
                 'dtype': self.dtype,
-                'mean': float(self.mean),
-                'std': float(self.std),
+                'mean_desc': '${HANDLE}/mean',
+                'std_desc': '${HANDLE}/std',
                 'dims_desc': [
                     '${{HANDLE}}/dims[{}]'.format(n)
                         for n in range(self.ndim)
@@ -77,8 +78,6 @@ class RandomNormal(_InitModule):
 class RandomUniform(_InitModule):
     def __init__(self, key, dev, **kwargs):
         super(RandomUniform, self).__init__(key, dev, **kwargs)
-        self.low = kwargs.get('low', 0.0)
-        self.high = kwargs.get('high', 1.0)
         self.register_op()
 
     def register_op(self):
@@ -86,8 +85,8 @@ class RandomUniform(_InitModule):
             'op_type': 'RandomUniform',
             'arguments': {
                 'dtype': self.dtype,
-                'low': float(self.low),
-                'high': float(self.high),
+                'low_desc': '${HANDLE}/low',
+                'high_desc': '${HANDLE}/high',
                 'dims_desc': [
                     '${{HANDLE}}/dims[{}]'.format(n)
                         for n in range(self.ndim)
@@ -13,6 +13,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from dragon import import_c_api as _C
 from dragon.core import mpi as _mpi
 from dragon.vm.torch.ops.modules.base import BaseModule
 
@@ -36,15 +37,17 @@ class Update(BaseModule):
             },
         }
 
-    def forward(self, param, grad):
-        self.unify_devices([param, grad])
-        return self.run([grad], [param], auto_grad=False)
+    def forward(self, params, grads):
+        # All params of a group are updated in one run
+        self.unify_devices(params + grads)
+        return self.run(grads, params, auto_grad=False)
 
 
 class Collective(BaseModule):
     def __init__(self, key, dev, **kwargs):
         super(Collective, self).__init__(key, dev, **kwargs)
         self.mode = kwargs.get('mode', None)
+        self.bucket_size = kwargs.get('bucket_size', 0)
         if self.mode is None:
             raise ValueError('Got invalid collective mode: {}'.format(self.mode))
         self.register_op()
@@ -64,6 +67,7 @@ class Collective(BaseModule):
                 'comm': mpi_comm,
                 'group': mpi_group,
                 'root': group[0], # Assume the 1st node of group as root
+                'bucket_size': self.bucket_size,
             },
         }
 
@@ -71,6 +75,13 @@ class Collective(BaseModule):
         self.unify_devices(grads)
         return self.run(grads, grads, auto_grad=False)
 
+    def make_def(self, grads):
+        """Return the def to run on the given grads later."""
+        if self._module_def is None: self._gen_module_def()
+        op = _C.OperatorDef(); op.CopyFrom(self._module_def)
+        op.input = op.output = grads
+        return op
+
 
 class Accumulate(BaseModule):
     def __init__(self, key, dev, **kwargs):
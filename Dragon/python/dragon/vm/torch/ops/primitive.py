@@ -13,11 +13,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import weakref
+import itertools
 import numpy
+from collections import defaultdict
 
 from dragon.core import workspace as _workspace
 from dragon.vm.torch.tensor import Tensor as _Tensor
 from dragon.vm.torch.c_api import device as _Device
+from dragon.vm.torch.ops.factory import Registry
 
 
 def UnifyDevices(tensors, key='Inputs'):
@@ -48,9 +52,100 @@ def WrapScalar(scalar, dtype, device):
     # Setting a Tensor with same DType and shape will not deconstruct it
     if 'float' in dtype: scalar = float(scalar)
     if 'int' in dtype: scalar = int(scalar)
-    name = '/share/scalar/{}/{}'.format(dtype, str(scalar))
-    if not _workspace.HasTensor(name):
+    key = '{}/{}'.format(dtype, str(scalar))
+    name = _GLOBAL_SCALARS.get(key)
+    if name is None:
+        # Recycle the tensor of an evicted scalar,
+        # which is not referred by any ops now
+        free_names = _GLOBAL_FREE_SCALARS[dtype]
+        if len(free_names) > 0:
+            name = free_names.pop()
+        else:
+            name = '/share/scalar/{}/{}'.format(
+                dtype, next(_GLOBAL_SCALAR_UID))
+        _workspace.FeedTensor(name, numpy.array(scalar, dtype=dtype))
+        _GLOBAL_SCALAR_KEYS[name] = key
+        _GLOBAL_SCALARS.put(key, name)
+    elif not _workspace.HasTensor(name):
         _workspace.FeedTensor(name, numpy.array(scalar, dtype=dtype))
     t = _Tensor(name=name, dtype=dtype, device=device, own_storage=False)
     t.requires_grad = False
-    return t
\ No newline at end of file
+    return t
+
+
+def RetainScalars(names, owner):
+    """Retain the scalars referred by the owner until it is collected.
+
+    The pending backward ops and traced graphs read the scalars
+    by name, which should not be recycled for the other values.
+
+    Parameters
+    ----------
+    names : sequence of str
+        The names of tensors, the non-scalars are ignored.
+    owner : object
+        The weakly referred owner, e.g. a recorder or a graph.
+
+    Returns
+    -------
+    None
+
+    """
+    keys = [_GLOBAL_SCALAR_KEYS[e] for e in names
+                if e in _GLOBAL_SCALAR_KEYS]
+    if len(keys) == 0: return
+    for key in keys: _retain_scalar(key)
+    def release(ref):
+        del _GLOBAL_SCALAR_OWNERS[id(ref)]
+        for key in keys: _release_scalar(key)
+    ref = weakref.ref(owner, release)
+    _GLOBAL_SCALAR_OWNERS[id(ref)] = ref
+
+
+def pin_scalar(scalar, dtype='float32'):
+    """Pin the scalar to avoid evicting."""
+    if 'float' in dtype: scalar = float(scalar)
+    if 'int' in dtype: scalar = int(scalar)
+    _retain_scalar('{}/{}'.format(dtype, str(scalar)))
+
+
+def scalar_stats():
+    """Return the statistics of wrapped scalars."""
+    return _GLOBAL_SCALARS.stats()
+
+
+def _retain_scalar(key):
+    _GLOBAL_SCALAR_REFS[key] = _GLOBAL_SCALAR_REFS.get(key, 0) + 1
+    if _GLOBAL_SCALAR_REFS[key] == 1: _GLOBAL_SCALARS.pin(key)
+
+
+def _release_scalar(key):
+    _GLOBAL_SCALAR_REFS[key] -= 1
+    if _GLOBAL_SCALAR_REFS[key] > 0: return
+    del _GLOBAL_SCALAR_REFS[key]
+    _GLOBAL_SCALARS.unpin(key)
+
+
+def _on_evict_scalar(key, name):
+    del _GLOBAL_SCALAR_KEYS[name]
+    _GLOBAL_FREE_SCALARS[key.split('/')[0]].append(name)
+
+
+# The wrapped scalars: (DType + Value) => Name
+# The referenced ones are pinned, the evicted names are recycled
+_GLOBAL_SCALARS = Registry(capacity=1024, on_evict=_on_evict_scalar)
+
+# The name => (DType + Value) of wrapped scalars
+_GLOBAL_SCALAR_KEYS = {}
+
+# The (DType + Value) => The number of references
+_GLOBAL_SCALAR_REFS = {}
+
+# The id of weak reference => The weak reference to the owner
+_GLOBAL_SCALAR_OWNERS = {}
+
+# The DType => The recycled names
+_GLOBAL_FREE_SCALARS = defaultdict(list)
+
+# The counter to generate the unique name
+_GLOBAL_SCALAR_UID = itertools.count()
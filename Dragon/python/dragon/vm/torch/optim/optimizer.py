@@ -17,6 +17,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy
 from collections import defaultdict
 
 from dragon.core import mpi as _mpi
@@ -24,7 +25,9 @@ from dragon.core import workspace as _workspace
 from dragon.vm.torch.tensor import Tensor as _Tensor
 from dragon.vm.torch.ops.builtin import _update
 from dragon.vm.torch.ops.builtin import _allreduce
+from dragon.vm.torch.ops.builtin import _allreduce_hook
 from dragon.vm.torch.ops.builtin import _accumulate
+from dragon.vm.torch.autograd.variable import register_hook
 
 
 # A simple parameter flag
@@ -32,6 +35,16 @@ required = object()
 
 
 class Optimizer(object):
+    """The base optimizer.
+
+    For the data parallelism, the grads are fused into buckets of
+    ``bucket_size`` bytes, which are all-reduced in the backward
+    as soon as ready, i.e., overlapping the communication.
+
+    The accumulated grads are instead all-reduced once before the update,
+    i.e., the micro-batches with ``accumulate_grad()`` are not hooked.
+
+    """
     # Store the global unique slot index
     _DEFAULT_UNIQUE_SLOT_ID = 0
 
@@ -55,7 +68,12 @@ class Optimizer(object):
         if _mpi.Is_Init():
             rank, _ = _mpi.AllowParallel()
             if rank != -1: self._allow_parallel = True
-        self._mutable_parameters = {}
+        self._mutable_parameters, self._fed_parameters = {}, {}
+        # The size of buckets to fuse grads, in bytes
+        self.bucket_size = 25 * (2 ** 20)
+        self._buckets, self._reduced_buckets = None, set()
+        self._accumulating = self._accumulated = False
+        if self._allow_parallel: register_hook(self)
 
     def __repr__(self):
         format_string = self.__class__.__name__ + ' ('
@@ -72,9 +90,11 @@ class Optimizer(object):
         template = group['slot'] + '/{}'
         for k, v in group.items():
             if k in self._mutable_parameters:
-                _workspace.FeedTensor(
-                    template.format(self._mutable_parameters[k]),
-                        v, dtype='float32', force_cpu=True)
+                name = template.format(self._mutable_parameters[k])
+                # Feed the values only if changed
+                if self._fed_parameters.get(name, None) == v: continue
+                _workspace.FeedTensor(name, v, dtype='float32', force_cpu=True)
+                self._fed_parameters[name] = v
 
     def _get_grad(self, param, accumulating=False):
         grad_name = param.name + (
@@ -112,19 +132,90 @@ class Optimizer(object):
         # Feed optimizer parameters to workspace
         self.feed_parameters(group)
 
-        # Run a all-reduce op to accumulate grads if necessary
-        if self._allow_parallel: _allreduce(grads)
-
-        # Run regular update ops
-        for p, g in zip(params, grads):
+        # Run a fused update op for the whole group
+        if len(params) > 0:
             _update(
-                p, g,
+                params, grads,
                 op_type=self._update_type,
                 slot=group['slot'],
                 lr_mult=group.get('lr_mult', 1.0),
                 decay_mult=group.get('decay_mult', 1.0),
             )
 
+    def _get_buckets(self):
+        """Partition the params into buckets.
+
+        The params are visited reversely, as the grads
+        of last layers are ready at first in the backward.
+
+        Returns
+        -------
+        sequence of sequence of Tensor
+            The buckets.
+
+        """
+        if self._buckets is not None and \
+            self._buckets[0] == self.bucket_size:
+                return self._buckets[1]
+        buckets, sizes = {}, {}
+        for group in self.param_groups[::-1]:
+            for p in group['params'][::-1]:
+                key = (str(p.device), p.dtype)
+                if key not in buckets or \
+                        sizes[key] >= self.bucket_size:
+                    buckets.setdefault(key, []).append([])
+                    sizes[key] = 0
+                buckets[key][-1].append(p)
+                sizes[key] += p.numel() * \
+                    numpy.dtype(p.dtype).itemsize
+        self._buckets = (self.bucket_size,
+            [b for k in sorted(buckets) for b in buckets[k]])
+        self._reduced_buckets = set()
+        return self._buckets[1]
+
+    def make_hook_ops(self):
+        """Return the all-reduce ops to hook the backward.
+
+        Returns
+        -------
+        sequence of OperatorDef
+            The hook ops.
+
+        """
+        # Skip the micro-batches, if accumulating in this or last step
+        if self._accumulating or self._accumulated: return []
+        return [_allreduce_hook(bucket, self.bucket_size)
+                    for bucket in self._get_buckets()]
+
+    def on_hook_ops_scheduled(self, indices):
+        """Record the buckets reduced by the backward.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            The indices of scheduled hook ops.
+
+        Returns
+        -------
+        None
+
+        """
+        self._reduced_buckets = set(indices)
+
+    def _allreduce_grads(self):
+        """Run the bucketed all-reduce for the remaining grads.
+
+        Returns
+        -------
+        None
+
+        """
+        for i, bucket in enumerate(self._get_buckets()):
+            if i in self._reduced_buckets: continue
+            grads = [self._get_grad(p, p.__accumulating__) for p in bucket]
+            grads = [g for g in grads if g is not None]
+            if len(grads) > 0: _allreduce(grads, self.bucket_size)
+
     def zero_grad(self):
         """Set all gradients to zeros."""
         for group in self.param_groups:
@@ -145,6 +236,9 @@ class Optimizer(object):
                     grads.append(g)
                     p.__accumulating__ = True
         _accumulate(grads)
+        # The accumulated grads will be reduced before the update,
+        # reducing the hooked ones again is harmless as averaged
+        self._accumulating, self._reduced_buckets = True, set()
 
     def step(self, closure=None):
         """Perform one step update.
@@ -154,6 +248,12 @@ class Optimizer(object):
         None
 
         """
+        # Grads are reduced in the backward if hooked,
+        # otherwise, e.g. accumulated or computed by a traced graph,
+        # reduce the remaining buckets here
+        if self._allow_parallel: self._allreduce_grads()
+        self._reduced_buckets = set()
+        self._accumulated, self._accumulating = self._accumulating, False
         for group in self.param_groups:
             self._run_update_ops(group)
 
@@ -205,4 +305,5 @@ class Optimizer(object):
         if not param_set.isdisjoint(set(param_group['params'])):
             raise ValueError("some parameters appear in more than one parameter group")
 
-        self.param_groups.append(param_group)
\ No newline at end of file
+        self.param_groups.append(param_group)
+        self._buckets = None
\ No newline at end of file
@@ -18,6 +18,8 @@ from __future__ import division
 from __future__ import print_function
 
 import os, sys, io
+from dragon.core import serialization as _serialization
+from dragon.core.serialization import AsyncWriter
 from dragon.core.tensor_utils import ToArray as _to_array
 
 if sys.version_info[0] == 2:
@@ -60,36 +62,97 @@ def _with_file_like(f, mode, body):
             f.close()
 
 
-def _save_dict(obj):
-    """Recursively save the dict."""
+def _save_dict(obj, arrays, prefix='', copy=False):
+    """Recursively collect the arrays of dict."""
     if not isinstance(obj, dict):
         raise ValueError('Currently only the state dict can be saved.')
     py_dict = type(obj)()
     for k, v in obj.items():
-        if isinstance(v, dict): py_dict[k] = _save_dict(v)
-        elif hasattr(v, 'name'): py_dict[k] = _to_array(v, True)
+        key = prefix + str(k)
+        if isinstance(v, dict):
+            py_dict[k] = _save_dict(v, arrays, key + '/', copy)
+        elif hasattr(v, 'name'):
+            # Zero-copy, stream from the backend storage
+            array = _to_array(v, True)
+            arrays.append((key, array.copy() if copy else array))
+            py_dict[k] = _TensorRef(key)
         else: py_dict[k] = v
     return py_dict
 
 
 def _save(obj, f, pickle_module, pickle_protocol):
-    """Pickle the object into binary file."""
-    if not isinstance(obj, dict):
-        raise ValueError('Currently only the state dict can be saved.')
-    py_dict = type(obj)()
-    for k, v in obj.items():
-        if isinstance(v, dict): py_dict[k] = _save_dict(v)
-        elif hasattr(v, 'name'): py_dict[k] = _to_array(v, True)
-        else: py_dict[k] = v
-    pickle_module.dump(py_dict, f, pickle_protocol)
-
+    """Write the object into an indexed container."""
+    arrays = []
+    meta = _save_dict(obj, arrays)
+    _serialization.save(f, arrays, meta, pickle_protocol)
+
+
+def save(
+    obj,
+    f,
+    pickle_module=pickle,
+    pickle_protocol=DEFAULT_PROTOCOL,
+    writer=None,
+):
+    """Save the object into a file.
+
+    If ``writer`` is given, the tensors are copied into the host buffers,
+    and written by the background thread.
+
+    Parameters
+    ----------
+    obj : dict
+        The state dict to save.
+    f : str or file
+        The file to save.
+    pickle_module : module, optional
+        Not used, for compatibility.
+    pickle_protocol : int, optional
+        The pickle protocol for the header.
+    writer : dragon.core.serialization.AsyncWriter, optional
+        The writer to write asynchronously.
+
+    Returns
+    -------
+    None
 
-def save(obj, f, pickle_module=pickle, pickle_protocol=DEFAULT_PROTOCOL):
-    return _with_file_like(f, "wb",
-        lambda f: _save(obj, f, pickle_module, pickle_protocol))
+    """
+    if writer is None:
+        return _with_file_like(f, "wb",
+            lambda f: _save(obj, f, pickle_module, pickle_protocol))
+    if _is_real_file(f) or hasattr(f, 'write'):
+        raise ValueError('Excepted a file path to save asynchronously.')
+    f = str(f)
+    dir = os.path.dirname(f)
+    if dir != '' and not os.path.exists(dir): os.makedirs(dir)
+    arrays = []
+    meta = _save_dict(obj, arrays, copy=True)
+    writer.submit(f, lambda f: _serialization.save(
+        f, arrays, meta, pickle_protocol))
+
+
+class _TensorRef(str):
+    """The key of tensor in the indexed container."""
+    pass
+
+
+def _load_dict(meta, container, prefix):
+    """Recursively rebuild the dict with lazily mapped arrays."""
+    py_dict = type(meta)()
+    for k, v in meta.items():
+        if isinstance(v, dict):
+            v = _load_dict(v, container, prefix)
+            if len(v) > 0 or not prefix: py_dict[k] = v
+        elif isinstance(v, _TensorRef):
+            if v.startswith(prefix): py_dict[k] = container[v]
+        else: py_dict[k] = v
+    return py_dict
 
 
-def _load(f, map_location=None, pickle_module=pickle, file=None):
+def _load(f, map_location=None, pickle_module=pickle, file=None, prefix=''):
+    if _serialization.is_indexed(f):
+        container = _serialization.IndexedFile(f)
+        return _load_dict(container.meta, container, prefix)
     try:
         return pickle_module.load(f)
     except UnicodeDecodeError:
@@ -100,7 +163,29 @@ def _load(f, map_location=None, pickle_module=pickle, file=None):
         else: return pickle_module.load(f, encoding='iso-8859-1')
 
 
-def load(f, map_location=None, pickle_module=pickle):
+def load(f, map_location=None, pickle_module=pickle, prefix=''):
+    """Load the object from a file.
+
+    The arrays in the indexed container are memory-mapped,
+    and read lazily while feeding into the tensors.
+
+    Parameters
+    ----------
+    f : str or file
+        The file to load.
+    map_location : object, optional
+        Not used, for compatibility.
+    pickle_module : module, optional
+        The module to unpickle the legacy files.
+    prefix : str, optional
+        Load the tensors whose keys start with it.
+
+    Returns
+    -------
+    dict
+        The loaded object.
+
+    """
     new_fd = False
     file = None
     if isinstance(f, str) or \
@@ -110,7 +195,7 @@ def load(f, map_location=None, pickle_module=pickle):
         file = f
         f = open(f, 'rb')
     try:
-        return _load(f, map_location, pickle_module, file)
+        return _load(f, map_location, pickle_module, file, prefix)
     finally:
         if new_fd:
-            f.close()
\ No newline at end of file
+            f.close()
@@ -87,8 +87,11 @@ class Tensor(object):
     def _from_shape(self, shape, dtype):
         if isinstance(shape, six.integer_types): shape = [shape]
         self._static_shape = _Size(shape)
+        # Select a pooled tensor whose capacity fits
+        nbytes = numpy.dtype(dtype).itemsize * \
+            int(numpy.prod(shape, dtype='int64'))
         self._tensor = _tensor_utils.FromShape(
-            shape, dtype, _get_tensor_pool().get('${LEAF}'))
+            shape, dtype, _get_tensor_pool().get('${LEAF}', nbytes))
         self._ignored_grads = {self.name + '_grad'} \
             if not self._requires_grad else None
 
@@ -1619,7 +1622,7 @@ class Tensor(object):
     @property
     def grad_fn(self):
         return True if self.__jit_recorder__ \
-            and len(self.__jit_recorder__.ops) > 0 else None
+            and self.__jit_recorder__.op is not None else None
 
     def backward(self, gradient=None):
         raise NotImplementedError('Refer torch.autograd.variable.backward().')
@@ -1,6 +1,7 @@
 from distutils.core import setup
 import os.path, sys
 import shutil
+import subprocess
 
 packages = []
 
@@ -30,15 +31,27 @@ def find_modules():
         sys.exit()
 
 
+def find_protos(root_dir):
+    for dirpath, _, filenames in os.walk(root_dir):
+        for filename in filenames:
+            if not filename.endswith('.proto'): continue
+            if subprocess.call(['protoc', '-I=' + dirpath,
+                    '--python_out=' + dirpath,
+                        os.path.join(dirpath, filename)]) != 0:
+                print('ERROR: Unable to compile {}.'.format(filename))
+                sys.exit()
+
+
 def find_resources():
     c_lib = ['libdragon.*']
-    protos = ['protos/*.proto', 'vm/caffe/proto/*.proto']
+    protos = ['proto/*.proto', 'vm/caffe/proto/*.proto']
     others = []
     return c_lib + protos + others
 
 
 find_packages('dragon')
 find_modules()
+find_protos('dragon')
 
 
 setup(name = 'dragon',
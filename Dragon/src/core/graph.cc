@@ -1,4 +1,5 @@
 #include "core/graph.h"
+#include "core/profiler.h"
 #include "core/workspace.h"
 #include "core/graph_gradient.h"
 #include "core/graph_optimizer.h"
@@ -52,6 +53,57 @@ GraphBase::GraphBase(const GraphDef& def, Workspace* ws)
     }
 }
 
+/* Compile a plan of operators matched by the rules */
+
+int GraphBase::CompilePlan(
+    const string&               include,
+    const string&               exclude) {
+    const auto key = "rule:" + include + "/" + exclude;
+    const auto& it = plan_handles_.find(key);
+    if (it != plan_handles_.end()) return it->second;
+    vec32_t indices;
+    for (int i = 0; i < opt_def_.op_size(); ++i) {
+        const auto& type = opt_def_.op(i).type();
+        if (!include.empty() &&
+            !str::find(type, include)
+            ) continue;
+        if (!exclude.empty() &&
+            str::find(type, exclude)
+            ) continue;
+        indices.push_back(i);
+    }
+    int handle = CompilePlan(indices);
+    plan_handles_[key] = handle;
+    return handle;
+}
+
+/* Compile a plan of the specified operators */
+
+int GraphBase::CompilePlan(const vec32_t& indices) {
+    string key = "indices:";
+    for (auto idx : indices) {
+        CHECK(idx >= 0 && idx < opt_def_.op_size())
+            << "\nExcepted the operator index in [0, "
+            << opt_def_.op_size() << "), got " << idx << ".";
+        key += str::to(idx) + ",";
+    }
+    const auto& it = plan_handles_.find(key);
+    if (it != plan_handles_.end()) return it->second;
+    int handle = (int)plans_.size();
+    plans_.push_back(indices);
+    plan_handles_[key] = handle;
+    return handle;
+}
+
+/* Return the operator indices of the compiled plan */
+
+const vec32_t& GraphBase::plan(int handle) const {
+    CHECK(handle >= 0 && handle < (int)plans_.size())
+        << "\nPlan(" << handle << ") does not exist "
+        << "in Graph(" << name_ << ").";
+    return plans_[handle];
+}
+
 /* Create a graph from the optimized def */
 
 bool Graph::Create(const GraphDef& def, Workspace* ws) {
@@ -97,6 +149,10 @@ Graph::Graph(const GraphDef& def, Workspace* ws)
             opt_def = graph_optim.MirrorStage(
                 opt_def, subgraph_indices);
             opt_def = gradient_maker.Share(opt_def);
+            if (args().count("plan_memory") &&
+                    arg("plan_memory").i() > 0)
+                opt_def = graph_optim.PlanMemory(
+                    opt_def, subgraph_indices);
         } else {
             opt_def = graph_optim.SimulateGC(opt_def);
         }
@@ -123,17 +179,18 @@ bool Graph::Run(
     const string&               include,
     const string&               exclude,
     int                         stream_id) {
+    return RunPlan(CompilePlan(include, exclude), stream_id);
+}
+
+/* Run the compiled plan once synchronously */
+
+bool Graph::RunPlan(int handle, int stream_id) {
     LOG(DEBUG) << "Run Graph: " << name();
-    for (auto op : ops_) {
-        if (!include.empty() &&
-            !str::find(op->type(), include)
-            ) continue;
-        if (!exclude.empty() &&
-            str::find(op->type(), exclude)
-            ) continue;
+    for (auto idx : plan(handle)) {
+        auto* op = ops_[idx];
         op->SwitchToPhase(phase());
         LOG(DEBUG) << "$ Before Operator: " << op->name();
-        op->Run(stream_id);
+        RunOperatorWithProfiling(op, stream_id, name());
         LOG(DEBUG) << "$ After Operator: " << op->name();
     }
     return true;
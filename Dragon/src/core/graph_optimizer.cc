@@ -369,6 +369,194 @@ GraphDef GraphOptimizer::SimulateGC(const GraphDef& input_def) {
     return output_def;
 }
 
+/* Plan the buffers by the liveness of intermediates (-O3) */
+
+GraphDef GraphOptimizer::PlanMemory(
+    const GraphDef&                 input_def,
+    const Map<string, vec32_t>&     op_indices) {
+    static Set<string> dim_ops = {
+        "Shape",
+        "Squeeze",
+        "Reshape",
+        "Flatten",
+        "ExpandDims",
+    };
+
+    // Group the names by the real tensor
+    Set<string> blacklist;
+    Map<string, int> first, last;
+    Map<string, int64_t> sizes;
+    vector<string> groups;
+    auto get_group = [this](const string& name) {
+        return ws_->GetTensorName(name);
+    };
+
+    // The recomputing reads and writes the tensors implicitly
+    for (const auto& it : op_indices) {
+        for (auto idx : it.second) {
+            const auto& op = input_def.op(idx);
+            for (const auto& e : op.input()) blacklist.insert(get_group(e));
+            for (const auto& e : op.output()) blacklist.insert(get_group(e));
+        }
+    }
+    // We should preserve the inputs, targets and gradients
+    for (const auto& e : input_def.input()) blacklist.insert(get_group(e));
+    for (const auto& e : input_def.output()) blacklist.insert(get_group(e));
+    for (const auto& g : input_def.gradient()) {
+        blacklist.insert(get_group(g.cost()));
+        blacklist.insert(get_group(g.wrt()));
+    }
+
+    // Compute the lifetime of intermediates
+    for (int i = 0; i < input_def.op_size(); ++i) {
+        const auto& op = input_def.op(i);
+        for (const auto& e : op.input()) {
+            auto group = get_group(e);
+            // The tensor is consumed before produced
+            if (!first.count(group)) blacklist.insert(group);
+            last[group] = i;
+        }
+        // The tensors referred by arguments, e.g. ``shape_like``
+        for (const auto& arg : op.arg()) {
+            if (arg.has_s()) blacklist.insert(get_group(arg.s()));
+            for (const auto& e : arg.strings())
+                blacklist.insert(get_group(e));
+        }
+        // The outputs share the memory of input
+        if (dim_ops.count(op.type())) {
+            blacklist.insert(get_group(op.input(0)));
+            for (const auto& e : op.output())
+                blacklist.insert(get_group(e));
+        }
+        for (const auto& e : op.output()) {
+            auto group = get_group(e);
+            // The gradients are shared by the gradient maker,
+            // and the init operators are left as the persistent
+            if (str::find(op.type(), "Gradient") ||
+                    op.input_size() == 0)
+                blacklist.insert(group);
+            if (!first.count(group)) {
+                first[group] = i;
+                groups.push_back(group);
+            }
+            last[group] = i;
+        }
+    }
+
+    // The static sizes inferred by the frontend
+    Map<string, int64_t> static_sizes;
+    for (const auto& arg : input_def.arg()) {
+        if (arg.name() != "static_names") continue;
+        for (const auto& arg_v2 : input_def.arg()) {
+            if (arg_v2.name() != "static_sizes") continue;
+            CHECK_EQ(arg.strings_size(), arg_v2.ints_size())
+                << "\nExcepted " << arg.strings_size()
+                << " static sizes, got " << arg_v2.ints_size() << ".";
+            for (int i = 0; i < arg.strings_size(); ++i) {
+                auto& size = static_sizes[get_group(arg.strings(i))];
+                size = std::max(size, arg_v2.ints(i));
+            }
+        }
+    }
+
+    // Collect the planned groups, and the known sizes
+    Set<string> planned;
+    vector<vector<string>> births(input_def.op_size());
+    vector<vector<string>> deaths(input_def.op_size());
+    for (const auto& group : groups) {
+        if (blacklist.count(group) || group == "NULL" ||
+                group.empty() || group[0] == '/') continue;
+        planned.insert(group);
+        births[first[group]].push_back(group);
+        deaths[last[group]].push_back(group);
+        if (static_sizes.count(group)) {
+            sizes[group] = static_sizes[group];
+        } else {
+            auto* tensor = ws_->TryGetTensor(group);
+            sizes[group] = tensor ? (int64_t)tensor->nbytes() : 0;
+        }
+    }
+
+    // Round up the size to the class of 4 steps per power of 2,
+    // which wastes at most 25% of the buffer
+    auto get_size_class = [](int64_t size) -> int64_t {
+        if (size <= 0) return 0;
+        int64_t base = 256;
+        while (base * 2 < size) base *= 2;
+        int64_t step = base / 4;
+        return (size + step - 1) / step * step;
+    };
+
+    // Assign the buffers by the best-fit of size class,
+    // or the latest released one if the size is unknown
+    vector<int64_t> capacities;
+    std::map<int64_t, vector<int>> pools;
+    Map<string, int> buffer_indices;
+    int64_t unplanned_size = 0;
+    int num_unknowns = 0, num_lives = 0, peak_lives = 0;
+    for (int i = 0; i < input_def.op_size(); ++i) {
+        for (const auto& group : births[i]) {
+            int64_t size = sizes[group];
+            int64_t size_class = get_size_class(size);
+            int buffer_idx = -1;
+            auto it = pools.lower_bound(size_class);
+            // The larger classes are reused within 2x
+            while (it != pools.end() && it->second.empty()) ++it;
+            if (it != pools.end() && (size_class == 0 ?
+                    it->first == 0 : it->first <= size_class * 2)) {
+                buffer_idx = it->second.back();
+                it->second.pop_back();
+            } else {
+                buffer_idx = (int)capacities.size();
+                capacities.push_back(size_class);
+            }
+            buffer_indices[group] = buffer_idx;
+            unplanned_size += size;
+            if (size == 0) num_unknowns++;
+            peak_lives = std::max(peak_lives, ++num_lives);
+        }
+        for (const auto& group : deaths[i]) {
+            int buffer_idx = buffer_indices[group];
+            pools[capacities[buffer_idx]].push_back(buffer_idx);
+            num_lives--;
+        }
+    }
+
+    // Report the planned peak memory
+    int64_t planned_size = 0;
+    Set<int64_t> size_classes;
+    for (auto e : capacities) {
+        planned_size += e;
+        if (e > 0) size_classes.insert(e);
+    }
+    LOG(INFO) << "Graph(" << input_def.name() << ") plans "
+              << planned.size() << " intermediates into "
+              << capacities.size() << " buffers of "
+              << size_classes.size() << " size classes, "
+              << "peak lives: " << peak_lives << ", "
+              << "peak memory: " << planned_size / 1048576.f << " MB "
+              << "(was " << unplanned_size / 1048576.f << " MB)"
+              << (num_unknowns > 0 ? ", " + str::to(num_unknowns) +
+                  " sizes are unknown." : ".");
+
+    // Rewritten the inputs and outputs
+    auto output_def(input_def);
+    auto rename = [&](string* name) {
+        const auto& it = buffer_indices.find(get_group(*name));
+        if (it != buffer_indices.end())
+            *name = "/share/buffer/plan:" + str::to(it->second);
+    };
+    for (int i = 0; i < input_def.op_size(); ++i) {
+        auto* op_v2 = output_def.mutable_op(i);
+        for (int j = 0; j < op_v2->input_size(); ++j)
+            rename(op_v2->mutable_input(j));
+        for (int j = 0; j < op_v2->output_size(); ++j)
+            rename(op_v2->mutable_output(j));
+    }
+
+    return output_def;
+}
+
 /* Traverse from input gradients to dying the nodes */
 
 void GraphOptimizer::ForwardPruneTraversal(
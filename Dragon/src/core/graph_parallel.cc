@@ -0,0 +1,197 @@
+#include "core/profiler.h"
+#include "core/workspace.h"
+#include "core/graph_parallel.h"
+
+namespace dragon {
+
+/* Default constructor of <ParallelGraph> */
+
+ParallelGraph::ParallelGraph(const GraphDef& def, Workspace* ws)
+    : Graph(def, ws), sequential_(false),
+      num_remaining_(0), stream_id_(0),
+      mask_(nullptr), stop_(false) {
+    num_threads_ = (int)std::thread::hardware_concurrency();
+    if (args().count("num_threads") &&
+        arg("num_threads").i() > 0)
+        num_threads_ = (int)arg("num_threads").i();
+    for (auto* op : ops_) {
+        // The streams of devices are not thread-safe
+        if (op->def().device_option().device_type() != PROTO_CPU) {
+            sequential_ = true;
+            LOG(WARNING) << "Run the Graph(" << name() << ") "
+                         << "sequentially on the non-CPU device.";
+            break;
+        }
+        // The recomputing writes the buffers implicitly
+        if (!op->subgraph().empty()) { sequential_ = true; break; }
+    }
+    if (num_threads_ <= 1) sequential_ = true;
+    if (sequential_) return;
+    BuildDependency();
+    for (int i = 1; i < num_threads_; ++i) {
+        workers_.emplace_back([this, i]() {
+            // Use the exclusive temporal data
+            Workspace::data_slot() = i;
+            RunLoop(true);
+        });
+    }
+}
+
+/* Default deconstructor of <ParallelGraph> */
+
+ParallelGraph::~ParallelGraph() {
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        stop_ = true;
+    }
+    cond_.notify_all();
+    for (auto& worker : workers_) worker.join();
+}
+
+/* Build the dependencies of operators */
+
+void ParallelGraph::BuildDependency() {
+    static Set<string> collective_ops = {
+        "MPIBroadcast",
+        "MPIBroadcastGradient",
+        "MPIGather",
+        "MPIGatherGradient",
+        "CollectiveUpdate",
+    };
+
+    Map<string, int> last_writer;
+    Map<string, vec32_t> readers;
+    children_.assign(ops_.size(), vec32_t());
+    num_parents_.assign(ops_.size(), 0);
+
+    // Resolve the alias and version to the real tensor
+    auto get_key = [this](const string& name) {
+        auto key = ws()->GetTensorName(name);
+        auto ver_pos = key.find("/ver:");
+        if (ver_pos != string::npos) key = key.substr(0, ver_pos);
+        return key;
+    };
+
+    for (int i = 0; i < (int)ops_.size(); ++i) {
+        const auto& op_def = opt_def().op(i);
+        Set<string> reads, writes;
+        for (const auto& e : op_def.input()) {
+            // The dummy tensor may be reshaped by any operator
+            if (e == "NULL") writes.insert(e);
+            else reads.insert(get_key(e));
+        }
+        for (const auto& e : op_def.output()) writes.insert(get_key(e));
+        // The tensors referred by arguments, e.g. ``shape_like``
+        for (const auto& arg : op_def.arg()) {
+            vector<string> names(arg.strings().begin(), arg.strings().end());
+            if (arg.has_s()) names.push_back(arg.s());
+            for (const auto& e : names) {
+                auto key = get_key(e);
+                if (last_writer.count(key) || ws()->HasTensor(e))
+                    reads.insert(key);
+            }
+        }
+        // Handle the handcraft cases
+        if (op_def.type() == "NonZero") {
+            writes.insert("/share/buffer/grad:0");
+            writes.insert("/share/buffer/grad:1");
+        } else if (collective_ops.count(op_def.type())) {
+            // Keep the order of collectives across the nodes
+            writes.insert("/graph/collective");
+        }
+
+        set<int> parents;
+        for (const auto& key : reads) {
+            if (last_writer.count(key)) parents.insert(last_writer[key]);
+        }
+        for (const auto& key : writes) {
+            if (last_writer.count(key)) parents.insert(last_writer[key]);
+            for (auto idx : readers[key]) parents.insert(idx);
+        }
+        for (const auto& key : reads) readers[key].push_back(i);
+        for (const auto& key : writes) {
+            last_writer[key] = i; readers[key].clear();
+        }
+        parents.erase(i);
+        for (auto idx : parents) children_[idx].push_back(i);
+        num_parents_[i] = (int)parents.size();
+    }
+}
+
+/* Run the ready operators until finished */
+
+void ParallelGraph::RunLoop(bool is_worker) {
+    std::unique_lock<std::mutex> lock(mutex_);
+    while (true) {
+        cond_.wait(lock, [this, is_worker]() {
+            return stop_ || !ready_.empty() ||
+                (!is_worker && num_remaining_ == 0);
+        });
+        if (stop_) return;
+        if (ready_.empty()) return;  // Finished
+        int idx = ready_.front(); ready_.pop_front();
+        lock.unlock();
+        if ((*mask_)[idx]) {
+            auto* op = ops_[idx];
+            op->SwitchToPhase(phase());
+            LOG(DEBUG) << "$ Before Operator: " << op->name();
+            RunOperatorWithProfiling(op, stream_id_, name());
+            LOG(DEBUG) << "$ After Operator: " << op->name();
+        }
+        lock.lock();
+        int num_ready = 0;
+        for (auto child : children_[idx]) {
+            if (--pending_[child] == 0) {
+                ready_.push_back(child); ++num_ready;
+            }
+        }
+        if (--num_remaining_ == 0) {
+            cond_.notify_all();
+        } else if (num_ready > 1) {
+            cond_.notify_all();
+        } else if (num_ready == 1) {
+            cond_.notify_one();
+        }
+    }
+}
+
+/* Run the graph once synchronously */
+
+bool ParallelGraph::Run(
+    const string&               include,
+    const string&               exclude,
+    int                         stream_id) {
+    return RunPlan(CompilePlan(include, exclude), stream_id);
+}
+
+/* Run the compiled plan once synchronously */
+
+bool ParallelGraph::RunPlan(int handle, int stream_id) {
+    if (sequential_) return Graph::RunPlan(handle, stream_id);
+    LOG(DEBUG) << "Run Graph: " << name();
+    if (ops_.empty()) return true;
+    plan(handle);  // Check the handle
+    // The unselected operators are kept as the barriers
+    while ((int)masks_.size() < num_plans()) {
+        masks_.emplace_back(ops_.size(), false);
+        for (auto idx : plan((int)masks_.size() - 1))
+            masks_.back()[idx] = true;
+    }
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        mask_ = &masks_[handle];
+        stream_id_ = stream_id;
+        pending_ = num_parents_;
+        num_remaining_ = (int)ops_.size();
+        for (int i = 0; i < (int)ops_.size(); ++i)
+            if (pending_[i] == 0) ready_.push_back(i);
+    }
+    cond_.notify_all();
+    // The caller also runs the operators
+    RunLoop(false);
+    return true;
+}
+
+REGISTER_GRAPH(Parallel, ParallelGraph);
+
+}  // namespace dragon
@@ -0,0 +1,76 @@
+#include "core/workspace.h"
+#include "core/profiler.h"
+
+namespace dragon {
+
+/* Run the operator and record the event */
+
+void Profiler::Run(
+    OperatorBase*               op,
+    int                         stream_id,
+    const string&               category) {
+    Event event;
+    event.name = op->name();
+    event.type = op->type();
+    event.category = category;
+    event.thread_id = Workspace::data_slot();
+
+    // The scope is parsed from the first named output,
+    // while the shared buffers are left as the empty scope
+    for (const auto& e : op->def().output()) {
+        if (e.empty() || e[0] == '/') continue;
+        auto pos = e.rfind('/');
+        if (pos != string::npos) event.scope = e.substr(0, pos);
+        break;
+    }
+
+    // The allocated bytes are the growth of capacities
+    auto* data = op->ws()->TryGetTensor(Workspace::data_name());
+    int64_t capacity = data ? (int64_t)data->capacity() : 0;
+    for (int i = 0; i < op->XSize(); ++i)
+        event.input_shapes.push_back(op->X(i).dims());
+    for (int i = 0; i < op->YSize(); ++i)
+        capacity += (int64_t)op->Y(i)->capacity();
+
+    auto start = Clock::now();
+    op->Run(stream_id);
+#ifdef WITH_CUDA
+    const auto& option = op->def().device_option();
+    if (option.device_type() == PROTO_CUDA) {
+        CUDAContext::SyncStream(CUDAContext::obj()
+            ->stream(option.device_id(), stream_id));
+    }
+#endif
+    auto end = Clock::now();
+
+    data = op->ws()->TryGetTensor(Workspace::data_name());
+    event.bytes = data ? (int64_t)data->capacity() : 0;
+    for (int i = 0; i < op->YSize(); ++i) {
+        event.output_shapes.push_back(op->Y(i)->dims());
+        event.bytes += (int64_t)op->Y(i)->capacity();
+    }
+    event.bytes = std::max(event.bytes - capacity, (int64_t)0);
+    event.start = std::chrono::duration_cast<
+        std::chrono::microseconds>(start - origin_).count();
+    event.duration = std::chrono::duration_cast<
+        std::chrono::microseconds>(end - start).count();
+
+    std::lock_guard<std::mutex> lock(mutex_);
+    events_.emplace_back(std::move(event));
+}
+
+/* Return a copy of the recorded events */
+
+vector<Profiler::Event> Profiler::events() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return events_;
+}
+
+/* Remove all the recorded events */
+
+void Profiler::Reset() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    events_.clear();
+}
+
+}  // namespace dragon
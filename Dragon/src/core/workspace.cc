@@ -1,5 +1,6 @@
 #include "core/operator.h"
 #include "core/graph.h"
+#include "core/profiler.h"
 #include "core/workspace.h"
 
 namespace dragon {
@@ -45,8 +46,11 @@ Tensor* Workspace::TryGetTensor(
     string query = GetTensorName(name);
 
     // Search the local workspace
-    const auto& it = tensor_map_.find(query);
-    if (it != tensor_map_.end()) return it->second.get();
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        const auto& it = tensor_map_.find(query);
+        if (it != tensor_map_.end()) return it->second.get();
+    }
 
     if (use_remote) {
         // Search the remote workspaces
@@ -63,9 +67,10 @@ Tensor* Workspace::TryGetTensor(
 Tensor* Workspace::CreateTensor(const string& name) {
     Tensor* tensor = TryGetTensor(name);
     if (!tensor) {
-        tensor_map_[name] = unique_ptr
-            <Tensor>(new Tensor(name));
-        return tensor_map_[name].get();
+        std::lock_guard<std::mutex> lock(mutex_);
+        auto& new_tensor = tensor_map_[name];
+        if (!new_tensor) new_tensor.reset(new Tensor(name));
+        return new_tensor.get();
     }
     return tensor;
 }
@@ -163,7 +168,21 @@ OperatorBase* Workspace::CreateOperator(const OperatorDef& def) {
 
 void Workspace::RunOperator(const OperatorDef& def) {
     auto* op = CreateOperator(def);
-    op->UpdateFrom(def); op->Run(0);
+    op->UpdateFrom(def);
+    RunOperatorWithProfiling(op, 0, "Eager");
+}
+
+/* Delete the specified persistent operator */
+
+void Workspace::DeleteOperator(const string& uid) {
+    // Remove the derived ones, e.g., the hooks
+    const string prefix = uid + "/";
+    for (auto it = operator_map_.begin(); it != operator_map_.end();) {
+        if (it->first == uid || it->first.compare(
+                0, prefix.size(), prefix) == 0) {
+            it = operator_map_.erase(it);
+        } else { ++it; }
+    }
 }
 
 /* Run the specified operator once */
@@ -171,7 +190,7 @@ void Workspace::RunOperator(const OperatorDef& def) {
 void Workspace::RunOperatorOnce(const OperatorDef& def) {
     unique_ptr<OperatorBase> new_op(
         NewOperator(def, this)
-    ); new_op->Run(0);
+    ); RunOperatorWithProfiling(new_op.get(), 0, "Eager");
 }
 
 /* Create a Graph in this workspace */
@@ -201,10 +220,26 @@ void Workspace::RunGraph(
     const string&               include,
     const string&               exclude,
     int                         stream_id) {
-    if (!graph_map_.count(graph_name))
+    GetGraph(graph_name)->Run(include, exclude, stream_id);
+}
+
+/* Run the specifed graph by name and compiled plan */
+
+void Workspace::RunGraph(
+    const string&               graph_name,
+    int                         plan_handle,
+    int                         stream_id) {
+    GetGraph(graph_name)->RunPlan(plan_handle, stream_id);
+}
+
+/* Return the specified graph */
+
+GraphBase* Workspace::GetGraph(const string& graph_name) const {
+    const auto& it = graph_map_.find(graph_name);
+    if (it == graph_map_.end())
         LOG(FATAL) << "Graph(" << graph_name
                    << ") does not exist.";
-    graph_map_[graph_name]->Run(include, exclude, stream_id);
+    return it->second.get();
 }
 
 /* Return the name of stored graphs */
@@ -0,0 +1,183 @@
+#include "utils/op_kernel.h"
+#include "utils/omp_alternative.h"
+
+namespace dragon {
+
+namespace kernel {
+
+template <typename T>
+T _sigmoid(T x) { return T(1) / (T(1) + exp(-x)); }
+
+/* <T = float32, Device = CPU> */
+
+template <> void RNNUnit<float, CPUContext>(
+    const int               N,
+    const int               C,
+    const bool              relu,
+    const float*            bx,
+    const float*            bh,
+    const float*            x,
+    float*                  h,
+    CPUContext*             ctx) {
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(OMP_THREADS(N * C))
+#endif
+    for (int i = 0; i < N * C; ++i) {
+        const int j = i % C;
+        const float v = x[i] + bx[j] + bh[j];
+        h[i] = relu ? std::max(v, 0.f) : tanh(v);
+    }
+}
+
+/* <T = float32, Device = CPU> */
+
+template <> void RNNUnitGrad<float, CPUContext>(
+    const int               N,
+    const int               C,
+    const bool              relu,
+    const float*            h,
+    const float*            dh,
+    float*                  dx,
+    CPUContext*             ctx) {
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(OMP_THREADS(N * C))
+#endif
+    for (int i = 0; i < N * C; ++i) {
+        dx[i] = relu ? (h[i] > 0.f ? dh[i] : 0.f) :
+            dh[i] * (1.f - h[i] * h[i]);
+    }
+}
+
+/* <T = float32, Device = CPU> */
+
+template <> void LSTMUnit<float, CPUContext>(
+    const int               N,
+    const int               C,
+    const float*            cx,
+    const float*            bx,
+    const float*            bh,
+    float*                  x,
+    float*                  c,
+    float*                  h,
+    CPUContext*             ctx) {
+    // The gates are arranged as (i, f, g, o)
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(OMP_THREADS(N * C))
+#endif
+    for (int idx = 0; idx < N * C; ++idx) {
+        const int n = idx / C, j = idx % C;
+        float* xi = x + n * 4 * C + j;
+        const float i = xi[0] = _sigmoid(
+            xi[0] + bx[j] + bh[j]);
+        const float f = xi[C] = _sigmoid(
+            xi[C] + bx[j + C] + bh[j + C]);
+        const float g = xi[2 * C] = tanh(
+            xi[2 * C] + bx[j + 2 * C] + bh[j + 2 * C]);
+        const float o = xi[3 * C] = _sigmoid(
+            xi[3 * C] + bx[j + 3 * C] + bh[j + 3 * C]);
+        c[idx] = f * cx[idx] + i * g;
+        h[idx] = o * tanh(c[idx]);
+    }
+}
+
+/* <T = float32, Device = CPU> */
+
+template <> void LSTMUnitGrad<float, CPUContext>(
+    const int               N,
+    const int               C,
+    const float*            cx,
+    const float*            x,
+    const float*            c,
+    const float*            dh,
+    float*                  dc,
+    float*                  dx,
+    CPUContext*             ctx) {
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(OMP_THREADS(N * C))
+#endif
+    for (int idx = 0; idx < N * C; ++idx) {
+        const int n = idx / C, j = idx % C;
+        const float* xi = x + n * 4 * C + j;
+        float* dxi = dx + n * 4 * C + j;
+        const float i = xi[0], f = xi[C];
+        const float g = xi[2 * C], o = xi[3 * C];
+        const float tanh_c = tanh(c[idx]);
+        // dc_{t} = dh_{t} * o * (1 - tanh(c_{t})^2) + dc_{t+1} * f_{t+1}
+        const float dct = dh[idx] * o *
+            (1.f - tanh_c * tanh_c) + dc[idx];
+        dxi[0] = dct * g * i * (1.f - i);
+        dxi[C] = dct * cx[idx] * f * (1.f - f);
+        dxi[2 * C] = dct * i * (1.f - g * g);
+        dxi[3 * C] = dh[idx] * tanh_c * o * (1.f - o);
+        dc[idx] = dct * f;
+    }
+}
+
+/* <T = float32, Device = CPU> */
+
+template <> void GRUUnit<float, CPUContext>(
+    const int               N,
+    const int               C,
+    const float*            hx,
+    const float*            bx,
+    const float*            bh,
+    const float*            rx,
+    float*                  x,
+    float*                  hn,
+    float*                  h,
+    CPUContext*             ctx) {
+    // The gates are arranged as (r, z, n),
+    // and the reset gate is applied after the recurrent projection
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(OMP_THREADS(N * C))
+#endif
+    for (int idx = 0; idx < N * C; ++idx) {
+        const int n = idx / C, j = idx % C;
+        float* xi = x + n * 3 * C + j;
+        const float* ri = rx + n * 3 * C + j;
+        const float r = xi[0] = _sigmoid(
+            xi[0] + ri[0] + bx[j] + bh[j]);
+        const float z = xi[C] = _sigmoid(
+            xi[C] + ri[C] + bx[j + C] + bh[j + C]);
+        hn[idx] = ri[2 * C] + bh[j + 2 * C];
+        const float g = xi[2 * C] = tanh(
+            xi[2 * C] + bx[j + 2 * C] + r * hn[idx]);
+        h[idx] = (1.f - z) * g + z * hx[idx];
+    }
+}
+
+/* <T = float32, Device = CPU> */
+
+template <> void GRUUnitGrad<float, CPUContext>(
+    const int               N,
+    const int               C,
+    const float*            hx,
+    const float*            x,
+    const float*            hn,
+    float*                  dh,
+    float*                  dx,
+    float*                  drx,
+    CPUContext*             ctx) {
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(OMP_THREADS(N * C))
+#endif
+    for (int idx = 0; idx < N * C; ++idx) {
+        const int n = idx / C, j = idx % C;
+        const float* xi = x + n * 3 * C + j;
+        float* dxi = dx + n * 3 * C + j;
+        float* dri = drx + n * 3 * C + j;
+        const float r = xi[0], z = xi[C], g = xi[2 * C];
+        const float dg = dh[idx] * (1.f - z) * (1.f - g * g);
+        dxi[0] = dri[0] = dg * hn[idx] * r * (1.f - r);
+        dxi[C] = dri[C] = dh[idx] *
+            (hx[idx] - g) * z * (1.f - z);
+        dxi[2 * C] = dg;
+        dri[2 * C] = dg * r;
+        // The direct path of h_{t-1}
+        dh[idx] *= z;
+    }
+}
+
+}  // namespace kernel
+
+}  // namepsace dragon
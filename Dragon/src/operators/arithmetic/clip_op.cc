@@ -6,28 +6,29 @@
 namespace dragon {
 
 #define DEFINE_TYPED_RUN_IMPL \
-    lowT_ = low_, highT_ = high_; \
+    auto low = this->low(), high = this->high(); \
+    lowT_ = low, highT_ = high; \
     if (XIsType(X(0), int8_t)) { \
-        lowT_ = std::max(low_, -128.f); \
-        highT_ = std::min(high_, 127.f); \
+        lowT_ = std::max(low, -128.f); \
+        highT_ = std::min(high, 127.f); \
         RunImpl<int8_t>(); \
     } else if (XIsType(X(0), uint8_t)) { \
-        lowT_ = std::max(low_, 0.f); \
-        highT_ = std::min(high_, 255.f); \
+        lowT_ = std::max(low, 0.f); \
+        highT_ = std::min(high, 255.f); \
         RunImpl<uint8_t>(); \
     } else if (XIsType(X(0), int)) { \
         /* Careful bounds for float32 -> int32 */ \
-        lowT_ = std::max(low_, -214748e4f); \
-        highT_ = std::min(high_, 214748e4f); \
+        lowT_ = std::max(low, -214748e4f); \
+        highT_ = std::min(high, 214748e4f); \
         RunImpl<int>(); \
     } else if (XIsType(X(0), int64_t)) { \
         /* Careful bounds for float32 -> int64 */ \
-        lowT_ = std::max(low_, -922337e13f); \
-        highT_ = std::min(high_, 922337e13f); \
+        lowT_ = std::max(low, -922337e13f); \
+        highT_ = std::min(high, 922337e13f); \
         RunImpl<int64_t>(); \
     } else if (XIsType(X(0), float16)) { \
-        lowT_ = std::max(low_, -65505.f); \
-        highT_ = std::min(high_, 65504.f); \
+        lowT_ = std::max(low, -65505.f); \
+        highT_ = std::min(high, 65504.f); \
         RunImpl<float16>(); \
     } else if (XIsType(X(0), float)) { \
         RunImpl<float>(); \
@@ -11,7 +11,7 @@ void MaskedSelectOp<Context>::RunImpl() {
     auto* x = X(0).template data<T, Context>();
     auto* mask = X(1).template raw_data<Context>();
 
-    auto* scratch = ws()->CreateTensor("/share/data");
+    auto* scratch = ws()->CreateTensor(ws()->data_name());
     auto* indices = ws()->CreateTensor(unique_name("indices"));
 
     kernel::MaskedSelect(
@@ -18,7 +18,7 @@ void NonZeroOp<Context>::RunImpl() {
     auto nelements = X(0).count();
     auto* x = X(0).template data<T, Context>();
 
-    auto* scratch = ws()->CreateTensor("/share/data");
+    auto* scratch = ws()->CreateTensor(ws()->data_name());
     auto* indices = ws()->CreateTensor("/share/buffer/grad:0");
 
     auto* mask = ws()
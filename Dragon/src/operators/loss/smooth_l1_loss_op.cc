@@ -17,7 +17,7 @@ void SmoothL1LossOp<Context>::RunImpl() {
         ->template mutable_data<T, Context>();
 
     auto* err = ws()
-        ->CreateTensor("/share/smoothl1/err")
+        ->CreateTensor(ws()->slot_name("/share/smoothl1/err"))
         ->ReshapeLike(X(0))
         ->template mutable_data<T, Context>();
 
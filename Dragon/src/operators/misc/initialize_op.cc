@@ -36,7 +36,7 @@ void FillOp<Context>::RunImpl() {
 
     math::Set(
         Y(0)->count(),
-        cast::to<T>(value_),
+        cast::to<T>(value()),
         y, ctx()
     );
 }
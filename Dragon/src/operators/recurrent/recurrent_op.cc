@@ -1,18 +1,446 @@
 #include "core/workspace.h"
+#include "utils/filler.h"
 #include "utils/op_kernel.h"
 #include "utils/math_functions.h"
 #include "operators/recurrent/recurrent_op.h"
 
 namespace dragon {
 
-DEPLOY_CPU(Recurrent);
-#ifdef WITH_CUDA
-DEPLOY_CUDA(Recurrent);
-#endif
+template <class Context>
+void RecurrentOpBase<Context>::Reshape() {
+    seq_length_ = X(0).dim(0);
+    batch_size_ = X(0).dim(1);
+    input_size_ = X(0).dim(2);
+    auto TN = seq_length_ * batch_size_;
+    auto GH = num_gates_ * hidden_size_;
+    auto DH = num_directions_ * hidden_size_;
+    output_dims_ = { seq_length_, batch_size_, DH };
+    hidden_dims_ = {
+        num_layers_ * num_directions_,
+        batch_size_, hidden_size_
+    };
+
+    // Compute the offsets of packed weights
+    int64_t nlayers = num_layers_ * num_directions_;
+    int64_t w_count = 0, b_count = 0;
+    matrix_ofs_.resize(nlayers); bias_ofs_.resize(nlayers);
+    for (int i = 0; i < num_layers_; ++i) {
+        for (int j = 0; j < num_directions_; ++j) {
+            auto id = i * num_directions_ + j;
+            matrix_ofs_[id] = w_count;
+            bias_ofs_[id] = b_count;
+            w_count += GH * (input_size(i) + hidden_size_);
+            b_count += GH * 2;
+        }
+    }
+    for (auto& ofs : bias_ofs_) ofs += w_count;
+    weight_count_ = w_count + b_count;
+
+    // Compute the offsets of reserved buffers
+    int64_t ofs = 0;
+    gates_ofs_.resize(nlayers); hidden_ofs_.resize(nlayers);
+    cell_ofs_.resize(nlayers); extra_ofs_.resize(nlayers);
+    for (int i = 0; i < nlayers; ++i) {
+        gates_ofs_[i] = ofs; ofs += TN * GH;
+        hidden_ofs_[i] = ofs; ofs += TN * hidden_size_;
+        cell_ofs_[i] = ofs;
+        if (rnn_mode_ == "lstm") ofs += TN * hidden_size_;
+        extra_ofs_[i] = ofs;
+        if (rnn_mode_ == "gru") ofs += TN * hidden_size_;
+    }
+    output_ofs_.resize(num_layers_); dropout_ofs_.resize(num_layers_);
+    for (int i = 0; i < num_layers_ - 1; ++i) {
+        output_ofs_[i] = ofs; ofs += TN * DH;
+        dropout_ofs_[i] = ofs;
+        if (use_dropout_) ofs += TN * DH;
+    }
+    reserve_size_ = ofs;
+}
+
+template <class Context> template <typename T>
+void RecurrentOp<Context>::RunImpl() {
+    this->Reshape();
+    CHECK_EQ(X(1).count(), weight_count_)
+        << "\nExcepted the size of weights is " << weight_count_
+        << ", but got " << X(1).count();
+
+    if (XSize() > 2) { TENSOR_FILL(X(2), hidden_dims_); }
+    if (XSize() > 3) { TENSOR_FILL(X(3), hidden_dims_); }
+
+    Y(0)->Reshape(output_dims_);
+    if (YSize() > 1) Y(1)->Reshape(hidden_dims_);
+    if (YSize() > 2) Y(2)->Reshape(hidden_dims_);
+
+    auto xAt = [this](int i) {
+        if (i >= XSize()) return (const T*)NULL;
+        return X(i).template data<T, Context>();
+    };
+
+    auto yAt = [this](int i) {
+        if (i >= YSize()) return (T*)NULL;
+        if (Y(i)->name() == "NULL") return (T*)NULL;
+        return Y(i)->template mutable_data<T, Context>();
+    };
+
+    const bool is_train = phase() == "TRAIN";
+    const int64_t N = batch_size_, H = hidden_size_;
+    const int64_t NH = N * H, TN = seq_length_ * N;
+    const int64_t GH = num_gates_ * H, DH = num_directions_ * H;
+
+    auto* x = xAt(0); auto* w = xAt(1);
+    auto* hx = xAt(2); auto* cx = xAt(3);
+    auto* y = Y(0)->template mutable_data<T, Context>();
+    auto* hy = yAt(1); auto* cy = yAt(2);
+
+    // Keep the reserved buffers for backward when training
+    auto scratch = ws()->template data<T, Context>({
+        N * GH, NH, is_train ? 0 : reserve_size_ });
+    auto* rx = scratch[0], *zeros = scratch[1];
+    auto* reserve = is_train ? ws()
+        ->CreateTensor(unique_name("reserve"))
+        ->Reshape({ reserve_size_ })
+        ->template mutable_data<T, Context>() : scratch[2];
+    uint8_t* mask = nullptr;
+    if (is_train && use_dropout_) {
+        mask = ws()
+            ->CreateTensor(unique_name("mask"))
+            ->Reshape({ (num_layers_ - 1) * TN * DH })
+            ->template mutable_data<uint8_t, Context>();
+    }
+    math::Set(NH, cast::to<T>(0.f), zeros, ctx());
+
+    const T* xl = x;
+    for (int i = 0; i < num_layers_; ++i) {
+        auto isz = input_size(i);
+        auto* yl = i == num_layers_ - 1 ?
+            y : reserve + output_ofs_[i];
+        for (int j = 0; j < num_directions_; ++j) {
+            auto id = i * num_directions_ + j;
+            auto* wx = w + matrix_ofs_[id];
+            auto* wh = wx + GH * isz;
+            auto* bx = w + bias_ofs_[id];
+            auto* bh = bx + GH;
+            auto* gates = reserve + gates_ofs_[id];
+            auto* h = reserve + hidden_ofs_[id];
+            auto* c = reserve + cell_ofs_[id];
+            auto* hn = reserve + extra_ofs_[id];
+            // Project the inputs of all steps at once
+            math::Gemm(
+                CblasNoTrans, CblasTrans,
+                TN, GH, isz,
+                1.f, xl, wx,
+                0.f, gates, ctx()
+            );
+            const T* h_prev = hx ? hx + id * NH : zeros;
+            const T* c_prev = cx ? cx + id * NH : zeros;
+            for (int k = 0; k < seq_length_; ++k) {
+                auto t = j == 0 ? k : seq_length_ - k - 1;
+                auto* gt = gates + t * N * GH;
+                auto* ht = h + t * NH, *ct = c + t * NH;
+                if (rnn_mode_ == "gru") {
+                    math::Gemm(
+                        CblasNoTrans, CblasTrans,
+                        N, GH, H,
+                        1.f, h_prev, wh,
+                        0.f, rx, ctx()
+                    );
+                    kernel::GRUUnit(
+                        N, H, h_prev,
+                        bx, bh, rx,
+                        gt, hn + t * NH,
+                        ht, ctx()
+                    );
+                } else {
+                    // Accumulate the recurrent projection in-place
+                    math::Gemm(
+                        CblasNoTrans, CblasTrans,
+                        N, GH, H,
+                        1.f, h_prev, wh,
+                        1.f, gt, ctx()
+                    );
+                    if (rnn_mode_ == "lstm") {
+                        kernel::LSTMUnit(
+                            N, H, c_prev,
+                            bx, bh, gt,
+                            ct, ht, ctx()
+                        );
+                    } else {
+                        kernel::RNNUnit(
+                            N, H,
+                            rnn_mode_ == "rnn_relu",
+                            bx, bh, gt,
+                            ht, ctx()
+                        );
+                    }
+                }
+                h_prev = ht; c_prev = ct;
+            }
+            if (hy) math::Copy(NH, h_prev, hy + id * NH, ctx());
+            if (cy) {
+                if (rnn_mode_ == "lstm") {
+                    math::Copy(NH, c_prev, cy + id * NH, ctx());
+                } else {
+                    math::Set(NH, cast::to<T>(0.f), cy + id * NH, ctx());
+                }
+            }
+            // Interleave the directions
+            kernel::Concat(
+                TN, 1, H, DH, j * H,
+                h, yl, ctx()
+            );
+        }
+        xl = yl;
+        if (i < num_layers_ - 1 && mask) {
+            auto* xd = reserve + dropout_ofs_[i];
+            kernel::Dropout(
+                TN * DH,
+                dropout_ratio_,
+                1.f / (1.f - dropout_ratio_),
+                yl, nullptr,
+                mask + i * TN * DH,
+                xd, ctx()
+            );
+            xl = xd;
+        }
+    }
+}
+
+template <class Context>
+void RecurrentOp<Context>::RunOnDevice() {
+    if (XIsType(X(0), float)) {
+        RunImpl<float>();
+    } else {
+        LOG(FATAL) << DTypeString(
+            X(0), { "float32" }
+        );
+    }
+}
+
+template <class Context> template <typename T>
+void RecurrentGradientOp<Context>::RunImpl() {
+    this->Reshape();
+
+    auto xAt = [this](int i) {
+        if (i >= XSize()) return (const T*)NULL;
+        if (X(i).name() == "NULL") return (const T*)NULL;
+        return X(i).template data<T, Context>();
+    };
+
+    auto yAt = [this](int i) {
+        if (i >= YSize()) return (T*)NULL;
+        if (Y(i)->name() == "NULL" && i > 0) return (T*)NULL;
+        return Y(i)->template mutable_data<T, Context>();
+    };
+
+    const int64_t N = batch_size_, H = hidden_size_;
+    const int64_t NH = N * H, TN = seq_length_ * N;
+    const int64_t GH = num_gates_ * H, DH = num_directions_ * H;
+    const bool is_gru = rnn_mode_ == "gru";
+
+    auto* x = xAt(0); auto* w = xAt(1);
+    auto* hx = xAt(2); auto* dy = xAt(5);
+    auto* dhy = xAt(6); auto* dcy = xAt(7);
+    auto* dx = yAt(0); auto* dw = yAt(1);
+    auto* dhx = yAt(2); auto* dcx = yAt(3);
+
+    // Check the reserved buffers
+    auto* reserve_tensor = ws()
+        ->GetTensor(unique_name("reserve"));
+    CHECK_EQ(reserve_size_, reserve_tensor->count());
+    auto* reserve = reserve_tensor
+        ->template data<T, Context>();
+    const uint8_t* mask = nullptr;
+    if (use_dropout_) {
+        mask = ws()
+            ->GetTensor(unique_name("mask"))
+            ->template data<uint8_t, Context>();
+    }
+
+    auto scratch = ws()->template data<T, Context>({
+        TN * GH, is_gru ? TN * GH : 0,
+        TN * H, TN * DH, TN * DH,
+        NH, NH, NH, TN,
+    });
+    auto* dgates = scratch[0];
+    auto* drx = is_gru ? scratch[1] : dgates;
+    auto* dyd = scratch[2];
+    auto* dy_buf = scratch[3], *dx_buf = scratch[4];
+    auto* dh = scratch[5], *dc = scratch[6];
+    auto* zeros = scratch[7], *ones = scratch[8];
+    math::Set(NH, cast::to<T>(0.f), zeros, ctx());
+    math::Set(TN, cast::to<T>(1.f), ones, ctx());
+
+    // CuDNN accumulates the gradient of weights
+    if (dw) math::Set(Y(1)->count(), cast::to<T>(0.f), dw, ctx());
+    if (!dy) {
+        math::Set(TN * DH, cast::to<T>(0.f), dy_buf, ctx());
+        dy = dy_buf;
+    }
+
+    const T* dyl = dy;
+    for (int i = num_layers_ - 1; i >= 0; --i) {
+        auto isz = input_size(i);
+        const T* xl = i == 0 ? x : reserve + (use_dropout_ ?
+            dropout_ofs_[i - 1] : output_ofs_[i - 1]);
+        auto* dxl = i == 0 ? dx : dx_buf;
+        for (int j = 0; j < num_directions_; ++j) {
+            auto id = i * num_directions_ + j;
+            auto* wx = w + matrix_ofs_[id];
+            auto* wh = wx + GH * isz;
+            auto* gates = reserve + gates_ofs_[id];
+            auto* h = reserve + hidden_ofs_[id];
+            auto* c = reserve + cell_ofs_[id];
+            auto* hn = reserve + extra_ofs_[id];
+            const T* h0 = hx ? hx + id * NH : zeros;
+            const T* c0 = xAt(3) ? xAt(3) + id * NH : zeros;
+            // Gather the gradient of this direction
+            kernel::Slice(
+                TN, 1, DH, H, j * H,
+                dyl, dyd, ctx()
+            );
+            if (dhy) math::Copy(NH, dhy + id * NH, dh, ctx());
+            else math::Set(NH, cast::to<T>(0.f), dh, ctx());
+            if (dcy) math::Copy(NH, dcy + id * NH, dc, ctx());
+            else math::Set(NH, cast::to<T>(0.f), dc, ctx());
+            // BPTT in the reversed order of forward
+            for (int k = seq_length_ - 1; k >= 0; --k) {
+                auto t = j == 0 ? k : seq_length_ - k - 1;
+                auto t_prev = j == 0 ? t - 1 : t + 1;
+                const T* h_prev = k > 0 ? h + t_prev * NH : h0;
+                const T* c_prev = k > 0 ? c + t_prev * NH : c0;
+                auto* gt = gates + t * N * GH;
+                auto* dgt = dgates + t * N * GH;
+                auto* drt = drx + t * N * GH;
+                math::Add(NH, dh, dyd + t * NH, dh, ctx());
+                if (rnn_mode_ == "lstm") {
+                    kernel::LSTMUnitGrad(
+                        N, H, c_prev, gt,
+                        c + t * NH, dh,
+                        dc, dgt, ctx()
+                    );
+                } else if (is_gru) {
+                    kernel::GRUUnitGrad(
+                        N, H, h_prev, gt,
+                        hn + t * NH, dh,
+                        dgt, drt, ctx()
+                    );
+                } else {
+                    kernel::RNNUnitGrad(
+                        N, H,
+                        rnn_mode_ == "rnn_relu",
+                        h + t * NH, dh,
+                        dgt, ctx()
+                    );
+                }
+                // dh_{t-1} = dG_{t} * R
+                math::Gemm(
+                    CblasNoTrans, CblasNoTrans,
+                    N, H, GH,
+                    1.f, drt, wh,
+                    is_gru ? 1.f : 0.f, dh, ctx()
+                );
+            }
+            if (dhx) math::Copy(NH, dh, dhx + id * NH, ctx());
+            if (dcx) {
+                if (rnn_mode_ == "lstm") {
+                    math::Copy(NH, dc, dcx + id * NH, ctx());
+                } else {
+                    math::Set(NH, cast::to<T>(0.f), dcx + id * NH, ctx());
+                }
+            }
+            if (dw) {
+                auto* dwx = dw + matrix_ofs_[id];
+                auto* dwh = dwx + GH * isz;
+                auto* dbx = dw + bias_ofs_[id];
+                auto* dbh = dbx + GH;
+                // Reduce the gradient of all steps at once
+                math::Gemm(
+                    CblasTrans, CblasNoTrans,
+                    GH, isz, TN,
+                    1.f, dgates, xl,
+                    0.f, dwx, ctx()
+                );
+                if (seq_length_ > 1) {
+                    // Pair the step with its previous hidden
+                    auto ofs = (j == 0 ? 1 : 0) * N;
+                    math::Gemm(
+                        CblasTrans, CblasNoTrans,
+                        GH, H, TN - N,
+                        1.f, drx + ofs * GH,
+                        h + (N - ofs) * H,
+                        0.f, dwh, ctx()
+                    );
+                }
+                if (hx) {
+                    auto t0 = j == 0 ? 0 : seq_length_ - 1;
+                    math::Gemm(
+                        CblasTrans, CblasNoTrans,
+                        GH, H, N,
+                        1.f, drx + t0 * N * GH, h0,
+                        1.f, dwh, ctx()
+                    );
+                }
+                math::Gemv(
+                    CblasTrans, TN, GH,
+                    1.f, dgates, ones,
+                    0.f, dbx, ctx()
+                );
+                math::Gemv(
+                    CblasTrans, TN, GH,
+                    1.f, drx, ones,
+                    0.f, dbh, ctx()
+                );
+            }
+            // Sum the gradient of inputs from both directions
+            math::Gemm(
+                CblasNoTrans, CblasNoTrans,
+                TN, isz, GH,
+                1.f, dgates, wx,
+                j == 0 ? 0.f : 1.f, dxl, ctx()
+            );
+        }
+        if (i > 0) {
+            if (mask) {
+                kernel::ApplyMask(
+                    TN * DH,
+                    1.f / (1.f - dropout_ratio_),
+                    dx_buf, mask + (i - 1) * TN * DH,
+                    dx_buf, ctx()
+                );
+            }
+            dyl = dx_buf;
+            std::swap(dx_buf, dy_buf);
+        }
+    }
+}
+
+template <class Context>
+void RecurrentGradientOp<Context>::RunOnDevice() {
+    Y(0)->ReshapeLike(X(0));  // dX
+    Y(1)->ReshapeLike(X(1));  // dW
+    Y(2)->ReshapeLike(X(2));  // dHx
+    Y(3)->ReshapeLike(X(3));  // dCx
+
+    if (XIsType(X(0), float)) {
+        RunImpl<float>();
+    } else {
+        LOG(FATAL) << DTypeString(
+            X(0), { "float32" }
+        );
+    }
+}
+
+/*!
+ * The CPU engine serves the CUDA device too,
+ * unless the CuDNN engine is available.
+ */
 
-DEPLOY_CPU(RecurrentGradient);
 #ifdef WITH_CUDA
-DEPLOY_CUDA(RecurrentGradient);
+DEPLOY_CPU_CUDA(Recurrent);
+DEPLOY_CPU_CUDA(RecurrentGradient);
+#else
+DEPLOY_CPU(Recurrent);
+DEPLOY_CPU(RecurrentGradient);
 #endif
 
 OPERATOR_SCHEMA(Recurrent)
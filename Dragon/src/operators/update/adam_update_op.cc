@@ -4,6 +4,16 @@
 
 namespace dragon {
 
+template <class Context>
+void AdamUpdateOp<Context>::ComputeParams() {
+    beta1_ = param("beta1");
+    beta2_ = param("beta2");
+    eps_   = param("eps");
+    float coef = sqrt(1. - pow(beta2_, ++t_))
+                   / (1. - pow(beta1_, t_));
+    lr_ = param("base_lr") * coef * lr_mult();
+}
+
 template <class Context>
 void AdamUpdateOp<Context>::Compute(Tensor* dX) {
     auto* m = ws()
@@ -18,13 +28,6 @@ void AdamUpdateOp<Context>::Compute(Tensor* dX) {
 
     auto* dx = dX->template mutable_data<float, Context>();
 
-    beta1_ = param("beta1");
-    beta2_ = param("beta2");
-    eps_   = param("eps");
-    float coef = sqrt(1. - pow(beta2_, ++t_))
-                   / (1. - pow(beta1_, t_));
-    lr_ = param("base_lr") * coef * lr_mult();
-
     kernel::AdamUpdate(
         dX->count(),
         lr_, beta1_,
@@ -39,10 +42,10 @@ DEPLOY_CUDA(AdamUpdate);
 #endif
 
 OPERATOR_SCHEMA(AdamUpdate)
-     /* dX */
-    .NumInputs(1)
-     /* X */
-    .NumOutputs(1);
+     /* dX, ... */
+    .NumInputs(1, INT_MAX)
+     /* X, ... */
+    .NumOutputs(1, INT_MAX);
 
 NO_GRADIENT(AdamUpdate);
 
@@ -138,20 +138,90 @@ void CollectiveUpdateOp<Context>::NCCLBcast(
 
 #endif
 
+template <class Context> template <typename T>
+void CollectiveUpdateOp<Context>::AllReduce(
+    Tensor*                 tensor) {
+    if (mode_ == "MPI_ALLREDUCE") {
+        MPIAllReduce<T>(tensor);
+    }
+#ifdef WITH_NCCL
+    else if (mode_ == "NCCL_ALLREDUCE") {
+        NCCLAllReduce<T>(tensor,
+            TypeMeta::Id<T>() == TypeMeta::Id<float16>()
+                ? ncclHalf : ncclFloat);
+    }
+#endif
+    else {
+        LOG(FATAL) << "Unknown Mode: " << mode_;
+    }
+}
+
+template <class Context> template <typename T>
+void CollectiveUpdateOp<Context>::AllReduceBucket(
+    const vec32_t&          indices) {
+    if (indices.size() == 1) {
+        AllReduce<T>(&X(indices[0]));
+        return;
+    }
+
+    // Pack the grads into a flat buffer
+    int64_t count = 0;
+    for (auto i : indices) count += X(i).count();
+    auto* buffer = ws()
+        ->CreateTensor(unique_name("bucket"))
+        ->Reshape({ count });
+    auto* b = buffer->template mutable_data<T, Context>();
+    for (auto i : indices) {
+        math::Copy(
+            X(i).count(),
+            X(i).template data<T, Context>(),
+            b, ctx()
+        ); b += X(i).count();
+    }
+
+    // Reduce the bucket with a single call
+    AllReduce<T>(buffer);
+
+    // Unpack the reduced grads
+    auto* rb = buffer->template data<T, Context>();
+    for (auto i : indices) {
+        math::Copy(
+            X(i).count(), rb,
+            X(i).template mutable_data<T, Context>(),
+            ctx()
+        ); rb += X(i).count();
+    }
+}
+
+template <class Context> template <typename T>
+void CollectiveUpdateOp<Context>::RunAllReduce() {
+    // Fuse the consecutive grads into buckets,
+    // the legacy per-tensor reduction if no size is given
+    vec32_t indices; int64_t nbytes = 0;
+    for (int i = 0; i < XSize(); i++) {
+        if (!XIsType(X(i), T)) continue;
+        indices.push_back(i); nbytes += X(i).nbytes();
+        if (nbytes >= bucket_size_) {
+            AllReduceBucket<T>(indices);
+            indices.clear(); nbytes = 0;
+        }
+    }
+    if (!indices.empty()) AllReduceBucket<T>(indices);
+}
+
 template <class Context>
 void CollectiveUpdateOp<Context>::RunOnDevice() {
-    if (mode_ == "MPI_ALLREDUCE") {
+    if (str::find(mode_, "ALLREDUCE")) {
         for (int i = 0; i < XSize(); i++) {
-            if (XIsType(X(i), float)) {
-                MPIAllReduce<float>(&X(i));
-            } else if (XIsType(X(i), float16)) {
-                MPIAllReduce<float16>(&X(i));
-            } else {
+            if (!XIsType(X(i), float) &&
+                !XIsType(X(i), float16)) {
                 LOG(FATAL) << DTypeString(X(i),
                     { "float32", "float16" }
                 );
             }
         }
+        RunAllReduce<float>();
+        RunAllReduce<float16>();
     } else if (mode_ == "MPI_BCAST") {
         for (int i = 0; i < XSize(); i++) {
             if (XIsType(X(i), float)) {
@@ -166,19 +236,7 @@ void CollectiveUpdateOp<Context>::RunOnDevice() {
         }
     }
 #ifdef WITH_NCCL
-    else if (mode_ == "NCCL_ALLREDUCE") {
-        for (int i = 0; i < XSize(); i++) {
-            if (XIsType(X(i), float)) {
-                NCCLAllReduce<float>(&X(i), ncclFloat);
-            } else if (XIsType(X(i), float16)) {
-                NCCLAllReduce<float16>(&X(i), ncclHalf);
-            } else {
-                LOG(FATAL) << DTypeString(X(i),
-                    { "float32", "float16" }
-                );
-            }
-        }
-    } else if (mode_ == "NCCL_BCAST") {
+    else if (mode_ == "NCCL_BCAST") {
         for (int i = 0; i < XSize(); i++) {
             if (XIsType(X(i), float)) {
                 NCCLBcast<float>(&X(i), ncclFloat);
@@ -5,6 +5,12 @@
 
 namespace dragon {
 
+template <class Context>
+void NesterovUpdateOp<Context>::ComputeParams() {
+    momentum_ = param("momentum");
+    lr_ = param("base_lr") * lr_mult();
+}
+
 template <class Context>
 void NesterovUpdateOp<Context>::Compute(Tensor* dX) {
     auto* h = ws()
@@ -14,9 +20,6 @@ void NesterovUpdateOp<Context>::Compute(Tensor* dX) {
 
     auto* dx = dX->template mutable_data<float, Context>();
 
-    momentum_ = param("momentum");
-    lr_ = param("base_lr") * lr_mult();
-
     kernel::NesterovUpdate(
         dX->count(),
         lr_, momentum_,
@@ -30,10 +33,10 @@ DEPLOY_CUDA(NesterovUpdate);
 #endif
 
 OPERATOR_SCHEMA(NesterovUpdate)
-     /* dX */
-    .NumInputs(1)
-     /* X */
-    .NumOutputs(1);
+     /* dX, ... */
+    .NumInputs(1, INT_MAX)
+     /* X, ... */
+    .NumOutputs(1, INT_MAX);
 
 NO_GRADIENT(NesterovUpdate);
 
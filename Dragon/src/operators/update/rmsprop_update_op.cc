@@ -4,6 +4,12 @@
 
 namespace dragon {
 
+template <class Context>
+void RMSPropUpdateOp<Context>::ComputeParams() {
+    lr_ = param("base_lr") * lr_mult();
+    decay_ = param("decay"), eps_ = param("eps");
+}
+
 template <class Context>
 void RMSPropUpdateOp<Context>::Compute(Tensor* dX) {
     auto* h = ws()
@@ -13,9 +19,6 @@ void RMSPropUpdateOp<Context>::Compute(Tensor* dX) {
 
     auto* dx = dX->template mutable_data<float, Context>();
 
-    lr_ = param("base_lr") * lr_mult();
-    decay_ = param("decay"), eps_ = param("eps");
-
     kernel::RMSPropUpdate(
         dX->count(),
         lr_, decay_, eps_,
@@ -29,10 +32,10 @@ DEPLOY_CUDA(RMSPropUpdate);
 #endif
 
 OPERATOR_SCHEMA(RMSPropUpdate)
-     /* dX */
-    .NumInputs(1)
-     /* X */
-    .NumOutputs(1);
+     /* dX, ... */
+    .NumInputs(1, INT_MAX)
+     /* X, ... */
+    .NumOutputs(1, INT_MAX);
 
 NO_GRADIENT(RMSPropUpdate);
 
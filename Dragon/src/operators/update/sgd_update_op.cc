@@ -5,6 +5,16 @@
 
 namespace dragon {
 
+template <class Context>
+void SGDUpdateOp<Context>::ComputeParams() {
+    momentum_ = param("momentum");
+    lr_ = param("base_lr") * lr_mult();
+
+    // Momentum Correction, See arXiv:1706.02677
+    if (last_lr_ > 0) correction_ = lr_ / last_lr_;
+    last_lr_ = lr_;  // Record the last value
+}
+
 template <class Context>
 void SGDUpdateOp<Context>::Compute(Tensor* dX) {
     auto* h = ws()
@@ -13,13 +23,6 @@ void SGDUpdateOp<Context>::Compute(Tensor* dX) {
         ->template mutable_data<float, Context>();
 
     auto* dx = dX->template mutable_data<float, Context>();
-    
-    momentum_ = param("momentum");
-    lr_ = param("base_lr") * lr_mult();
-
-    // Momentum Correction, See arXiv:1706.02677
-    if (last_lr_ > 0) correction_ = lr_ / last_lr_;
-    last_lr_ = lr_;  // Record the last value
 
     kernel::SGDUpdate(
         dX->count(),
@@ -34,10 +37,10 @@ DEPLOY_CUDA(SGDUpdate);
 #endif
 
 OPERATOR_SCHEMA(SGDUpdate)
-     /* dX */
-    .NumInputs(1)
-     /* X */
-    .NumOutputs(1);
+     /* dX, ... */
+    .NumInputs(1, INT_MAX)
+     /* X, ... */
+    .NumOutputs(1, INT_MAX);
 
 NO_GRADIENT(SGDUpdate);
 
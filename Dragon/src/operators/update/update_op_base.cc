@@ -66,35 +66,47 @@ void UpdateOpBase<Context>::Apply(Tensor* dX, Tensor* X) {
 
 template <class Context>
 void UpdateOpBase<Context>::RunOnDevice() {
-    // Skip empty param or grad
-    if (X(0).count() == 0 || Y(0)->count() == 0) return;
+    CHECK_EQ(XSize(), YSize())
+        << "\nExcepted the same number of params and grads."
+        << "\nGot " << YSize() << " and " << XSize() << ".";
 
-    CHECK(X(0).dims() == Y(0)->dims())
-        << "\nParam and Grad should have same dimensions."
-        << "\nGot" << Y(0)->DimString()
-        << " and " << X(0).DimString();
+    // Apply to all params of the group in one run,
+    // the hyper-parameters are shared by the group
+    ComputeParams();
 
-    if (XIsType(X(0), float)) {
-        Process<float>(&X(0), Y(0));
-        Compute(&X(0));
-        Apply<float>(&X(0), Y(0));
-    } else if (XIsType(X(0), float16)) {
-        auto* MdX = ws()
-            ->CreateTensor(X(0).name() + "/master")
-            ->ReshapeLike(X(0));
-        kernel::TypeA2B(
-            X(0).count(),
-            X(0).template data<float16, Context>(),
-            MdX->template mutable_data<float, Context>(),
-            ctx()
-        );
-        Process<float>(MdX, Y(0));
-        Compute(MdX);
-        Apply<float>(MdX, Y(0));
-    } else {
-        LOG(FATAL) << DTypeString(X(0),
-            { "float32", "float16" }
-        );
+    for (index_ = 0; index_ < XSize(); ++index_) {
+        auto* dX = &X(index_); auto* Xp = Y(index_);
+
+        // Skip empty param or grad
+        if (dX->count() == 0 || Xp->count() == 0) continue;
+
+        CHECK(dX->dims() == Xp->dims())
+            << "\nParam and Grad should have same dimensions."
+            << "\nGot" << Xp->DimString()
+            << " and " << dX->DimString();
+
+        if (XIsType((*dX), float)) {
+            Process<float>(dX, Xp);
+            Compute(dX);
+            Apply<float>(dX, Xp);
+        } else if (XIsType((*dX), float16)) {
+            auto* MdX = ws()
+                ->CreateTensor(dX->name() + "/master")
+                ->ReshapeLike(*dX);
+            kernel::TypeA2B(
+                dX->count(),
+                dX->template data<float16, Context>(),
+                MdX->template mutable_data<float, Context>(),
+                ctx()
+            );
+            Process<float>(MdX, Xp);
+            Compute(MdX);
+            Apply<float>(MdX, Xp);
+        } else {
+            LOG(FATAL) << DTypeString((*dX),
+                { "float32", "float16" }
+            );
+        }
     }
 }
 